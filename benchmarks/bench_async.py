@@ -0,0 +1,117 @@
+"""
+Messages parsed from many asyncio connections at once.
+
+    python benchmarks/bench_async.py
+
+`CONNECTIONS` in-memory connections each deliver `MESSAGES` messages in
+chunks of `CHUNK` bytes, parsed with `AsyncReader.iterate`. Parsing the
+same bytes from a `BufferReader` is the baseline. Then a single
+connection delivers a `RepeatEOS` of `RECORDS` records, parsed as a
+whole with `parse_async`, which must not be parsed again per chunk.
+"""
+
+import asyncio
+import time
+from typing import Tuple
+
+from duckparse import section, stream
+from duckparse.aio import AsyncReader
+from duckparse.reader import BufferReader
+from duckparse.btypes import U8, U16, U32, Byte, RepeatEOS, Var
+
+CONNECTIONS = 1_000
+MESSAGES = 100
+CHUNK = 1_400
+RECORDS = 200_000
+
+
+@section
+class Message:
+    kind: U8
+    sequence: U32
+    size: U16
+    body: Byte[Var("size")]
+
+
+DATA = b"".join(
+    b"\x01" + index.to_bytes(4, "little") + b"\x20\x00" + bytes(32)
+    for index in range(MESSAGES)
+)
+
+
+@section
+class Record:
+    first: U32
+    second: U32
+
+
+@stream
+class Capture:
+    records: RepeatEOS[Record]
+
+
+CAPTURE = bytes(8 * RECORDS)
+
+
+def connect(data: bytes) -> Tuple[asyncio.StreamReader, asyncio.Task]:
+    incoming = asyncio.StreamReader()
+
+    async def send() -> None:
+        for start in range(0, len(data), CHUNK):
+            incoming.feed_data(data[start : start + CHUNK])
+            await asyncio.sleep(0)
+        incoming.feed_eof()
+
+    return incoming, asyncio.create_task(send())
+
+
+async def connection() -> int:
+    incoming, sender = connect(DATA)
+    count = 0
+    async for _ in AsyncReader(incoming).iterate(Message):
+        count += 1
+    await sender
+    return count
+
+
+async def capture() -> int:
+    incoming, sender = connect(CAPTURE)
+    result = await Capture.parse_async(incoming)
+    await sender
+    return len(result.records)
+
+
+async def connections() -> int:
+    counts = await asyncio.gather(
+        *(connection() for _ in range(CONNECTIONS))
+    )
+    return sum(counts)
+
+
+def main() -> None:
+    start = time.perf_counter()
+    count = asyncio.run(connections())
+    seconds = time.perf_counter() - start
+    print(f"async  {seconds * 1e6 / count:6.2f} us per message")
+
+    start = time.perf_counter()
+    for _ in range(CONNECTIONS):
+        reader = BufferReader(DATA)
+        while not reader.at_eof():
+            Message(reader)
+    seconds = time.perf_counter() - start
+    print(f"buffer {seconds * 1e6 / count:6.2f} us per message")
+
+    start = time.perf_counter()
+    count = asyncio.run(capture())
+    seconds = time.perf_counter() - start
+    print(f"capture async  {seconds:6.2f} s for {count} records")
+
+    start = time.perf_counter()
+    Capture(BufferReader(CAPTURE))
+    seconds = time.perf_counter() - start
+    print(f"capture buffer {seconds:6.2f} s for {RECORDS} records")
+
+
+if __name__ == "__main__":
+    main()
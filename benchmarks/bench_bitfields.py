@@ -0,0 +1,52 @@
+"""
+A packet header made of bit fields.
+
+    python benchmarks/bench_bitfields.py
+
+Parses `COUNT` headers of twelve bit fields and a byte back to back
+from one reader.
+"""
+
+import timeit
+
+from duckparse import section
+from duckparse.reader import BufferReader
+from duckparse.btypes import U8, Bits
+
+COUNT = 200_000
+
+
+@section
+class Header:
+    version: Bits[4]
+    ihl: Bits[4]
+    dscp: Bits[6]
+    ecn: Bits[2]
+    reserved: Bits[1]
+    dont_fragment: Bits[1]
+    more_fragments: Bits[1]
+    fragment_offset: Bits[13]
+    priority: Bits[3]
+    urgent: Bits[1]
+    ack: Bits[1]
+    push: Bits[3]
+    ttl: U8
+
+
+def parse(reader: BufferReader) -> None:
+    reader.seek(0)
+    for _ in range(COUNT):
+        Header(reader)
+
+
+def main() -> None:
+    # the per-field bit reader runs a byte ahead of aligned runs
+    reader = BufferReader(bytes(7 * COUNT))
+    seconds = min(
+        timeit.repeat(lambda: parse(reader), number=1, repeat=5)
+    )
+    print(f"{seconds * 1e9 / COUNT:6.1f} ns per header")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""
+Parse time over an unbuffered file, with and without read-ahead.
+
+    python benchmarks/bench_buffered.py
+
+`buffer_size=1` makes the reader ask the stream for every field, which
+is what it did before it had a buffer.
+"""
+
+import os
+import tempfile
+import timeit
+
+from duckparse import stream, section
+from duckparse.btypes import U8, U32, String, RepeatEOS
+from duckparse.reader import Reader
+
+COUNT = 100_000
+
+
+@section
+class Entry:
+    kind: U8
+    size: U32
+    name: String[-1, "ascii"]
+
+
+@stream
+class Entries:
+    entries: RepeatEOS[Entry]
+
+
+def main() -> None:
+    data = b"\x01\x10\x00\x00\x00name\x00" * COUNT
+    with tempfile.NamedTemporaryFile(delete=False) as file:
+        file.write(data)
+    try:
+        for buffer_size in (1, 64 * 1024):
+
+            def parse() -> None:
+                with open(file.name, "rb", buffering=0) as raw:
+                    Entries(Reader(raw, buffer_size=buffer_size))
+
+            seconds = min(timeit.repeat(parse, number=1, repeat=3))
+            print(
+                f"buffer_size={buffer_size:<8} "
+                f"{seconds * 1e9 / COUNT:10.1f} ns/entry"
+            )
+    finally:
+        os.unlink(file.name)
+
+
+if __name__ == "__main__":
+    main()
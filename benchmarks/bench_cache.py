@@ -0,0 +1,92 @@
+"""
+Import time of a module with 200 sections, with and without the
+generated-code cache.
+
+    python benchmarks/bench_cache.py
+
+Each import runs in a fresh interpreter, the time is for the import of
+the formats module alone.
+"""
+
+import os
+import subprocess
+import sys
+import tempfile
+
+SECTIONS = 200
+
+FIELD_KINDS = (
+    "U8",
+    "U16",
+    "U32",
+    'Byte[Var("size")]',
+    'String[-1, "utf-8"]',
+    'RepeatN[U16, "range(self.size)"]',
+)
+
+MEASURE = """
+import time
+start = time.perf_counter()
+import formats
+print(time.perf_counter() - start)
+"""
+
+
+def write_formats(directory: str) -> None:
+    lines = [
+        "from duckparse import section",
+        "from duckparse.btypes import U8, U16, U32, Byte, String, Var,"
+        " RepeatN",
+    ]
+    for index in range(SECTIONS):
+        lines += ["", "", "@section", f"class Section{index}:"]
+        lines.append("    size: U8")
+        for field in range(index % 8 + 1):
+            kind = FIELD_KINDS[(index + field) % len(FIELD_KINDS)]
+            lines.append(f"    field_{field}: {kind}")
+    with open(os.path.join(directory, "formats.py"), "w") as file:
+        file.write("\n".join(lines) + "\n")
+
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def environ(directory: str, cache_dir: str) -> dict:
+    return dict(
+        os.environ,
+        PYTHONPATH=os.pathsep.join((directory, ROOT)),
+        DUCKPARSE_CACHE_DIR=cache_dir,
+    )
+
+
+def measure(directory: str, cache_dir: str) -> float:
+    return min(
+        float(
+            subprocess.run(
+                (sys.executable, "-c", MEASURE),
+                env=environ(directory, cache_dir),
+                check=True,
+                capture_output=True,
+                text=True,
+            ).stdout
+        )
+        for _ in range(5)
+    )
+
+
+def main() -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        write_formats(directory)
+        cache_dir = os.path.join(directory, "cache")
+        print(f"no cache   {measure(directory, '') * 1e3:8.1f} ms")
+        subprocess.run(
+            (sys.executable, "-m", "duckparse.warm", "formats"),
+            env=environ(directory, cache_dir),
+            check=True,
+            capture_output=True,
+        )
+        print(f"warm cache {measure(directory, cache_dir) * 1e3:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""
+Import time of the 200-section module from bench_cache.py, decorated
+and exported with `python -m duckparse.compile`.
+
+    python benchmarks/bench_compile.py
+"""
+
+import os
+import subprocess
+import sys
+import tempfile
+
+from bench_cache import environ, write_formats
+
+MEASURE = """
+import duckparse.btypes, duckparse.utils, time
+start = time.perf_counter()
+import {module}
+print(time.perf_counter() - start)
+"""
+
+
+def measure(directory: str, module: str) -> float:
+    return min(
+        float(
+            subprocess.run(
+                (sys.executable, "-c", MEASURE.format(module=module)),
+                env=environ(directory, ""),
+                check=True,
+                capture_output=True,
+                text=True,
+            ).stdout
+        )
+        for _ in range(5)
+    )
+
+
+def main() -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        write_formats(directory)
+        subprocess.run(
+            (
+                sys.executable,
+                "-m",
+                "duckparse.compile",
+                *(f"formats:Section{index}" for index in range(200)),
+                "-o",
+                os.path.join(directory, "formats_compiled.py"),
+            ),
+            env=environ(directory, ""),
+            check=True,
+        )
+        # both modules import from bytecode, as an installed package would
+        subprocess.run(
+            (sys.executable, "-m", "compileall", "-q", directory),
+            check=True,
+        )
+        for module in ("formats", "formats_compiled"):
+            print(
+                f"{module:<17} {measure(directory, module) * 1e3:8.1f} ms"
+            )
+
+
+if __name__ == "__main__":
+    main()
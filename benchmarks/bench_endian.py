@@ -0,0 +1,69 @@
+"""
+Network order fields in a little-endian reader.
+
+    python benchmarks/bench_endian.py
+
+Parses `COUNT` UDP-like headers back to back from one reader, with a
+datakind per network order field, with `U16be` and with
+`@section(endian="big")`.
+"""
+
+import timeit
+
+from duckparse import section, datakind
+from duckparse.reader import BufferReader
+from duckparse.btypes import U16, U16be
+from duckparse.c_types import BigEndian
+
+COUNT = 200_000
+
+
+@datakind
+class NetU16:
+    def __processor__(self, reader: BufferReader) -> int:
+        return BigEndian.u16.unpack(reader.read_bytes(2))[0]
+
+
+@section
+class Wrapped:
+    source: NetU16
+    destination: NetU16
+    length: NetU16
+    checksum: NetU16
+
+
+@section
+class Fixed:
+    source: U16be
+    destination: U16be
+    length: U16be
+    checksum: U16be
+
+
+@section(endian="big")
+class Network:
+    source: U16
+    destination: U16
+    length: U16
+    checksum: U16
+
+
+def parse(cls: type, reader: BufferReader) -> None:
+    reader.seek(0)
+    for _ in range(COUNT):
+        cls(reader)
+
+
+def main() -> None:
+    reader = BufferReader(bytes(8 * COUNT))
+    for cls in (Wrapped, Fixed, Network):
+        seconds = min(
+            timeit.repeat(lambda: parse(cls, reader), number=1, repeat=5)
+        )
+        print(
+            f"{cls.__name__:8} {seconds * 1e9 / COUNT:6.1f} ns per header"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""
+Per-element cost of RepeatEOS on a 1M-element stream.
+
+    python benchmarks/bench_eos.py
+
+`eos check` is the cost of the end-of-stream check alone, `parse` is a
+whole RepeatEOS of one-byte sections.
+"""
+
+import timeit
+from io import BytesIO
+
+from duckparse import stream, section
+from duckparse.btypes import U8, RepeatEOS
+from duckparse.reader import Reader, BufferReader
+from duckparse.utils import generic_repeat, until_eof, whilor
+
+COUNT = 1_000_000
+DATA = bytes(range(256)) * (COUNT // 256) + bytes(COUNT % 256)
+
+
+@section
+class Item:
+    value: U8
+
+
+@stream
+class Items:
+    items: RepeatEOS[Item]
+
+
+def check_none(reader: Reader) -> None:
+    # the body alone, subtracted from the other two
+    generic_repeat(lambda: reader._read(1), range(COUNT))
+
+
+def check_tell(reader: Reader) -> None:
+    # what RepeatEOS used to generate
+    generic_repeat(
+        lambda: reader._read(1),
+        whilor(lambda: reader.io.tell() != reader.size),
+    )
+
+
+def check_until_eof(reader: Reader) -> None:
+    generic_repeat(lambda: reader._read(1), until_eof(reader))
+
+
+def report(name: str, seconds: float) -> None:
+    print(f"{name:<28} {seconds * 1e9 / COUNT:8.1f} ns/element")
+
+
+def main() -> None:
+    baseline = None
+    for check in (check_none, check_tell, check_until_eof):
+        seconds = min(
+            timeit.repeat(
+                lambda: check(Reader(BytesIO(DATA))), number=1, repeat=5
+            )
+        )
+        if baseline is None:
+            baseline = seconds
+        else:
+            report(f"eos check {check.__name__[6:]}", seconds - baseline)
+
+    for name, source in (
+        ("parse BytesIO", lambda: BytesIO(DATA)),
+        ("parse BufferReader", lambda: BufferReader(DATA)),
+    ):
+        report(
+            name,
+            min(
+                timeit.repeat(lambda: Items(source()), number=1, repeat=3)
+            ),
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""
+`IncrementalParser` fed in chunks of different sizes.
+
+    python benchmarks/bench_incremental.py
+
+`COUNT` messages are fed `CHUNKS` bytes at a time, parsing the same
+bytes from a `BufferReader` is the baseline.
+"""
+
+import time
+
+from duckparse import section
+from duckparse.incremental import IncrementalParser
+from duckparse.reader import BufferReader
+from duckparse.btypes import U8, U16, U32, Byte, Var
+
+COUNT = 100_000
+CHUNKS = (16, 1_400, 64 * 1024)
+
+
+@section
+class Message:
+    kind: U8
+    sequence: U32
+    size: U16
+    body: Byte[Var("size")]
+
+
+DATA = b"".join(
+    b"\x01" + index.to_bytes(4, "little") + b"\x20\x00" + bytes(32)
+    for index in range(COUNT)
+)
+
+
+def main() -> None:
+    for chunk in CHUNKS:
+        start = time.perf_counter()
+        parser = IncrementalParser(Message)
+        count = 0
+        for position in range(0, len(DATA), chunk):
+            count += len(parser.feed(DATA[position : position + chunk]))
+        count += len(parser.close())
+        seconds = time.perf_counter() - start
+        assert count == COUNT
+        print(
+            f"chunk {chunk:>6} {seconds * 1e6 / COUNT:6.2f} us per message"
+        )
+
+    start = time.perf_counter()
+    reader = BufferReader(DATA)
+    while not reader.at_eof():
+        Message(reader)
+    seconds = time.perf_counter() - start
+    print(f"buffer       {seconds * 1e6 / COUNT:6.2f} us per message")
+
+
+if __name__ == "__main__":
+    main()
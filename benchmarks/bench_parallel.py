@@ -0,0 +1,96 @@
+"""
+`parse_at` and `parse_chunked` with one worker against a process pool.
+
+    python benchmarks/bench_parallel.py [workers]
+
+Writes `COUNT` zip local file records to a temporary file and parses
+all of them, from their offsets and from byte ranges, returning only
+`(name, crc32)`. The sequential `RepeatEOS` walk is the baseline.
+"""
+
+import os
+import sys
+import tempfile
+import time
+from operator import attrgetter
+
+from duckparse import section, stream
+from duckparse.parallel import parse_at, parse_chunked
+from duckparse.reader import BufferReader
+from duckparse.btypes import U16, U32, Byte, String, Contents, Var
+from duckparse.btypes import RepeatEOS
+
+COUNT = 200_000
+
+
+@section
+class LocalFile:
+    magic: Contents[b"PK\x03\x04"]
+    version: U16
+    flags: U16
+    compression_method: U16
+    file_mod_time: U16
+    file_mod_date: U16
+    crc32: U32
+    len_body_compressed: U32
+    len_body_uncompressed: U32
+    len_file_name: U16
+    len_extra: U16
+    file_name: String[Var("len_file_name"), "utf-8"]
+    body: Byte[Var("len_body_compressed")]
+
+
+@stream
+class Archive:
+    files: RepeatEOS[LocalFile]
+
+
+def record(index: int) -> bytes:
+    name = f"dir/file{index}.txt".encode()
+    body = bytes(64)
+    return (
+        b"PK\x03\x04"
+        + bytes(10)
+        + index.to_bytes(4, "little")
+        + len(body).to_bytes(4, "little") * 2
+        + len(name).to_bytes(2, "little")
+        + bytes(2)
+        + name
+        + body
+    )
+
+
+def main() -> None:
+    workers = int(sys.argv[1]) if len(sys.argv) > 1 else os.cpu_count()
+    offsets, chunks, size = [], [], 0
+    for index in range(COUNT):
+        offsets.append(size)
+        chunks.append(record(index))
+        size += len(chunks[-1])
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "records.zip")
+        with open(path, "wb") as file:
+            file.write(b"".join(chunks))
+
+        start = time.perf_counter()
+        Archive(BufferReader.from_path(path))
+        print(f"RepeatEOS         {time.perf_counter() - start:6.2f} s")
+
+        transform = attrgetter("file_name", "crc32")
+        for count in sorted({1, workers}):
+            start = time.perf_counter()
+            parse_at(LocalFile, path, offsets, count, transform=transform)
+            seconds = time.perf_counter() - start
+            print(f"parse_at      {count:>3} {seconds:6.2f} s")
+
+            start = time.perf_counter()
+            parse_chunked(
+                LocalFile, path, b"PK\x03\x04", count, transform=transform
+            )
+            seconds = time.perf_counter() - start
+            print(f"parse_chunked {count:>3} {seconds:6.2f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""
+Per-field cost of each primitive kind, one field per section.
+
+    python benchmarks/bench_primitives.py
+
+Every section is parsed `COUNT` times back to back from one reader, so
+the numbers include the generated `__init__` but not reader setup.
+"""
+
+import timeit
+from io import BytesIO
+
+from duckparse import section
+from duckparse import btypes
+from duckparse.reader import Reader, BufferReader
+
+COUNT = 200_000
+PRIMITIVES = ("U8", "I8", "U16", "I16", "U32", "I32")
+PRIMITIVES += ("U64", "I64", "F32", "F64")
+
+
+def single_field(name: str) -> type:
+    return section(
+        type(
+            name,
+            (),
+            {"__annotations__": {"value": getattr(btypes, name)}},
+        )
+    )
+
+
+def parse(cls: type, reader: Reader) -> None:
+    reader.seek(0)
+    for _ in range(COUNT):
+        cls(reader)
+
+
+def main() -> None:
+    data = bytes(8 * COUNT)
+    for name in PRIMITIVES:
+        cls = single_field(name)
+        timings = [
+            min(
+                timeit.repeat(
+                    lambda: parse(cls, reader), number=1, repeat=5
+                )
+            )
+            for reader in (BufferReader(data), Reader(BytesIO(data)))
+        ]
+        print(
+            f"{name:<4}"
+            + "".join(
+                f" {source} {seconds * 1e9 / COUNT:6.1f} ns"
+                for source, seconds in zip(("buffer", "stream"), timings)
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
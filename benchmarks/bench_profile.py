@@ -0,0 +1,53 @@
+"""
+What profiling costs.
+
+    python benchmarks/bench_profile.py
+
+Parses `COUNT` records of a fused run and a variable-size field back
+to back, plainly and with `duckparse.profile`, and prints the slowest
+fields of the profiled parse.
+"""
+
+import timeit
+
+from duckparse import profile, section, stream
+from duckparse.reader import BufferReader
+from duckparse.btypes import U16, U32, Byte, RepeatN, Var
+
+COUNT = 50_000
+
+
+@section
+class Record:
+    kind: U16
+    size: U16
+    stamp: U32
+    payload: Byte[Var("size")]
+
+
+@stream
+class Records:
+    records: RepeatN[Record, f"range({COUNT})"]
+
+
+def main() -> None:
+    data = b"\x01\x00\x04\x00\x00\x00\x00\x00abcd" * COUNT
+    plain = min(
+        timeit.repeat(
+            lambda: Records(BufferReader(data)), number=1, repeat=5
+        )
+    )
+    profiled = min(
+        timeit.repeat(
+            lambda: profile(Records, BufferReader(data)),
+            number=1,
+            repeat=5,
+        )
+    )
+    print(f"plain    {plain * 1e9 / COUNT:7.1f} ns per record")
+    print(f"profiled {profiled * 1e9 / COUNT:7.1f} ns per record")
+    profile(Records, BufferReader(data)).print_report(limit=5)
+
+
+if __name__ == "__main__":
+    main()
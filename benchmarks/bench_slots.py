@@ -0,0 +1,55 @@
+"""
+Memory held by parsed records, with and without `slots=True`.
+
+    python benchmarks/bench_slots.py
+
+Parses `COUNT` central-directory-like entries into a list and reports
+what tracemalloc sees allocated for them.
+"""
+
+import tracemalloc
+
+from duckparse import section
+from duckparse.reader import BufferReader
+from duckparse.btypes import U16, U32, Byte, Var
+
+COUNT = 100_000
+
+
+def entry(slots: bool) -> type:
+    @section(slots=slots)
+    class Entry:
+        version: U16
+        flags: U16
+        compression: U16
+        crc32: U32
+        compressed_size: U32
+        size: U32
+        len_name: U16
+        name: Byte[Var("len_name")]
+
+    return Entry
+
+
+def measure(cls: type, data: bytes) -> int:
+    reader = BufferReader(data)
+    tracemalloc.start()
+    entries = [cls(reader) for _ in range(COUNT)]
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del entries
+    return size
+
+
+def main() -> None:
+    data = (bytes(18) + b"\x04\x00name") * COUNT
+    for slots in (False, True):
+        size = measure(entry(slots), data)
+        print(
+            f"slots={slots!s:<5} {size / 2**20:6.1f} MiB,"
+            f" {size / COUNT:5.0f} bytes per entry"
+        )
+
+
+if __name__ == "__main__":
+    main()
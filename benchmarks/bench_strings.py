@@ -0,0 +1,47 @@
+"""
+Zero-terminated strings from a 50k-entry symbol table.
+
+    python benchmarks/bench_strings.py
+
+`byte loop` is how `String[-1, ...]` used to read, one `read_bytes(1)`
+per character.
+"""
+
+import timeit
+from io import BytesIO
+
+from duckparse.reader import Reader, BufferReader
+
+COUNT = 50_000
+DATA = b"".join(b"_ZN4core3fmt%05d\x00" % i for i in range(COUNT))
+
+
+def byte_loop(reader: Reader) -> None:
+    for _ in range(COUNT):
+        data = bytearray()
+        while (byte := reader.read_bytes(1)) != b"\x00":
+            data += byte
+
+
+def read_until(reader: Reader) -> None:
+    for _ in range(COUNT):
+        reader.read_until(b"\x00")
+
+
+def main() -> None:
+    for name, source in (
+        ("BytesIO", lambda: Reader(BytesIO(DATA))),
+        ("BufferReader", lambda: BufferReader(DATA)),
+    ):
+        for scan in (byte_loop, read_until):
+            seconds = min(
+                timeit.repeat(lambda: scan(source()), number=1, repeat=3)
+            )
+            print(
+                f"{name:<14} {scan.__name__:<12} "
+                f"{seconds * 1e9 / COUNT:8.1f} ns/string"
+            )
+
+
+if __name__ == "__main__":
+    main()
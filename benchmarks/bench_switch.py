@@ -0,0 +1,93 @@
+"""
+Tag dispatch with `Switch` against a datakind with an if-chain.
+
+    python benchmarks/bench_switch.py
+
+Both parse `COUNT` records of four types back to back.
+"""
+
+import timeit
+from typing import Tuple
+
+from duckparse import datakind, section
+from duckparse.reader import BufferReader, Reader
+from duckparse.btypes import U8, U16, U32, Switch, Var
+
+COUNT = 200_000
+
+
+@section
+class Small:
+    value: U8
+
+
+@section
+class Medium:
+    value: U16
+
+
+@section
+class Large:
+    value: U32
+
+
+@section
+class Pair:
+    first: U16
+    second: U16
+
+
+@datakind
+class IfChain:
+    def __processor__(self, reader: Reader, params: Tuple[int]) -> object:
+        (tag,) = params
+        if tag == 1:
+            return Small(reader)
+        elif tag == 2:
+            return Medium(reader)
+        elif tag == 3:
+            return Large(reader)
+        elif tag == 4:
+            return Pair(reader)
+
+
+@section
+class ChainRecord:
+    tag: U8
+    body: IfChain[Var("tag")]
+
+
+@section
+class SwitchRecord:
+    tag: U8
+    body: Switch[Var("tag"), {1: Small, 2: Medium, 3: Large, 4: Pair}]
+
+
+DATA = (
+    b"\x01\x00"
+    + b"\x02\x00\x00"
+    + b"\x03"
+    + bytes(4)
+    + b"\x04"
+    + bytes(4)
+) * (COUNT // 4)
+
+
+def parse(cls: type) -> None:
+    reader = BufferReader(DATA)
+    for _ in range(COUNT):
+        cls(reader)
+
+
+def main() -> None:
+    for cls in (ChainRecord, SwitchRecord):
+        seconds = min(
+            timeit.repeat(lambda: parse(cls), number=1, repeat=5)
+        )
+        print(
+            f"{cls.__name__:<12} {seconds * 1e9 / COUNT:6.1f} ns per record"
+        )
+
+
+if __name__ == "__main__":
+    main()
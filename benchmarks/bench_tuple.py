@@ -0,0 +1,57 @@
+"""
+Cost of a fixed-size section as a class, with slots and as a tuple.
+
+    python benchmarks/bench_tuple.py
+
+Parses `COUNT` zip data descriptors back to back from one reader and
+reports the time per record and what tracemalloc sees allocated for a
+list of them.
+"""
+
+import timeit
+import tracemalloc
+
+from duckparse import section
+from duckparse.reader import BufferReader
+from duckparse.btypes import U32
+
+COUNT = 200_000
+
+
+def descriptor(**options: bool) -> type:
+    @section(**options)
+    class DataDescriptor:
+        crc32: U32
+        compressed_size: U32
+        uncompressed_size: U32
+
+    return DataDescriptor
+
+
+def parse(cls: type, reader: BufferReader) -> list:
+    reader.seek(0)
+    return [cls(reader) for _ in range(COUNT)]
+
+
+def main() -> None:
+    data = b"\x01\x01\x00\x00" * 3 * COUNT
+    for options in ({}, {"slots": True}, {"as_tuple": True}):
+        cls = descriptor(**options)
+        reader = BufferReader(data)
+        seconds = min(
+            timeit.repeat(lambda: parse(cls, reader), number=1, repeat=5)
+        )
+        tracemalloc.start()
+        records = parse(cls, reader)
+        size, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        del records
+        name = ", ".join(options) or "class"
+        print(
+            f"{name:<8} {seconds * 1e9 / COUNT:6.1f} ns,"
+            f" {size / COUNT:5.0f} bytes per record"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,2 +1,4 @@
 from .kinds import datakind, enumkind
 from .duckparse import stream, section
+from .analysis import layout
+from .profiling import profile
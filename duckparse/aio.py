@@ -0,0 +1,116 @@
+"""
+Parse from an `asyncio.StreamReader`:
+
+    zip = await Zip.parse_async(stream)
+
+The generated parsers are synchronous, so an `AsyncReader` only hands
+them what has already arrived. When a field runs past it, the reader
+raises `IncompleteRead`, and the parse is retried from its start once
+enough data is there. The end of the connection is the end of the
+stream, for `RepeatEOS` too.
+
+A parse which asks for the end of the stream, like a `RepeatEOS` over
+a whole connection, is only retried once the connection is closed, so
+it runs twice instead of once per chunk. It only returns at the end
+of the connection though, iterate over the records to get them as
+they arrive:
+
+    async for section in AsyncReader(stream).iterate(PkSection):
+        ...
+"""
+
+from dataclasses import dataclass, field
+
+from .exceptions import IncompleteRead
+from .reader import FeedReader
+
+from typing import (
+    TYPE_CHECKING,
+    AsyncIterator,
+    Callable,
+    Optional,
+    TypeVar,
+    Union,
+)
+
+if TYPE_CHECKING:  # pragma: no cover
+    from asyncio import StreamReader
+
+__all__ = ["AsyncReader", "IncompleteRead", "parse_async"]
+
+T = TypeVar("T")
+
+
+@dataclass
+class AsyncReader(FeedReader):
+    """
+    A `FeedReader` which receives from `io` whenever a parse needs more
+    data, the end of the connection is the end of the stream.
+    """
+
+    io: Optional["StreamReader"] = field(default=None, repr=False)
+    # the parse running asked for the end of the stream, see `parse`
+    eof_asked: bool = field(init=False, default=False, repr=False)
+
+    def at_eof(self) -> bool:
+        self.eof_asked = True
+        return super().at_eof()
+
+    async def _receive(self, needed: int) -> None:
+        assert self.io is not None, "data only arrives through `feed`"
+        received = 0
+        while received < needed and not self.eof:
+            # `read` returns as soon as anything arrived
+            data = await self.io.read(max(self.buffer_size, needed))
+            self.feed(data)
+            received += len(data)
+
+    async def _receive_all(self) -> None:
+        assert self.io is not None, "data only arrives through `feed`"
+        while not self.eof:
+            self.feed(await self.io.read(self.buffer_size))
+
+    async def parse(self, cls: Callable[[FeedReader], T]) -> T:
+        """Parse one `cls`, whatever arrives after it stays buffered."""
+        start = self.offset
+        while True:
+            self.eof_asked = False
+            try:
+                result = cls(self)
+            except IncompleteRead as error:
+                self._realign(start)
+                if self.eof_asked:
+                    # it reads up to the end, every retry before it
+                    # would only get a little further
+                    await self._receive_all()
+                else:
+                    await self._receive(error.needed)
+            else:
+                self.trim()
+                return result
+
+    async def iterate(
+        self, cls: Callable[[FeedReader], T]
+    ) -> AsyncIterator[T]:
+        """Parse `cls` after `cls` until the connection is closed."""
+        while True:
+            try:
+                if self.at_eof():
+                    return
+            except IncompleteRead as error:
+                await self._receive(error.needed)
+                continue
+            yield await self.parse(cls)
+
+
+async def parse_async(
+    cls: Callable[[FeedReader], T],
+    source: Union["StreamReader", AsyncReader],
+) -> T:
+    """
+    `cls.parse_async`, pass an `AsyncReader` to parse more than one
+    message from the same connection.
+    """
+    if not isinstance(source, AsyncReader):
+        source = AsyncReader(source)
+    return await source.parse(cls)
@@ -0,0 +1,73 @@
+from dataclasses import dataclass
+
+from .consts import LAYOUT_FIELD
+
+from typing import Any, Dict, Optional, Tuple
+
+
+@dataclass(frozen=True)
+class FieldLayout:
+    name: str
+    # in bytes, `None` when it depends on the data
+    size: Optional[int]
+    # from the start of the section, `None` after the first dynamic field
+    offset: Optional[int]
+
+    @property
+    def is_static(self) -> bool:
+        return self.size is not None
+
+
+@dataclass(frozen=True)
+class Layout:
+    fields: Tuple[FieldLayout, ...]
+    size: Optional[int]
+    first_dynamic: Optional[str]
+
+    def __getitem__(self, name: str) -> FieldLayout:
+        for field in self.fields:
+            if field.name == name:
+                return field
+        raise KeyError(name)
+
+
+def static_size(kind: Any) -> Optional[int]:
+    if hasattr(kind, "static_size"):
+        return kind.static_size()
+    if (layout := getattr(kind, LAYOUT_FIELD, None)) is not None:
+        return layout.size
+    return None
+
+
+def compute_layout(
+    kinds: Dict[str, Any], relocatable: bool = True
+) -> Layout:
+    # sections with a `__duckparse_first__` hook may seek anywhere before
+    # their fields, so only the field sizes are known
+    fields = list()
+    offset: Optional[int] = 0 if relocatable else None
+    first_dynamic = None
+
+    for name, kind in kinds.items():
+        size = static_size(kind)
+        fields.append(FieldLayout(name=name, size=size, offset=offset))
+        if size is None:
+            offset = None
+            if first_dynamic is None:
+                first_dynamic = name
+        elif offset is not None:
+            offset += size
+
+    return Layout(
+        fields=tuple(fields), size=offset, first_dynamic=first_dynamic
+    )
+
+
+def layout(cls: Any) -> Layout:
+    """
+    The static layout of a `@stream` or `@section` class: the size and
+    the offset of every field where they do not depend on the data.
+    """
+    if (result := getattr(cls, LAYOUT_FIELD, None)) is None:
+        raise TypeError(f"{cls!r} is not a duckparse stream or section")
+    return result
@@ -1,6 +1,12 @@
-from .reader import Reader
-from .kinds import datakind, RepeatN, RepeatEOS
+import codecs
+from functools import lru_cache
+
+from .reader import Buffer, Reader
+from .c_types import BigEndian, LittleEndian
+from .kinds import datakind, RepeatN, RepeatEOS, IndexedN, IterEOS
+from .kinds import SkipKind as Skip
 from .kinds import VarKind as Var
+from .kinds import SwitchKind as Switch
 
 from typing import Any, Tuple, Union, Dict, List, Callable, Optional
 
@@ -11,10 +17,18 @@ from .exceptions import ValidationError
 class Byte:
     def __processor__(
         self, reader: Reader, params: Tuple[int]
-    ) -> bytearray:
+    ) -> Union[bytearray, memoryview]:
         (size,) = params
         return reader.read_bytes(size)
 
+    def __skipper__(self, reader: Reader, params: Tuple[int]) -> None:
+        (size,) = params
+        reader.skip(size)
+
+    def __static_size__(self, params: Tuple[int]) -> Optional[int]:
+        (size,) = params
+        return size if isinstance(size, int) else None
+
 
 @datakind
 class Bits:
@@ -22,74 +36,255 @@ class Bits:
         (size,) = params
         return reader.read_bits_int_le(size)
 
+    def __bit_width__(self, params: Tuple[int]) -> Optional[int]:
+        (size,) = params
+        return size if isinstance(size, int) else None
+
+
+@datakind
+class Bitsbe:
+    """Bits from the most significant one down, as in network headers."""
+
+    __bit_order__ = "big"
+
+    def __processor__(self, reader: Reader, params: Tuple[int]) -> int:
+        (size,) = params
+        return reader.read_bits_int_be(size)
+
+    def __bit_width__(self, params: Tuple[int]) -> Optional[int]:
+        (size,) = params
+        return size if isinstance(size, int) else None
+
 
 @datakind
 class U8:
+    __struct_format__ = "B"
+
     def __processor__(self, reader: Reader) -> int:
         return reader.primitive.u8.unpack(reader.read_bytes(1))[0]
 
 
 @datakind
 class I8:
+    __struct_format__ = "b"
+
     def __processor__(self, reader: Reader) -> int:
         return reader.primitive.i8.unpack(reader.read_bytes(1))[0]
 
 
 @datakind
 class U16:
+    __struct_format__ = "H"
+
     def __processor__(self, reader: Reader) -> int:
         return reader.primitive.u16.unpack(reader.read_bytes(2))[0]
 
 
 @datakind
 class I16:
+    __struct_format__ = "h"
+
     def __processor__(self, reader: Reader) -> int:
         return reader.primitive.i16.unpack(reader.read_bytes(2))[0]
 
 
 @datakind
 class U32:
+    __struct_format__ = "I"
+
     def __processor__(self, reader: Reader) -> int:
         return reader.primitive.u32.unpack(reader.read_bytes(4))[0]
 
 
 @datakind
 class I32:
+    __struct_format__ = "i"
+
     def __processor__(self, reader: Reader) -> int:
         return reader.primitive.i32.unpack(reader.read_bytes(4))[0]
 
 
 @datakind
 class U64:
+    __struct_format__ = "Q"
+
     def __processor__(self, reader: Reader) -> int:
         return reader.primitive.u64.unpack(reader.read_bytes(8))[0]
 
 
 @datakind
 class I64:
+    __struct_format__ = "q"
+
     def __processor__(self, reader: Reader) -> int:
         return reader.primitive.i64.unpack(reader.read_bytes(8))[0]
 
 
 @datakind
 class F32:
+    __struct_format__ = "f"
+
     def __processor__(self, reader: Reader) -> float:
         return reader.primitive.f32.unpack(reader.read_bytes(4))[0]
 
 
 @datakind
 class F64:
+    __struct_format__ = "d"
+
     def __processor__(self, reader: Reader) -> float:
         return reader.primitive.f64.unpack(reader.read_bytes(8))[0]
 
 
+# with a byte order of their own, whatever the reader's is, the prefix
+# of the format is compiled into the generated code
+@datakind
+class U16be:
+    __struct_format__ = ">H"
+
+    def __processor__(self, reader: Reader) -> int:
+        return BigEndian.u16.unpack(reader.read_bytes(2))[0]
+
+
+@datakind
+class U16le:
+    __struct_format__ = "<H"
+
+    def __processor__(self, reader: Reader) -> int:
+        return LittleEndian.u16.unpack(reader.read_bytes(2))[0]
+
+
+@datakind
+class I16be:
+    __struct_format__ = ">h"
+
+    def __processor__(self, reader: Reader) -> int:
+        return BigEndian.i16.unpack(reader.read_bytes(2))[0]
+
+
+@datakind
+class I16le:
+    __struct_format__ = "<h"
+
+    def __processor__(self, reader: Reader) -> int:
+        return LittleEndian.i16.unpack(reader.read_bytes(2))[0]
+
+
+@datakind
+class U32be:
+    __struct_format__ = ">I"
+
+    def __processor__(self, reader: Reader) -> int:
+        return BigEndian.u32.unpack(reader.read_bytes(4))[0]
+
+
+@datakind
+class U32le:
+    __struct_format__ = "<I"
+
+    def __processor__(self, reader: Reader) -> int:
+        return LittleEndian.u32.unpack(reader.read_bytes(4))[0]
+
+
+@datakind
+class I32be:
+    __struct_format__ = ">i"
+
+    def __processor__(self, reader: Reader) -> int:
+        return BigEndian.i32.unpack(reader.read_bytes(4))[0]
+
+
+@datakind
+class I32le:
+    __struct_format__ = "<i"
+
+    def __processor__(self, reader: Reader) -> int:
+        return LittleEndian.i32.unpack(reader.read_bytes(4))[0]
+
+
+@datakind
+class U64be:
+    __struct_format__ = ">Q"
+
+    def __processor__(self, reader: Reader) -> int:
+        return BigEndian.u64.unpack(reader.read_bytes(8))[0]
+
+
+@datakind
+class U64le:
+    __struct_format__ = "<Q"
+
+    def __processor__(self, reader: Reader) -> int:
+        return LittleEndian.u64.unpack(reader.read_bytes(8))[0]
+
+
+@datakind
+class I64be:
+    __struct_format__ = ">q"
+
+    def __processor__(self, reader: Reader) -> int:
+        return BigEndian.i64.unpack(reader.read_bytes(8))[0]
+
+
+@datakind
+class I64le:
+    __struct_format__ = "<q"
+
+    def __processor__(self, reader: Reader) -> int:
+        return LittleEndian.i64.unpack(reader.read_bytes(8))[0]
+
+
+@datakind
+class F32be:
+    __struct_format__ = ">f"
+
+    def __processor__(self, reader: Reader) -> float:
+        return BigEndian.f32.unpack(reader.read_bytes(4))[0]
+
+
+@datakind
+class F32le:
+    __struct_format__ = "<f"
+
+    def __processor__(self, reader: Reader) -> float:
+        return LittleEndian.f32.unpack(reader.read_bytes(4))[0]
+
+
+@datakind
+class F64be:
+    __struct_format__ = ">d"
+
+    def __processor__(self, reader: Reader) -> float:
+        return BigEndian.f64.unpack(reader.read_bytes(8))[0]
+
+
+@datakind
+class F64le:
+    __struct_format__ = "<d"
+
+    def __processor__(self, reader: Reader) -> float:
+        return LittleEndian.f64.unpack(reader.read_bytes(8))[0]
+
+
+@lru_cache(maxsize=None)
+def _zero_terminator(encoding: str) -> bytes:
+    # a C string ends with a zero code unit, which is wider than a byte
+    # for UTF-16 and UTF-32
+    name = codecs.lookup(encoding).name
+    if name.startswith("utf-32"):
+        return b"\x00" * 4
+    if name.startswith("utf-16"):
+        return b"\x00" * 2
+    return b"\x00"
+
+
 @datakind
 class String:
-    def read_to_zero(self, reader: Reader) -> bytearray:
-        data = bytearray()
-        while (byte := reader.read_bytes(1)) != b"\x00":
-            data += byte
-        return data
+    def read_to_zero(
+        self, reader: Reader, encoding: str = "ascii"
+    ) -> Buffer:
+        terminator = _zero_terminator(encoding)
+        return reader.read_until(terminator, len(terminator))
 
     def __processor__(
         self, reader: Reader, params: Tuple[int, str]
@@ -97,10 +292,23 @@ class String:
         size, _encoding = params
         encoding = _encoding or "ascii"
         if size == -1:
-            data = self.read_to_zero(reader)
+            data = self.read_to_zero(reader, encoding)
         else:
             data = reader.read_bytes(size)
-        return data.decode(encoding)
+        return str(data, encoding)
+
+    def __skipper__(
+        self, reader: Reader, params: Tuple[int, str]
+    ) -> None:
+        size, _encoding = params
+        if size == -1:
+            self.read_to_zero(reader, _encoding or "ascii")
+        else:
+            reader.skip(size)
+
+    def __static_size__(self, params: Tuple[int, str]) -> Optional[int]:
+        size, _ = params
+        return size if isinstance(size, int) and size != -1 else None
 
 
 @datakind
@@ -111,16 +319,36 @@ class Array:
         (size,) = params
         return list(reader.read_bytes(size))
 
+    def __skipper__(self, reader: Reader, params: Tuple[int]) -> None:
+        (size,) = params
+        reader.skip(size)
+
+    def __static_size__(self, params: Tuple[int]) -> Optional[int]:
+        (size,) = params
+        return size if isinstance(size, int) else None
+
 
 @datakind
 class Contents:
-    def __processor__(
-        self, reader: Reader, params: Tuple[bytes]
+    def __struct_format__(self, params: Tuple[bytes]) -> str:
+        (expected,) = params
+        return f"{len(expected)}s"
+
+    def __struct_convert__(
+        self, found: bytes, params: Tuple[bytes]
     ) -> bytes:
         (expected,) = params
-        found = reader.read_bytes(len(expected))
 
         if expected != found:
             raise ValidationError(expected, found)
 
         return expected
+
+    def __processor__(
+        self, reader: Reader, params: Tuple[bytes]
+    ) -> bytes:
+        (expected,) = params
+        # a `ValidationError` keeps bytes, not a view which would hold
+        # on to the mapping of a `BufferReader`
+        found = bytes(reader.read_bytes(len(expected)))
+        return self.__struct_convert__(found, params)
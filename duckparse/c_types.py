@@ -1,9 +1,23 @@
 import struct
 from collections import namedtuple
 
+from typing import Callable, Dict, Optional, Tuple
+
 _Ctypes = namedtuple(
     "_Ctypes",
-    ["i8", "i16", "i32", "i64", "u8", "u16", "u32", "u64", "f32", "f64"],
+    [
+        "i8",
+        "i16",
+        "i32",
+        "i64",
+        "u8",
+        "u16",
+        "u32",
+        "u64",
+        "f32",
+        "f64",
+        "byteorder",
+    ],
 )
 
 i8 = struct.Struct("b")
@@ -34,9 +48,62 @@ f64_le = struct.Struct("<d")
 
 
 BigEndian = _Ctypes(
-    i8, i16_be, i32_be, i64_be, u8, u16_be, u32_be, u64_be, f32_be, f64_be
+    i8,
+    i16_be,
+    i32_be,
+    i64_be,
+    u8,
+    u16_be,
+    u32_be,
+    u64_be,
+    f32_be,
+    f64_be,
+    ">",
 )
 
 LittleEndian = _Ctypes(
-    i8, i16_le, i32_le, i64_le, u8, u16_le, u32_le, u64_le, f32_le, f64_le
+    i8,
+    i16_le,
+    i32_le,
+    i64_le,
+    u8,
+    u16_le,
+    u32_le,
+    u64_le,
+    f32_le,
+    f64_le,
+    "<",
 )
+
+
+def compile_struct(
+    fmt: str, fixed: Optional[str] = None
+) -> Dict[str, struct.Struct]:
+    # one precompiled struct per byte order, the reader picks the right
+    # one with its `primitive.byteorder`, unless the order is `fixed`
+    if fixed is not None:
+        compiled = struct.Struct(f"{fixed}{fmt}")
+        return {
+            byteorder: compiled
+            for byteorder in (BigEndian.byteorder, LittleEndian.byteorder)
+        }
+    return {
+        byteorder: struct.Struct(f"{byteorder}{fmt}")
+        for byteorder in (BigEndian.byteorder, LittleEndian.byteorder)
+    }
+
+
+def compile_unpackers(fmt: str) -> Dict[str, Callable]:
+    # the pre-bound `unpack_from`s the generated code calls
+    return {
+        byteorder: compiled.unpack_from
+        for byteorder, compiled in compile_struct(fmt).items()
+    }
+
+
+def split_byteorder(fmt: str) -> Tuple[Optional[str], str]:
+    # a format of a kind may start with its own byte order, "!" being
+    # the network order
+    if fmt[:1] in ("<", ">", "!"):
+        return (">" if fmt[0] == "!" else fmt[0]), fmt[1:]
+    return None, fmt
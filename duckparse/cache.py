@@ -0,0 +1,99 @@
+"""
+An opt-in on-disk cache for the code `@stream` and `@section` generate.
+
+With `DUCKPARSE_CACHE_DIR` set (or after `set_cache_dir`), generated
+functions are compiled once and later imports load the marshalled code
+objects instead. Warm it at build time with `python -m duckparse.warm`.
+"""
+
+import atexit
+import marshal
+import os
+import tempfile
+from contextlib import suppress
+from importlib.util import MAGIC_NUMBER
+from types import CodeType
+
+from typing import Dict, Optional
+
+__all__ = ["CACHE_DIR_ENV", "set_cache_dir", "get_cache_dir", "flush"]
+
+CACHE_DIR_ENV = "DUCKPARSE_CACHE_DIR"
+# bump it when the generated code starts to depend on something which
+# is not in its source text
+CACHE_FORMAT = 1
+
+_cache_dir: Optional[str] = os.environ.get(CACHE_DIR_ENV) or None
+# source text -> code, the source already spells out every field, kind
+# parameter and struct format of the class
+_codes: Optional[Dict[str, CodeType]] = None
+# compiled since the last `flush`
+_pending: Dict[str, CodeType] = {}
+
+
+def set_cache_dir(path: Optional[str]) -> None:
+    """`None` turns the cache off."""
+    global _cache_dir, _codes
+    flush()
+    _cache_dir = os.fspath(path) if path is not None else None
+    _codes = None
+
+
+def get_cache_dir() -> Optional[str]:
+    return _cache_dir
+
+
+def _cache_path(cache_dir: str) -> str:
+    # a single file, opening one per function costs about as much as
+    # compiling it
+    return os.path.join(
+        cache_dir, f"code-{CACHE_FORMAT}-{MAGIC_NUMBER.hex()}.marshal"
+    )
+
+
+def _load(cache_dir: str) -> Dict[str, CodeType]:
+    # a missing, truncated or foreign file is just a cache miss
+    with suppress(OSError, EOFError, ValueError, TypeError):
+        with open(_cache_path(cache_dir), "rb") as file:
+            codes = marshal.load(file)
+        if isinstance(codes, dict):
+            return codes
+    return {}
+
+
+def compile_source(source: str) -> CodeType:
+    global _codes
+    if _cache_dir is None:
+        return compile(source, "<string>", "exec")
+
+    if _codes is None:
+        _codes = _load(_cache_dir)
+    if (code := _codes.get(source)) is None:
+        code = _codes[source] = compile(source, "<string>", "exec")
+        _pending[source] = code
+    return code
+
+
+def flush() -> None:
+    """Write out the code compiled since the last flush, runs at exit."""
+    if _cache_dir is None or not _pending:
+        return
+
+    # merge with whatever other processes wrote in the meantime, then
+    # write and rename so nobody reads half a file
+    codes = _load(_cache_dir)
+    codes.update(_pending)
+    with suppress(OSError):
+        os.makedirs(_cache_dir, exist_ok=True)
+        fd, temporary = tempfile.mkstemp(dir=_cache_dir)
+        try:
+            with os.fdopen(fd, "wb") as file:
+                marshal.dump(codes, file)
+            os.replace(temporary, _cache_path(_cache_dir))
+        except BaseException:
+            os.unlink(temporary)
+            raise
+    _pending.clear()
+
+
+atexit.register(flush)
@@ -0,0 +1,465 @@
+"""
+Export parsers as plain Python modules:
+
+    python -m duckparse.compile formats.zip:Zip -o zip_parser.py
+
+The module holds the generated `__init__` and `__repr__` of the class and
+of every section it reads, with their struct formats inlined, so
+importing it runs no `exec` and no `@stream`/`@section`. Kinds from
+duckparse are imported, kinds defined next to the parsers are copied
+along with their `@datakind`/`@enumkind` decorators.
+
+The exported classes only parse, they can not be used as fields of new
+`@stream`/`@section` classes.
+"""
+
+import argparse
+import ast
+import builtins
+import importlib
+import inspect
+import re
+import sys
+import textwrap
+from functools import partial
+from operator import itemgetter
+from struct import Struct
+from types import (
+    BuiltinMethodType,
+    FunctionType,
+    MethodType,
+    ModuleType,
+)
+
+from .consts import (
+    DATAKIND_GUARD_FIELD,
+    ENUM_FIELD,
+    GENERATED_LOCALS_FIELD,
+    GENERATED_SOURCE_FIELD,
+    STREAM_TYPE_FIELD,
+)
+from .kinds import DataKind
+from .c_types import _Ctypes, BigEndian
+from .utils import LazyField
+
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+__all__ = ["export"]
+
+HEADER = '''"""
+Generated by `python -m duckparse.compile {targets}`, do not edit.
+"""
+
+from __future__ import annotations
+'''
+
+
+def _indent(text: str, level: int) -> str:
+    return textwrap.indent(text, "    " * level)
+
+
+def _unwrap(value: Any) -> Any:
+    for attribute in ("__func__", "fget"):
+        value = getattr(value, attribute, value)
+    return value
+
+
+class _NameCollector(ast.NodeVisitor):
+    """Free names of a piece of code, annotations are never evaluated."""
+
+    def __init__(self) -> None:
+        self.names: List[str] = []
+
+    def visit_Name(self, node: ast.Name) -> None:
+        if node.id not in self.names:
+            self.names.append(node.id)
+
+    def visit_arg(self, node: ast.arg) -> None:
+        pass
+
+    def visit_AnnAssign(self, node: ast.AnnAssign) -> None:
+        self.visit(node.target)
+        if node.value is not None:
+            self.visit(node.value)
+
+    def _visit_function(self, node: Any) -> None:
+        for child in (*node.decorator_list, *node.args.defaults):
+            self.visit(child)
+        for child in node.args.kw_defaults:
+            if child is not None:
+                self.visit(child)
+        for child in node.body:
+            self.visit(child)
+
+    visit_FunctionDef = visit_AsyncFunctionDef = _visit_function
+
+
+class _Exporter:
+    def __init__(self, targets: Sequence[type]):
+        # kinds and helpers of these modules are copied, importing them
+        # would run the decorators we are getting rid of
+        self.copied_modules = {target.__module__ for target in targets}
+        # emitted name -> (module, name), for `from module import name`
+        self.imports: Dict[str, Tuple[str, str]] = dict()
+        self.module_imports: Dict[str, str] = dict()
+        self.bindings: Dict[str, str] = dict()
+        self.names: Dict[int, str] = dict()
+        self.copies: List[Tuple[int, str]] = list()
+        self.parsers: List[str] = list()
+        for target in targets:
+            self.parser(target)
+
+    def render(self, targets: str) -> str:
+        imports = [
+            (
+                f"import {module}"
+                if alias == module
+                else f"import {module} as {alias}"
+            )
+            for alias, module in sorted(self.module_imports.items())
+        ]
+        from_imports: Dict[str, List[str]] = dict()
+        for alias, (module, name) in sorted(
+            self.imports.items(), key=lambda item: item[1]
+        ):
+            from_imports.setdefault(module, []).append(
+                name if alias == name else f"{name} as {alias}"
+            )
+        imports.extend(
+            f"from {module} import {', '.join(names)}"
+            for module, names in from_imports.items()
+        )
+        header = HEADER.format(targets=targets)
+        if imports:
+            header += "\n" + "\n".join(imports)
+        sections = [
+            header,
+            "\n".join(
+                f"{name} = {expression}"
+                for name, expression in self.bindings.items()
+            ),
+            *(source for _, source in sorted(self.copies)),
+            *self.parsers,
+        ]
+        return "\n\n\n".join(s.strip("\n") for s in sections if s) + "\n"
+
+    def _name(self, value: Any, name: str) -> str:
+        if (emitted := self.names.get(id(value))) is not None:
+            return emitted
+        taken = {*self.imports, *self.module_imports, *self.bindings}
+        taken.update(self.names.values())
+        emitted, counter = name, 1
+        while emitted in taken:
+            counter += 1
+            emitted = f"{name}_{counter}"
+        self.names[id(value)] = emitted
+        return emitted
+
+    def _import(self, module: str, name: str, value: Any) -> str:
+        if (
+            module == "builtins"
+            and getattr(builtins, name, None) is value
+        ):
+            return name
+        alias = self._name(value, name)
+        self.imports[alias] = (module, name)
+        return alias
+
+    def _bind_globals(
+        self, source: str, namespace: Dict[str, Any]
+    ) -> None:
+        collector = _NameCollector()
+        collector.visit(ast.parse(source))
+        for name in collector.names:
+            if name not in namespace:
+                continue
+            expression = self.reference(namespace[name])
+            if expression == name:
+                continue
+            if self.bindings.setdefault(name, expression) != expression:
+                raise ValueError(
+                    f"{name} refers to {self.bindings[name]} and "
+                    f"{expression} in the copied code"
+                )
+
+    def _copy(self, value: Any, name: str) -> str:
+        # `value` is bound to `name` in the emitted module
+        self.names[id(value)] = name
+        source = textwrap.dedent(inspect.getsource(_unwrap(value)))
+        self._bind_globals(source, sys.modules[value.__module__].__dict__)
+        _, line = inspect.getsourcelines(_unwrap(value))
+        self.copies.append((line, source))
+        return name
+
+    def _kind(self, kind: DataKind) -> str:
+        module = sys.modules[kind.base_cls.__module__]
+        for name, attribute in vars(module).items():
+            if attribute is kind:
+                break
+        else:
+            raise TypeError(f"can not find {kind.base_cls} in {module}")
+
+        if id(kind) in self.names:
+            return self.names[id(kind)]
+        if module.__name__ not in self.copied_modules:
+            return self._import(module.__name__, name, kind)
+        self.names[id(kind)] = name
+        self._copy(kind.base_cls, name)
+        self.names[id(kind.base_cls)] = f"{name}.base_cls"
+        return name
+
+    def _lookup(self, value: Any) -> Optional[str]:
+        # functions and classes which can be imported by their name
+        module = sys.modules.get(getattr(value, "__module__", None) or "")
+        qualname = getattr(value, "__qualname__", None)
+        if module is None or qualname is None or "<" in qualname:
+            return None
+        first, *rest = qualname.split(".")
+        found: Any = module
+        for part in (first, *rest):
+            found = getattr(found, part, None)
+        if found is not value:
+            return None
+        if module.__name__ in self.copied_modules:
+            if rest or not isinstance(value, FunctionType):
+                raise TypeError(
+                    f"can not export {value!r}, only functions, kinds "
+                    "and parsers of the exported modules are copied"
+                )
+            return self._copy(value, first)
+        return ".".join(
+            (
+                self._import(
+                    module.__name__, first, getattr(module, first)
+                ),
+            )
+            + tuple(rest)
+        )
+
+    def _base_cls(self, value: Any) -> Optional[str]:
+        # a kind's class, or the enum made by `@enumkind`
+        for module in (
+            *self.copied_modules,
+            getattr(value, "__module__", ""),
+        ):
+            for attribute in list(
+                vars(sys.modules.get(module, sys)).values()
+            ):
+                if not isinstance(attribute, DataKind):
+                    continue
+                if attribute.base_cls is value:
+                    return f"{self._kind(attribute)}.base_cls"
+                if attribute.base_cls.__dict__.get(ENUM_FIELD) is value:
+                    return (
+                        f"{self._kind(attribute)}.base_cls.{ENUM_FIELD}"
+                    )
+        return None
+
+    def reference(self, value: Any) -> str:
+        """An expression for `value` in the emitted module."""
+        if value is None or isinstance(
+            value, (bool, int, float, str, bytes)
+        ):
+            return repr(value)
+        if isinstance(value, _Ctypes):
+            # the `primitive` of `section(endian=...)`
+            name = "BigEndian" if value is BigEndian else "LittleEndian"
+            return self._import("duckparse.c_types", name, value)
+        if isinstance(value, tuple):
+            items = "".join(f"{self.reference(item)}, " for item in value)
+            return f"({items.rstrip()})"
+        if isinstance(value, list):
+            return f"[{', '.join(map(self.reference, value))}]"
+        if isinstance(value, dict):
+            entries = (
+                f"{self.reference(key)}: {self.reference(item)}"
+                for key, item in value.items()
+            )
+            return f"{{{', '.join(entries)}}}"
+        if isinstance(value, Struct):
+            # `c_types.compile_struct`, inlined
+            struct = self._import("struct", "Struct", Struct)
+            return f"{struct}({value.format!r})"
+        if isinstance(value, partial):
+            arguments = [self.reference(value.func)]
+            arguments.extend(map(self.reference, value.args))
+            arguments.extend(
+                f"{key}={self.reference(item)}"
+                for key, item in value.keywords.items()
+            )
+            function = self._import("functools", "partial", partial)
+            return f"{function}({', '.join(arguments)})"
+        if isinstance(value, type) and hasattr(value, STREAM_TYPE_FIELD):
+            return self.parser(value)
+        if isinstance(value, DataKind):
+            return self._kind(value)
+        if isinstance(value, (MethodType, BuiltinMethodType)) and not (
+            isinstance(value.__self__, ModuleType)
+        ):
+            return f"{self.reference(value.__self__)}.{value.__name__}"
+        if isinstance(value, ModuleType):
+            self.module_imports[value.__name__] = value.__name__
+            return value.__name__
+        if id(value) in self.names:
+            return self.names[id(value)]
+        if not isinstance(value, type) and hasattr(
+            type(value), DATAKIND_GUARD_FIELD
+        ):
+            # processors are bound to an instance of the kind's class
+            return f"{self.reference(type(value))}()"
+        if (expression := self._lookup(value)) is not None:
+            return expression
+        if (expression := self._base_cls(value)) is not None:
+            return expression
+        raise TypeError(f"can not export {value!r}")
+
+    def parser(self, cls: type) -> str:
+        if id(cls) in self.names:
+            return self.names[id(cls)]
+        name = self._name(cls, cls.__name__)
+
+        # `as_tuple` sections are built in `__new__`
+        constructor = cls.__dict__.get("__init__") or _unwrap(
+            cls.__dict__["__new__"]
+        )
+        generated = [constructor, cls.__dict__["__repr__"]]
+        lazy_fields = {
+            field_name: attribute
+            for field_name, attribute in cls.__dict__.items()
+            if isinstance(attribute, LazyField)
+        }
+        generated.extend(field.loader for field in lazy_fields.values())
+        cls_locals = getattr(generated[0], GENERATED_LOCALS_FIELD)
+        # and the cases of `Switch` fields
+        for value in cls_locals.values():
+            if hasattr(value, GENERATED_SOURCE_FIELD):
+                self.names[id(value)] = value.__name__
+                generated.append(value)
+        sources = [
+            # `_create_fn` indents by two
+            re.sub(
+                r"^  ",
+                "    ",
+                getattr(f, GENERATED_SOURCE_FIELD),
+                flags=re.M,
+            )
+            for f in generated
+        ]
+
+        text = "\n".join(sources)
+        assignments = [
+            f"{local} = {expression}"
+            for local, value in cls_locals.items()
+            if re.search(rf"(?<![\w.]){re.escape(local)}\b", text)
+            # the same name at the module level is found anyway
+            and (expression := self.reference(value)) != local
+        ]
+        # the functions only look their locals up once they are called,
+        # but a `Switch` table refers to its cases right away
+        closure = "\n\n".join(
+            (*sources[2:], "\n".join(assignments))
+        ).strip("\n")
+
+        body = []
+        if cls.__doc__:
+            doc = inspect.cleandoc(cls.__doc__)
+            body.append(f'"""{doc}"""' if '"""' not in doc else repr(doc))
+        if "__slots__" in cls.__dict__:
+            slots = cls.__dict__["__slots__"]
+            body.append(f"__slots__ = {self.reference(slots)}")
+        if tuple in cls.__bases__:
+            getter = self._import("operator", "itemgetter", itemgetter)
+            fields = cls.__dict__["_fields"]
+            body.append(f"_fields = {self.reference(fields)}")
+            body.extend(
+                f"{field_name} = property({getter}({index}))"
+                for index, field_name in enumerate(fields)
+            )
+        for attribute in cls.__dict__.values():
+            function = _unwrap(attribute)
+            if (
+                isinstance(function, FunctionType)
+                and not hasattr(function, GENERATED_SOURCE_FIELD)
+                and function.__qualname__.startswith(
+                    f"{cls.__qualname__}."
+                )
+            ):
+                source = textwrap.dedent(inspect.getsource(attribute))
+                self._bind_globals(source, function.__globals__)
+                body.append(source.strip("\n"))
+        for method in ("__getstate__", "__reduce__", "parse_async"):
+            # the pickling and asyncio support from duckparse
+            value = cls.__dict__.get(method)
+            if getattr(_unwrap(value), "__module__", None) not in (
+                "duckparse.duckparse",
+                "duckparse.aio",
+            ):
+                continue
+            expression = self.reference(_unwrap(value))
+            if isinstance(value, classmethod):
+                expression = f"classmethod({expression})"
+            body.append(f"{method} = {expression}")
+        body.extend(sources[:2])
+        if lazy_fields:
+            lazy_field = self._import(
+                "duckparse.utils", "LazyField", LazyField
+            )
+            body.extend(
+                f"{field_name} = {lazy_field}"
+                f"({field_name!r}, {field.loader.__name__})"
+                for field_name, field in lazy_fields.items()
+            )
+
+        builder = "\n".join(
+            (
+                f"def _build_{name}():",
+                _indent(closure, 1),
+                "",
+                f"    class {name}"
+                f"{'(tuple)' if tuple in cls.__bases__ else ''}:",
+                _indent("\n\n".join(body), 2),
+                "",
+                f"    return {name}",
+                "",
+                "",
+                f"{name} = _build_{name}()",
+            )
+        )
+        self.parsers.append(builder)
+        return name
+
+
+def _load(target: str) -> type:
+    module, _, qualname = target.partition(":")
+    value: Any = importlib.import_module(module)
+    for part in qualname.split("."):
+        value = getattr(value, part)
+    if not hasattr(value, STREAM_TYPE_FIELD):
+        raise TypeError(f"{target} is not a @stream or @section")
+    return value
+
+
+def export(*classes: type) -> str:
+    """The source of a module with `classes` and what they read."""
+    targets = " ".join(
+        f"{cls.__module__}:{cls.__qualname__}" for cls in classes
+    )
+    return _Exporter(classes).render(targets)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    parser = argparse.ArgumentParser(prog="python -m duckparse.compile")
+    parser.add_argument("targets", nargs="+", metavar="module:Class")
+    parser.add_argument("-o", "--output", help="defaults to stdout")
+    args = parser.parse_args(argv)
+
+    source = export(*map(_load, args.targets))
+    if args.output is None:
+        sys.stdout.write(source)
+        return
+    with open(args.output, "w") as file:
+        file.write(source)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,6 @@
-READER_NAME = "self.reader"
+# the generated functions keep the reader in a local, `self.reader` is
+# only assigned for hooks and lazy fields
+READER_NAME = "reader"
 
 PROCESSOR_FUNCTION_FIELD = "__processor__"
 
@@ -11,3 +13,18 @@ STREAM_TYPE_FIELD = "__duckparse_stream_type__"
 DATAKIND_GUARD_FIELD = "__duckparse_kindguard__"
 
 ENUM_FIELD = "__masked_enum__"
+
+STRUCT_FORMAT_FIELD = "__struct_format__"
+STRUCT_CONVERT_FIELD = "__struct_convert__"
+BIT_WIDTH_FIELD = "__bit_width__"
+BIT_ORDER_FIELD = "__bit_order__"
+
+SKIP_FUNCTION_FIELD = "__skipper__"
+STATIC_SIZE_FUNCTION_FIELD = "__static_size__"
+LAYOUT_FIELD = "__duckparse_layout__"
+LAZY_OFFSETS_FIELD = "__duckparse_offsets__"
+STRUCT_LAYOUT_FIELD = "__duckparse_struct_layout__"
+
+GENERATED_SOURCE_FIELD = "__duckparse_source__"
+GENERATED_LOCALS_FIELD = "__duckparse_locals__"
+PROFILED_FIELD = "__duckparse_profiled__"
@@ -1,14 +1,39 @@
+import re
 from enum import Enum
-
-from .utils import resolve
-
-from .reader import Reader
-from .kindprotocol import Call, Assignment
+from struct import Struct
+from textwrap import indent
+from dataclasses import replace
+from functools import partial
+from operator import itemgetter
+
+from .utils import resolve, LazyField
+from .analysis import compute_layout
+
+from .aio import parse_async
+from .profiling import _enter, _leave
+from .cache import compile_source
+from .reader import into_reader
+from .c_types import compile_unpackers, BigEndian, LittleEndian
+from .kindprotocol import (
+    Call,
+    Assignment,
+    Hook,
+    StructField,
+    Unpack,
+    Defer,
+    BitGroup,
+)
 
 from .consts import (
     READER_NAME,
     STREAM_TYPE_FIELD,
     PREFUNCTION_FIELD,
+    LAYOUT_FIELD,
+    STRUCT_LAYOUT_FIELD,
+    LAZY_OFFSETS_FIELD,
+    GENERATED_SOURCE_FIELD,
+    GENERATED_LOCALS_FIELD,
+    PROFILED_FIELD,
 )
 
 from typing import (
@@ -21,6 +46,8 @@ from typing import (
     Callable,
     Optional,
     TypeVar,
+    Set,
+    cast,
 )
 
 __all__ = ["stream", "section"]
@@ -28,6 +55,23 @@ __all__ = ["stream", "section"]
 T = TypeVar("T")
 
 
+# what every class body has, `STREAM_TYPE_FIELD` is set before
+# `_process_class` runs
+_PLAIN_CLASS_NAMES = frozenset(
+    (
+        "__module__",
+        "__qualname__",
+        "__doc__",
+        "__dict__",
+        "__weakref__",
+        "__annotations__",
+        "__firstlineno__",
+        "__static_attributes__",
+        STREAM_TYPE_FIELD,
+    )
+)
+
+
 class StreamType(Enum):
     STREAM = 0
     SECTION = 1
@@ -50,6 +94,21 @@ def _ss_into_call(
     raise ValueError
 
 
+def _ss_into_skip_call(
+    cls,
+    cls_locals: Dict[str, Any],
+    par_counter: Optional[List[int]] = None,
+) -> Optional[Call]:
+    # only sections with a static size can be skipped without parsing
+    if (size := getattr(cls, LAYOUT_FIELD).size) is None:
+        return None
+    return Call(
+        function_name=f"{READER_NAME}.skip",
+        params=str(size),
+        reader_as_param=False,
+    )
+
+
 def _create_fn(
     name: str,
     _args: Iterable[str],
@@ -66,7 +125,9 @@ def _create_fn(
     globals = globals or {}
 
     args = ",".join(_args)
-    body = "\n".join(f"  {b}" for b in _body)
+    body = "\n".join(
+        f"  {line}" for b in _body for line in b.splitlines()
+    )
 
     # Compute the text of the entire function.
     txt = f" def {name}({args}):\n{body}"
@@ -75,23 +136,43 @@ def _create_fn(
     local_vars = ", ".join(locals.keys())
     txt = f"def __create_fn__({local_vars}):\n{txt}\n return {name}"
     ns: Dict[str, Callable] = {}
-    exec(txt, globals, ns)
+    exec(compile_source(txt), globals, ns)
     func = ns["__create_fn__"](**locals)
     for arg, annotation in func.__annotations__.copy().items():
         func.__annotations__[arg] = locals[annotation]
+    # kept for `python -m duckparse.compile`
+    setattr(
+        func,
+        GENERATED_SOURCE_FIELD,
+        f"def {name}({', '.join(_args)}):\n{body}",
+    )
+    setattr(func, GENERATED_LOCALS_FIELD, locals)
     return func
 
 
+def _assigned_fields(
+    assigments: List[Union[Assignment, Unpack, Defer, BitGroup]],
+) -> List[str]:
+    fields: List[str] = list()
+    for assigment in assigments:
+        assing_to = getattr(assigment, "assing_to", None)
+        if assing_to is None:
+            continue
+        if isinstance(assing_to, str):
+            fields.append(assing_to)
+        else:
+            fields.extend(assing_to)
+    return fields
+
+
 def _make_repr(
     cls_name: str,
-    assigments: List[Assignment],
+    assigments: List[Union[Assignment, Unpack, Defer, BitGroup]],
     cls_locals: Dict[str, Any],
 ) -> Callable:
     arguments = ", ".join(
-        f"{assigment.assing_to}={{self.{assigment.assing_to}!r}}"
-        for assigment in assigments
-        if hasattr(assigment, "assing_to")
-        and assigment.assing_to is not None
+        f"{field}={{self.{field}!r}}"
+        for field in _assigned_fields(assigments)
     )
     function_body = [f"return f'{cls_name}({arguments})'"]
     function = _create_fn(
@@ -102,35 +183,355 @@ def _make_repr(
 
 
 def _make_init(
-    assigments: List[Assignment],
+    assigments: List[Union[Assignment, Unpack, Defer, BitGroup]],
     cls_locals: Dict[str, Any],
     is_section: bool = False,
+    lazy: bool = False,
+    keep_reader: bool = True,
+    primitive_name: Optional[str] = None,
+    profiled: Optional[Tuple[str, str]] = None,
 ) -> Callable:
+    if profiled is not None:
+        cls_locals = _profile_locals(cls_locals)
+    body = _statements(assigments, profiled)
     if is_section:
+        if primitive_name is not None and not all(
+            isinstance(assigment, (Unpack, BitGroup))
+            for assigment in assigments
+        ):
+            body = _in_byteorder(body, primitive_name)
         function_body = (
-            f"{READER_NAME} = reader",
-            *(repr(assigment) for assigment in assigments),
+            *((f"self.reader = {READER_NAME}",) if keep_reader else ()),
+            *((f"self.{LAZY_OFFSETS_FIELD} = {{}}",) if lazy else ()),
+            *_profiled(body, profiled, 0, None),
         )
         function = _create_fn(
             "__init__",
-            ("self", "reader"),
+            ("self", READER_NAME),
             function_body,
             locals=cls_locals,
         )
     else:
-        cls_locals["Reader"] = Reader
+        cls_locals["into_reader"] = into_reader
         function_body = (
-            f"{READER_NAME} = Reader(io)",
-            *(repr(assigment) for assigment in assigments),
+            f"self.reader = {READER_NAME} = into_reader(io)",
+            *_profiled(body, profiled, 0, None),
+            # a file is left right after the stream, a reader as it is
+            f"if {READER_NAME} is not io:",
+            f"    {READER_NAME}.sync()",
         )
         function = _create_fn(
             "__init__", ("self", "io"), function_body, locals=cls_locals
         )
 
+    if profiled is None:
+        setattr(
+            function,
+            PROFILED_FIELD,
+            partial(
+                _make_init,
+                assigments,
+                cls_locals,
+                is_section,
+                lazy=lazy,
+                keep_reader=keep_reader,
+                primitive_name=primitive_name,
+            ),
+        )
+    return function
+
+
+def _statement_name(
+    statement: Union[Assignment, Unpack, Defer, BitGroup],
+) -> str:
+    # what a statement of `__init__` reads, a fused run is one statement
+    assing_to = getattr(statement, "assing_to", None)
+    if assing_to is None:
+        # a hook
+        assert isinstance(statement, Assignment)
+        return statement.value.function_name.replace("self.", "", 1)
+    if isinstance(assing_to, str):
+        return assing_to
+    return ",".join(assing_to)
+
+
+def _profile_locals(cls_locals: Dict[str, Any]) -> Dict[str, Any]:
+    # a copy, the locals of the plain functions are exported as they are
+    return {
+        **cls_locals,
+        "__duckparse_enter__": _enter,
+        "__duckparse_leave__": _leave,
+    }
+
+
+def _profiled(
+    lines: Iterable[str],
+    profiled: Optional[Tuple[str, str]],
+    lineno: int,
+    name: Optional[str],
+) -> Tuple[str, ...]:
+    # times `lines` as the pstats function `(module, lineno, name)`
+    if profiled is None:
+        return tuple(lines)
+    module, qualname = profiled
+    function = qualname if name is None else f"{qualname}.{name}"
+    key = (module, lineno, function)
+    return (
+        f"__duckparse_enter__({READER_NAME}, {key!r})",
+        "try:",
+        *(indent(line, "    ") for line in lines),
+        "finally:",
+        f"    __duckparse_leave__({READER_NAME})",
+    )
+
+
+def _statements(
+    assigments: List[Union[Assignment, Unpack, Defer, BitGroup]],
+    profiled: Optional[Tuple[str, str]] = None,
+    source: Callable[[Any], str] = repr,
+) -> Tuple[str, ...]:
+    return tuple(
+        line
+        for index, assigment in enumerate(assigments, start=1)
+        for line in _profiled(
+            (source(assigment),),
+            profiled,
+            index,
+            _statement_name(assigment),
+        )
+    )
+
+
+def _in_byteorder(
+    lines: Iterable[str], primitive_name: str
+) -> Tuple[str, ...]:
+    # kinds without a struct format read through `reader.primitive`, so
+    # it is the section's while they run
+    return (
+        f"primitive = {READER_NAME}.primitive",
+        f"{READER_NAME}.primitive = {primitive_name}",
+        "try:",
+        *(indent(line, "    ") for line in lines),
+        "finally:",
+        f"    {READER_NAME}.primitive = primitive",
+    )
+
+
+def _make_new(
+    assigments: List[Union[Assignment, Unpack, Defer, BitGroup]],
+    cls_locals: Dict[str, Any],
+    profiled: Optional[Tuple[str, str]] = None,
+) -> Callable:
+    # the values of a fixed-size section are exactly what the struct
+    # unpacks, so they go into the tuple as they are
+    if profiled is not None:
+        cls_locals = _profile_locals(cls_locals)
+    cls_locals["__duckparse_tuple_new__"] = tuple.__new__
+    body = (
+        *_statements(assigments, profiled, Unpack.into_values),
+        *(() if assigments else ("values = ()",)),
+        "return __duckparse_tuple_new__(cls, values)",
+    )
+    function = _create_fn(
+        "__new__",
+        ("cls", READER_NAME),
+        _profiled(body, profiled, 0, None),
+        locals=cls_locals,
+    )
+    if profiled is None:
+        setattr(
+            function,
+            PROFILED_FIELD,
+            partial(_make_new, assigments, cls_locals),
+        )
     return function
 
 
-def _process_class(cls: T, is_section: bool = False) -> T:
+def _reduce_tuple(self: tuple) -> Tuple[Callable, Tuple[Any, ...]]:
+    # `__new__` takes a reader, so unpickling has to bypass it
+    return tuple.__new__, (type(self), tuple(self))
+
+
+def _detach(value: Any) -> Any:
+    # slices of a `BufferReader` point into its buffer or mmap
+    if isinstance(value, memoryview):
+        return value.tobytes()
+    if isinstance(value, list):
+        return [_detach(item) for item in value]
+    return value
+
+
+def _getstate(self: Any) -> Tuple[None, Dict[str, Any]]:
+    # the reader stays behind, so lazy fields are decoded first and
+    # everything is restored with `setattr`, slots or not
+    cls = type(self)
+    names = [*getattr(self, "__dict__", ())]
+    names.extend(
+        name
+        for klass in cls.__mro__
+        for name in klass.__dict__.get("__slots__", ())
+        if name != "__dict__" and hasattr(self, name)
+    )
+    names.extend(
+        name
+        for name in dir(cls)
+        if isinstance(getattr(cls, name, None), LazyField)
+    )
+    state = {
+        name: _detach(getattr(self, name))
+        for name in names
+        if name not in ("reader", LAZY_OFFSETS_FIELD)
+    }
+    return None, state
+
+
+def _flush_struct_run(
+    run: List[Tuple[str, StructField]],
+    cls_locals: Dict[str, Any],
+    init_body: List[Union[Assignment, Unpack, Defer, BitGroup]],
+    reprocessors_dict: Dict[str, List[Assignment]],
+) -> None:
+    if not run:
+        return
+
+    struct_name = f"__duckparse_unpack_{len(init_body)}__"
+    fmt = "".join(field.format for _, field in run)
+    # runs are split where the byte order changes
+    byteorder = run[0][1].byteorder
+    if byteorder is None:
+        cls_locals[struct_name] = compile_unpackers(fmt)
+    else:
+        cls_locals[struct_name] = Struct(f"{byteorder}{fmt}").unpack_from
+    init_body.append(
+        Unpack(
+            struct_name=struct_name,
+            assing_to=tuple(field_name for field_name, _ in run),
+            formats=tuple(field.format for _, field in run),
+            converters={
+                field_name: field.convert
+                for field_name, field in run
+                if field.convert is not None
+            },
+            byteorder=byteorder,
+        )
+    )
+
+    for field_name, _ in run:
+        if reprocessor := reprocessors_dict.get(field_name):
+            init_body.extend(reprocessor)
+
+    run.clear()
+
+
+def _flush_bit_run(
+    run: List[Tuple[str, Any, int]],
+    cls_locals: Dict[str, Any],
+    par_counter: List[int],
+    init_body: List[Union[Assignment, Unpack, Defer, BitGroup]],
+    reprocessors_dict: Dict[str, List[Assignment]],
+) -> None:
+    if not run:
+        return
+
+    calls = tuple(
+        kind.into_call(
+            cls_locals=cls_locals,
+            par_counter=par_counter,
+            reprocessors_dict=reprocessors_dict,
+        )
+        for _, kind, _ in run
+    )
+    widths = tuple(width for _, _, width in run)
+    if sum(widths) % 8 == 0:
+        init_body.append(
+            BitGroup(
+                assing_to=tuple(field_name for field_name, _, _ in run),
+                widths=widths,
+                calls=calls,
+                bit_order=run[0][1].bit_order(),
+            )
+        )
+    else:
+        # a partial byte is left to the next bit field, which is only
+        # known at run time
+        init_body.extend(
+            Assignment(assing_to=field_name, value=call)
+            for (field_name, _, _), call in zip(run, calls)
+        )
+
+    for field_name, _, _ in run:
+        if reprocessor := reprocessors_dict.get(field_name):
+            init_body.extend(reprocessor)
+
+    run.clear()
+
+
+def _referenced_fields(kinds: Iterable[Any]) -> Set[str]:
+    # every `Var` and repeat condition ends up as `self.<field>` in the
+    # kind's repr
+    return {
+        name
+        for kind in kinds
+        for name in re.findall(r"\bself\.(\w+)", repr(kind))
+    }
+
+
+def _defines_members(cls: Any) -> bool:
+    # methods, properties, class attributes and hooks, or base classes
+    # which could have them
+    return cls.__bases__ != (object,) or any(
+        name not in _PLAIN_CLASS_NAMES for name in cls.__dict__
+    )
+
+
+def _add_slots(cls: type, fields: Iterable[str]) -> type:
+    # as in `dataclass(slots=True)`, `__slots__` only counts when the
+    # class is created, so we create it again
+    cls_dict = dict(cls.__dict__)
+    cls_dict["__slots__"] = tuple(fields)
+    for field_name in cls_dict["__slots__"]:
+        cls_dict.pop(field_name, None)
+    cls_dict.pop("__dict__", None)
+    cls_dict.pop("__weakref__", None)
+    new_cls = type(cls)(cls.__name__, cls.__bases__, cls_dict)
+    new_cls.__qualname__ = cls.__qualname__
+    return new_cls
+
+
+def _add_tuple_base(cls: type, fields: Tuple[str, ...]) -> type:
+    # like a namedtuple, the fields are properties over the items
+    if cls.__bases__ != (object,):
+        raise TypeError(
+            f"{resolve(cls)} can not be a tuple, it has base classes"
+        )
+    cls_dict = dict(cls.__dict__)
+    cls_dict.pop("__dict__", None)
+    cls_dict.pop("__weakref__", None)
+    cls_dict["__slots__"] = ()
+    cls_dict["_fields"] = fields
+    cls_dict["__reduce__"] = _reduce_tuple
+    for index, field_name in enumerate(fields):
+        cls_dict[field_name] = property(
+            itemgetter(index), doc=f"Alias for field number {index}"
+        )
+    new_cls = type(cls)(cls.__name__, (tuple,), cls_dict)
+    new_cls.__qualname__ = cls.__qualname__
+    return new_cls
+
+
+def _process_class(
+    cls: T,
+    is_section: bool = False,
+    lazy: bool = False,
+    slots: bool = False,
+    as_tuple: bool = False,
+    endian: Optional[str] = None,
+) -> T:
+    if endian not in (None, "big", "little"):
+        raise ValueError(
+            f"endian has to be 'big' or 'little', not {endian!r}"
+        )
+    defines_members = _defines_members(cls)
     if hasattr(cls, "__annotations__"):
         cls_annotations = cls.__annotations__
         del cls.__annotations__
@@ -138,37 +539,211 @@ def _process_class(cls: T, is_section: bool = False) -> T:
         # TODO: Raise an error
         ...
     cls_locals: Dict[str, Any] = dict()
+    primitive_name = None
+    if endian is not None:
+        primitive_name = "__duckparse_primitive__"
+        cls_locals[primitive_name] = (
+            BigEndian if endian == "big" else LittleEndian
+        )
 
-    init_body: List[Assignment] = list()
+    init_body: List[Union[Assignment, Unpack, Defer, BitGroup]] = list()
     reprocessors_dict: Dict[str, List[Assignment]] = dict()
+    # consecutive fixed-size fields, read with a single struct
+    struct_run: List[Tuple[str, StructField]] = list()
+    # consecutive bit fields, read at once when they fill whole bytes
+    bit_run: List[Tuple[str, Any, int]] = list()
+    par_counter = [0]
+    lazy_fields: Dict[str, Callable] = dict()
+    referenced = (
+        _referenced_fields(cls_annotations.values()) if lazy else set()
+    )
 
     if hasattr(cls, PREFUNCTION_FIELD):
         prefunction = getattr(cls, PREFUNCTION_FIELD)
         cls_locals[resolve(prefunction)] = prefunction
         init_body.append(
-            Assignment(
-                value=Call(function_name=f"self.{resolve(prefunction)}",)
+            Hook(
+                value=Call(
+                    function_name=f"self.{resolve(prefunction)}",
+                )
             )
         )
 
-    for field_name, kind in zip(
-        cls_annotations.keys(), cls_annotations.values(),
-    ):
+    for index, (field_name, kind) in enumerate(cls_annotations.items()):
+        if getattr(kind, "consumes_rest", False) and (
+            is_section or index != len(cls_annotations) - 1
+        ):
+            raise ValueError(
+                f"{field_name} is read on demand, "
+                "it has to be the last field of a stream"
+            )
+
+        if hasattr(kind, "into_bits") and (width := kind.into_bits()):
+            _flush_struct_run(
+                struct_run, cls_locals, init_body, reprocessors_dict
+            )
+            if bit_run and bit_run[-1][1].bit_order() != kind.bit_order():
+                _flush_bit_run(
+                    bit_run,
+                    cls_locals,
+                    par_counter,
+                    init_body,
+                    reprocessors_dict,
+                )
+            bit_run.append((field_name, kind, width))
+            continue
+
+        _flush_bit_run(
+            bit_run, cls_locals, par_counter, init_body, reprocessors_dict
+        )
+
+        if hasattr(kind, "into_struct") and (
+            field := kind.into_struct(
+                cls_locals=cls_locals, par_counter=par_counter
+            )
+        ):
+            if field.byteorder is None and primitive_name is not None:
+                field = replace(
+                    field,
+                    byteorder=cls_locals[primitive_name].byteorder,
+                )
+            if (
+                struct_run
+                and struct_run[-1][1].byteorder != field.byteorder
+            ):
+                _flush_struct_run(
+                    struct_run, cls_locals, init_body, reprocessors_dict
+                )
+            struct_run.append((field_name, field))
+            continue
+
+        _flush_struct_run(
+            struct_run, cls_locals, init_body, reprocessors_dict
+        )
+
         call = kind.into_call(
-            cls_locals=cls_locals, reprocessors_dict=reprocessors_dict
+            cls_locals=cls_locals,
+            par_counter=par_counter,
+            reprocessors_dict=reprocessors_dict,
         )
-        init_body.append(Assignment(assing_to=field_name, value=call))
+
+        if (
+            lazy
+            and field_name not in referenced
+            and hasattr(kind, "into_skip_call")
+            and (
+                skip := kind.into_skip_call(
+                    cls_locals=cls_locals, par_counter=par_counter
+                )
+            )
+        ):
+            load: Tuple[str, ...] = (f"return {call!r}",)
+            if primitive_name is not None:
+                load = _in_byteorder(load, primitive_name)
+            lazy_fields[field_name] = _create_fn(
+                f"__duckparse_lazy_{field_name}__",
+                ("self",),
+                (f"{READER_NAME} = self.reader", *load),
+                locals=cls_locals,
+            )
+            init_body.append(Defer(assing_to=field_name, skip=skip))
+        else:
+            init_body.append(Assignment(assing_to=field_name, value=call))
 
         if reprocessor := reprocessors_dict.get(field_name):
             init_body.extend(reprocessor)
 
+    _flush_bit_run(
+        bit_run, cls_locals, par_counter, init_body, reprocessors_dict
+    )
+    _flush_struct_run(
+        struct_run, cls_locals, init_body, reprocessors_dict
+    )
+
     setattr(
-        cls, "__init__", _make_init(init_body, cls_locals, is_section)
+        cls,
+        LAYOUT_FIELD,
+        compute_layout(
+            cls_annotations,
+            relocatable=not hasattr(cls, PREFUNCTION_FIELD),
+        ),
     )
+
+    # a single run of plain primitives maps to a numpy record, unless
+    # the record would lose what the class adds to its fields
+    if (
+        not defines_members
+        and len(init_body) == 1
+        and isinstance(statement := init_body[0], Unpack)
+        and not statement.converters
+    ):
+        setattr(
+            cls,
+            STRUCT_LAYOUT_FIELD,
+            tuple(
+                (field_name, f"{statement.byteorder or ''}{fmt}")
+                for field_name, fmt in zip(
+                    statement.assing_to, statement.formats
+                )
+            ),
+        )
+
+    for field_name, loader in lazy_fields.items():
+        setattr(cls, field_name, LazyField(field_name, loader))
+
+    if as_tuple:
+        if hasattr(cls, PREFUNCTION_FIELD) or not all(
+            isinstance(statement, Unpack) for statement in init_body
+        ):
+            raise ValueError(
+                f"{resolve(cls)} can not be a tuple, "
+                "it has to be only fixed-size fields without hooks"
+            )
+        setattr(
+            cls, "__new__", staticmethod(_make_new(init_body, cls_locals))
+        )
+    else:
+        setattr(
+            cls,
+            "__init__",
+            _make_init(
+                init_body,
+                cls_locals,
+                is_section,
+                lazy=bool(lazy_fields),
+                # only lazy fields need the reader after `__init__`
+                keep_reader=not slots or bool(lazy_fields),
+                primitive_name=primitive_name,
+            ),
+        )
     setattr(
         cls, "__repr__", _make_repr(resolve(cls), init_body, cls_locals)
     )
     setattr(cls, "into_call", classmethod(_ss_into_call))
+    setattr(cls, "into_skip_call", classmethod(_ss_into_skip_call))
+    setattr(cls, "parse_async", classmethod(parse_async))
+    if not as_tuple and "__getstate__" not in cls.__dict__:
+        setattr(cls, "__getstate__", _getstate)
+
+    if as_tuple:
+        cls = cast(
+            T,
+            _add_tuple_base(
+                cast(type, cls), tuple(_assigned_fields(init_body))
+            ),
+        )
+    elif slots:
+        fields = dict.fromkeys(
+            field_name
+            for field_name in _assigned_fields(init_body)
+            if field_name not in lazy_fields
+        )
+        if lazy_fields:
+            # decoded lazy fields are cached in `__dict__`
+            fields.update(
+                dict.fromkeys(("reader", LAZY_OFFSETS_FIELD, "__dict__"))
+            )
+        cls = cast(T, _add_slots(cast(type, cls), fields))
 
     return cls
 
@@ -184,10 +759,44 @@ def stream(cls: T) -> Union[Callable, T]:
     return wrap(cls)
 
 
-def section(cls: T) -> Union[Callable, T]:
+def section(
+    cls: Optional[T] = None,
+    *,
+    lazy: bool = False,
+    slots: bool = False,
+    as_tuple: bool = False,
+    endian: Optional[str] = None,
+) -> Union[Callable, T]:
+    """
+    With `lazy=True`, fields which can be skipped without decoding
+    (`Byte`, `Array`, `String` and static-size sections) and are not
+    referenced by a later field are only decoded on first access.
+
+    With `slots=True`, the class gets `__slots__` for its fields and
+    does not keep the reader unless it has lazy fields, for sections
+    which are parsed by the million.
+
+    With `as_tuple=True`, a section of only fixed-size fields is a
+    `tuple` subclass with a property per field, built straight from the
+    unpacked struct.
+
+    With `endian="big"` or `endian="little"`, the section is read in
+    that byte order whatever the reader's is. Fixed-size fields get it
+    compiled into their struct, other fields and nested sections without
+    an `endian` of their own read with the reader's `primitive` set to
+    it. Kinds like `U32be` always keep their own.
+    """
+
     def wrap(cls: T) -> T:
         setattr(cls, STREAM_TYPE_FIELD, StreamType.SECTION)
-        return _process_class(cls, is_section=True)
+        return _process_class(
+            cls,
+            is_section=True,
+            lazy=lazy,
+            slots=slots,
+            as_tuple=as_tuple,
+            endian=endian,
+        )
 
     if cls is None:
         return wrap
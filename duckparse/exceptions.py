@@ -10,3 +10,13 @@ class ValidationError(Exception):
         return (
             f"expected {list(self.expected)}, found {list(self.found)} "
         )
+
+
+@dataclass
+class IncompleteRead(Exception):
+    """The data ran out, but at least `needed` more bytes are coming."""
+
+    needed: int
+
+    def __str__(self) -> str:
+        return f"{self.needed} more bytes are needed"
@@ -0,0 +1,76 @@
+"""
+Parse records out of data which arrives in chunks, like a capture
+coming off the network or a log file which is still written to:
+
+    parser = IncrementalParser(PkSection)
+    for chunk in chunks:
+        for section in parser.feed(chunk):
+            ...
+    sections = parser.close()
+
+Only the record which is still incomplete is kept, and it is only
+parsed again once at least as much data arrived as it was missing.
+"""
+
+from .exceptions import IncompleteRead
+from .reader import FeedReader
+
+from typing import Any, Callable, Generic, List, TypeVar
+
+__all__ = ["IncrementalParser"]
+
+T = TypeVar("T")
+
+
+class IncrementalParser(Generic[T]):
+    """
+    `feed` returns the records completed by a chunk, `close` the rest
+    and raises as a parse of truncated data would, if a record is cut.
+    Records are read with `Reader.read_bytes`, so they do not point
+    into the data kept for the next record.
+    """
+
+    def __init__(
+        self, cls: Callable[[FeedReader], T], **reader_options: Any
+    ):
+        self.cls = cls
+        self.reader = FeedReader(**reader_options)
+        # nothing can complete before this much is buffered
+        self.ready_at = 0
+
+    @property
+    def offset(self) -> int:
+        """Where the next record starts, counting from the first chunk."""
+        return self.reader.offset
+
+    def feed(self, data: bytes) -> List[T]:
+        if not data:
+            return []
+        reader = self.reader
+        reader.feed(data)
+        if reader.base + len(reader.buffer) < self.ready_at:
+            return []
+        return self._parse()
+
+    def close(self) -> List[T]:
+        self.reader.feed(b"")
+        return self._parse()
+
+    def _parse(self) -> List[T]:
+        reader = self.reader
+        records = []
+        while True:
+            start = reader.offset
+            try:
+                if reader.at_eof():
+                    break
+                record = self.cls(reader)
+            except IncompleteRead as error:
+                reader._realign(start)
+                self.ready_at = (
+                    reader.base + len(reader.buffer) + error.needed
+                )
+                break
+            records.append(record)
+            reader.trim()
+        return records
@@ -1,6 +1,7 @@
+from struct import calcsize
 from dataclasses import dataclass
 
-from .consts import READER_NAME
+from .consts import READER_NAME, LAZY_OFFSETS_FIELD
 
 from typing import (
     Optional,
@@ -25,6 +26,16 @@ class Call:
         return f"{self.function_name}({self.params})"
 
 
+@dataclass
+class Name:
+    """A local of the generated function."""
+
+    name: str
+
+    def __repr__(self) -> str:
+        return self.name
+
+
 @dataclass
 class Assignment:
     value: Call
@@ -37,6 +48,151 @@ class Assignment:
             return repr(self.value)
 
 
+@dataclass
+class Hook(Assignment):
+    """
+    The call of `__duckparse_first__`. Hooks used to seek `reader.io`
+    directly, so `io` is where the reader is before the hook, and the
+    reader catches up with wherever it is afterwards.
+    """
+
+    def __repr__(self) -> str:
+        return "\n".join(
+            (
+                f"synced = {READER_NAME}.sync()",
+                "try:",
+                f"    {self.value!r}",
+                "except AttributeError as error:",
+                f"    {READER_NAME}.hook_error(error)",
+                f"{READER_NAME}.resync(synced)",
+            )
+        )
+
+
+@dataclass
+class StructField:
+    format: str
+    convert: Optional[str] = None
+    # "<" or ">" when the kind has a byte order of its own
+    byteorder: Optional[str] = None
+
+
+@dataclass
+class Unpack:
+    struct_name: str
+    assing_to: Tuple[str, ...]
+    formats: Tuple[str, ...]
+    converters: Dict[str, str]
+    byteorder: Optional[str] = None
+
+    @property
+    def size(self) -> int:
+        return calcsize(f"<{''.join(self.formats)}")
+
+    def _read(self, targets: str) -> List[str]:
+        # `Reader.read_struct` inlined, `struct_name` holds the
+        # `unpack_from` of each byte order, or the only one of a run
+        # with a fixed byte order
+        size = self.size
+        unpack = self.struct_name
+        if self.byteorder is None:
+            unpack += f"[{READER_NAME}.primitive.byteorder]"
+        return [
+            f"at = {READER_NAME}.offset - {READER_NAME}.base",
+            f"if at + {size} > len({READER_NAME}.buffer):",
+            f"    at = {READER_NAME}.fill({size})",
+            f"{targets} = {unpack}({READER_NAME}.buffer, at)",
+            f"{READER_NAME}.offset += {size}",
+        ]
+
+    def __repr__(self) -> str:
+        targets = ", ".join(f"self.{name}" for name in self.assing_to)
+        lines = self._read(f"{targets},")
+        lines.extend(
+            f"self.{name} = {convert}(self.{name})"
+            for name, convert in self.converters.items()
+        )
+        return "\n".join(lines)
+
+    def into_values(self) -> str:
+        """The run as a tuple in the local `values`, converted."""
+        lines = self._read("values")
+        if self.converters:
+            converted = ", ".join(
+                (
+                    f"{self.converters[name]}(values[{index}])"
+                    if name in self.converters
+                    else f"values[{index}]"
+                )
+                for index, name in enumerate(self.assing_to)
+            )
+            lines.append(f"values = ({converted},)")
+        return "\n".join(lines)
+
+
+@dataclass
+class BitGroup:
+    """
+    Consecutive `Bits` fields which fill whole bytes. They are read as
+    one int and every field is shifted and masked out of it, unless bits
+    of an earlier byte are still pending. `Bitsbe` fields are taken from
+    the most significant bit of a big-endian int.
+    """
+
+    assing_to: Tuple[str, ...]
+    widths: Tuple[int, ...]
+    calls: Tuple[Call, ...]
+    bit_order: str = "little"
+
+    @property
+    def size(self) -> int:
+        return sum(self.widths) // 8
+
+    def __repr__(self) -> str:
+        size = self.size
+        lines = [f"if {READER_NAME}.bits_pending:"]
+        lines.extend(
+            f"    self.{name} = {call!r}"
+            for name, call in zip(self.assing_to, self.calls)
+        )
+        lines += [
+            "else:",
+            f"    at = {READER_NAME}.offset - {READER_NAME}.base",
+            f"    if at + {size} > len({READER_NAME}.buffer):",
+            f"        at = {READER_NAME}.fill({size})",
+            f"        if at + {size} > len({READER_NAME}.buffer):",
+            f"            raise EOFError("
+            f'"{sum(self.widths)} bits past the end")',
+            f"    bits = int.from_bytes("
+            f"{READER_NAME}.buffer[at : at + {size}], "
+            f"{self.bit_order!r})",
+            f"    {READER_NAME}.offset += {size}",
+        ]
+        shift = 0 if self.bit_order == "little" else sum(self.widths)
+        for name, width in zip(self.assing_to, self.widths):
+            if self.bit_order != "little":
+                shift -= width
+            value = f"(bits >> {shift})" if shift else "bits"
+            lines.append(
+                f"    self.{name} = {value} & {(1 << width) - 1:#x}"
+            )
+            if self.bit_order == "little":
+                shift += width
+        return "\n".join(lines)
+
+
+@dataclass
+class Defer:
+    assing_to: str
+    skip: Call
+
+    def __repr__(self) -> str:
+        return (
+            f'self.{LAZY_OFFSETS_FIELD}["{self.assing_to}"] = '
+            f"{READER_NAME}.tell()\n{self.skip!r}"
+        )
+
+
 @runtime_checkable
 class Kind(Protocol):
     kind_locals: Optional[Dict[str, Any]] = None
@@ -1,18 +1,42 @@
+import re
 from enum import Enum
-from dataclasses import dataclass
-
-from .utils import generic_repeat, whilor, resolve
+from struct import calcsize
+from functools import partial
+from dataclasses import dataclass, replace
+
+from .utils import (
+    generic_repeat,
+    generic_iterate,
+    until_eof,
+    repeat_packed,
+    repeat_records,
+    repeat_indexed,
+    resolve,
+    skip_bytes,
+    skip_with,
+)
 
 from .reader import Reader
-from .kindprotocol import Kind, Assignment, Call
+from .c_types import compile_struct, split_byteorder
+from .analysis import static_size
+from .kindprotocol import Kind, Assignment, Call, Name, StructField
 
 from .consts import (
+    READER_NAME,
     ENUM_FIELD,
     DATAKIND_GUARD_FIELD,
     REPROCESS_AFTER_FIELD,
     REPROCESS_ASSIGN_TO_FIELD,
     REPROCESSOR_FUNCTION_FIELD,
     PROCESSOR_FUNCTION_FIELD,
+    STRUCT_FORMAT_FIELD,
+    STRUCT_CONVERT_FIELD,
+    BIT_WIDTH_FIELD,
+    BIT_ORDER_FIELD,
+    SKIP_FUNCTION_FIELD,
+    STRUCT_LAYOUT_FIELD,
+    STATIC_SIZE_FUNCTION_FIELD,
+    STREAM_TYPE_FIELD,
 )
 
 from typing import (
@@ -53,6 +77,56 @@ class DataKind(Kind):
             kind_locals=self.kind_locals,
         )
 
+    def _into_params(
+        self,
+        cls_locals: Dict[str, Any],
+        par_counter: List[int],
+        reprocessors_dict: Dict[str, List[Assignment]],
+    ) -> str:
+        if not self.params:
+            return ""
+
+        kind_name = resolve(self.base_cls)
+        params_as_list: List[Any] = list()
+        for item in self.params:
+            if isinstance(
+                item,
+                (
+                    int,
+                    str,
+                    bool,
+                    bytes,
+                    bytearray,
+                    VarKind,
+                    type(Ellipsis),
+                    type(None),
+                ),
+            ):
+                params_as_list.append(item)
+            elif isinstance(item, Kind) or hasattr(
+                item, DATAKIND_GUARD_FIELD
+            ):
+                if hasattr(item, DATAKIND_GUARD_FIELD) and not isinstance(
+                    item, Kind
+                ):
+                    item = item()
+
+                params_as_list.append(
+                    item.into_call(
+                        cls_locals,
+                        par_counter=par_counter,
+                        reprocessors_dict=reprocessors_dict,
+                    )
+                )
+                par_counter[0] += 1
+            else:
+                param_name = f"__{kind_name}_par{par_counter[0]}__"
+                cls_locals[param_name] = item
+                par_counter[0] += 1
+                params_as_list.append(Name(param_name))
+
+        return f'({", ".join(map(repr, params_as_list))},)'
+
     def into_call(
         self,
         cls_locals: Dict[str, Any],
@@ -65,7 +139,29 @@ class DataKind(Kind):
             reprocessors_dict = dict()
 
         kind_name = resolve(self.base_cls)
-        params = ""
+
+        if field := self.into_struct(cls_locals, par_counter=par_counter):
+            # a fixed-size kind is one unpack, without going through
+            # `__processor__` and `read_bytes`
+            struct_name = (
+                f"__duckparse_struct_{kind_name}_{par_counter[0]}__"
+            )
+            cls_locals[struct_name] = compile_struct(
+                field.format, field.byteorder
+            )
+            par_counter[0] += 1
+            value = Call(
+                function_name=f"{READER_NAME}.read_value",
+                params=struct_name,
+                reader_as_param=False,
+            )
+            if field.convert is None:
+                return value
+            return Call(
+                function_name=field.convert,
+                params=repr(value),
+                reader_as_param=False,
+            )
 
         if hasattr(self.base_cls, REPROCESS_AFTER_FIELD) and hasattr(
             self.base_cls, REPROCESS_ASSIGN_TO_FIELD
@@ -88,46 +184,11 @@ class DataKind(Kind):
             )
             par_counter[0] += 1
 
-        if self.params:
-            params_as_list = list()
-            for item in self.params:
-                if isinstance(
-                    item,
-                    (
-                        int,
-                        str,
-                        bool,
-                        bytes,
-                        bytearray,
-                        VarKind,
-                        type(Ellipsis),
-                        type(None),
-                    ),
-                ):
-                    params_as_list.append(item)
-                elif isinstance(item, Kind) or hasattr(
-                    item, DATAKIND_GUARD_FIELD
-                ):
-                    if hasattr(
-                        item, DATAKIND_GUARD_FIELD
-                    ) and not isinstance(item, Kind):
-                        item = item()
-
-                    params_as_list.append(
-                        item.into_call(
-                            cls_locals,
-                            par_counter=par_counter,
-                            reprocessors_dict=reprocessors_dict,
-                        )
-                    )
-                    par_counter[0] += 1
-                else:
-                    param_name = f"__{kind_name}_par{par_counter[0]}__"
-                    cls_locals[param_name] = item
-                    par_counter[0] += 1
-                    params_as_list.append(param_name)
-
-            params = f'({", ".join(map(repr, params_as_list))},)'
+        params = self._into_params(
+            cls_locals,
+            par_counter=par_counter,
+            reprocessors_dict=reprocessors_dict,
+        )
 
         instance = self.base_cls()
         function_name = (
@@ -139,6 +200,149 @@ class DataKind(Kind):
 
         return Call(function_name=function_name, params=params,)
 
+    def into_skip_call(
+        self,
+        cls_locals: Dict[str, Any],
+        par_counter: Optional[List[int]] = None,
+    ) -> Optional[Call]:
+        if par_counter is None:
+            par_counter = [0]
+
+        if hasattr(self.base_cls, REPROCESS_AFTER_FIELD):
+            return None
+
+        if not hasattr(self.base_cls, SKIP_FUNCTION_FIELD):
+            # fixed-size kinds are skipped by their struct size
+            if field := self.into_struct(cls_locals, par_counter):
+                return Call(
+                    function_name=f"{READER_NAME}.skip",
+                    params=str(calcsize(f"<{field.format}")),
+                    reader_as_param=False,
+                )
+            return None
+        # nested kinds in the params would be read while skipping
+        if self.params and any(
+            not isinstance(item, VarKind)
+            and (
+                isinstance(item, Kind)
+                or hasattr(item, DATAKIND_GUARD_FIELD)
+            )
+            for item in self.params
+        ):
+            return None
+
+        params = self._into_params(
+            cls_locals, par_counter=par_counter, reprocessors_dict=dict()
+        )
+
+        kind_name = resolve(self.base_cls)
+        function_name = (
+            f"__duckparse_skipper_{kind_name}_{par_counter[0]}__"
+        )
+        cls_locals[function_name] = getattr(
+            self.base_cls(), SKIP_FUNCTION_FIELD
+        )
+        par_counter[0] += 1
+
+        return Call(
+            function_name=function_name,
+            params=params,
+        )
+
+    def static_size(self) -> Optional[int]:
+        if field := self.into_struct(dict()):
+            return calcsize(f"<{field.format}")
+        if hasattr(self.base_cls, STATIC_SIZE_FUNCTION_FIELD):
+            return getattr(self.base_cls(), STATIC_SIZE_FUNCTION_FIELD)(
+                self.params
+            )
+        return None
+
+    def into_bits(self) -> Optional[int]:
+        # the width of a bit field which is known at decoration time
+        if not hasattr(self.base_cls, BIT_WIDTH_FIELD) or any(
+            isinstance(item, (VarKind, Kind))
+            or hasattr(item, DATAKIND_GUARD_FIELD)
+            for item in self.params or ()
+        ):
+            return None
+        return getattr(self.base_cls(), BIT_WIDTH_FIELD)(self.params)
+
+    def bit_order(self) -> str:
+        return getattr(self.base_cls, BIT_ORDER_FIELD, "little")
+
+    def into_struct(
+        self,
+        cls_locals: Dict[str, Any],
+        par_counter: Optional[List[int]] = None,
+    ) -> Optional[StructField]:
+        if par_counter is None:
+            par_counter = [0]
+
+        if hasattr(self.base_cls, REPROCESS_AFTER_FIELD):
+            return None
+
+        kind_name = resolve(self.base_cls)
+
+        if hasattr(self.base_cls, ENUM_FIELD):
+            # an enum over a fixed-size kind is fused as its inner kind
+            if not self.params or len(self.params) != 1:
+                return None
+            (inner,) = self.params
+            if not isinstance(inner, DataKind):
+                return None
+            field = inner.into_struct(cls_locals, par_counter=par_counter)
+            if field is None or field.convert is not None:
+                return None
+            enum_name = (
+                f"__duckparse_convert_{kind_name}_{par_counter[0]}__"
+            )
+            cls_locals[enum_name] = getattr(self.base_cls, ENUM_FIELD)
+            par_counter[0] += 1
+            return StructField(
+                format=field.format,
+                convert=enum_name,
+                byteorder=field.byteorder,
+            )
+
+        struct_format = getattr(self.base_cls, STRUCT_FORMAT_FIELD, None)
+        if struct_format is None:
+            return None
+
+        instance = self.base_cls()
+        if callable(struct_format):
+            # the format depends on the params, so they have to be known
+            # at decoration time
+            if not self.params or any(
+                isinstance(item, (VarKind, Kind))
+                or hasattr(item, DATAKIND_GUARD_FIELD)
+                for item in self.params
+            ):
+                return None
+            struct_format = getattr(instance, STRUCT_FORMAT_FIELD)(
+                self.params
+            )
+        elif self.params:
+            return None
+
+        convert_name: Optional[str] = None
+        if hasattr(instance, STRUCT_CONVERT_FIELD):
+            convert_name = (
+                f"__duckparse_convert_{kind_name}_{par_counter[0]}__"
+            )
+            convert = getattr(instance, STRUCT_CONVERT_FIELD)
+            cls_locals[convert_name] = partial(
+                convert, params=self.params
+            )
+            par_counter[0] += 1
+
+        byteorder, struct_format = split_byteorder(struct_format)
+        return StructField(
+            format=struct_format,
+            convert=convert_name,
+            byteorder=byteorder,
+        )
+
 
 def datakind(cls) -> Union[Callable, DataKind]:
     def wrap(cls) -> DataKind:
@@ -215,11 +419,297 @@ class RepeatN(RepeatKind):
         body, condition = params
         return cls(condition=condition, body=body)
 
+    def into_call(
+        self,
+        cls_locals: Dict[str, Any],
+        par_counter: Optional[List[int]] = None,
+        reprocessors_dict: Optional[Dict[str, List[Assignment]]] = None,
+    ) -> Call:
+        if par_counter is None:
+            par_counter = [0]
+
+        # a single primitive can be decoded for all elements at once
+        if (
+            isinstance(self.body, DataKind)
+            and (field := self.body.into_struct(cls_locals, par_counter))
+            and field.convert is None
+            and len(field.format) == 1
+        ):
+            function_name = "__duckparse_repeat_packed__"
+            cls_locals[function_name] = repeat_packed
+            return Call(
+                function_name=function_name,
+                params=f"{field.format!r}, {self.condition}, "
+                f"{field.byteorder!r}",
+            )
+
+        # and so can a section made only of primitives
+        if layout := getattr(self.body, STRUCT_LAYOUT_FIELD, None):
+            function_name = "__duckparse_repeat_records__"
+            cls_locals[function_name] = repeat_records
+            layout_name = f"__duckparse_layout_{par_counter[0]}__"
+            cls_locals[layout_name] = layout
+            par_counter[0] += 1
+            body = self.body.into_call(
+                cls_locals=cls_locals,
+                par_counter=par_counter,
+                reprocessors_dict=reprocessors_dict,
+            )
+            return Call(
+                function_name=function_name,
+                params=f"{layout_name}, lambda: {body!r}, "
+                f"{self.condition}",
+            )
+
+        return super().into_call(
+            cls_locals,
+            par_counter=par_counter,
+            reprocessors_dict=reprocessors_dict,
+        )
+
+
+class IndexedN(RepeatKind):
+    """
+    Like `RepeatN` for a body with a static size, but the records are
+    only parsed when they are indexed, so looking up one record out of
+    millions costs one parse. The reader has to stay open.
+    """
+
+    def __class_getitem__(cls, params: Tuple[Kind, str]):
+        assert isinstance(params, tuple)
+        assert len(params) == 2
+        body, condition = params
+        return cls(condition=condition, body=body)
+
+    def into_call(
+        self,
+        cls_locals: Dict[str, Any],
+        par_counter: Optional[List[int]] = None,
+        reprocessors_dict: Optional[Dict[str, List[Assignment]]] = None,
+    ) -> Call:
+        if par_counter is None:
+            par_counter = [0]
+
+        if (size := static_size(self.body)) is None:
+            raise ValueError(f"{resolve(self.body)} has no static size")
+
+        function_name = "__duckparse_repeat_indexed__"
+        cls_locals[function_name] = repeat_indexed
+
+        new_body = self.body.into_call(
+            cls_locals=cls_locals,
+            par_counter=par_counter,
+            reprocessors_dict=reprocessors_dict,
+        )
+
+        return Call(
+            function_name=function_name,
+            params=f"lambda: {new_body!r}, {size}, {self.condition}",
+        )
+
 
 class RepeatEOS(RepeatKind):
     def __class_getitem__(cls, body: Kind):
+        # the reader keeps its own position, so this is an attribute
+        # comparison per element instead of a lambda and an `io.tell()`
         return cls(
-            condition="whilor(lambda: self.reader.io.tell() != self.reader.size)",
+            condition=f"until_eof({READER_NAME})",
             body=body,
-            kind_locals={"whilor": whilor},
+            kind_locals={"until_eof": until_eof},
+        )
+
+
+@dataclass
+class SkipKind(Kind):
+    """
+    `Skip[n]` moves the reader `n` bytes forward without reading them,
+    `n` can be an int, a `Var` or an expression. `Skip[kind]` skips
+    whatever `kind` would have read, e.g. `Skip[Byte[Var("len")]]`.
+    Either way the field holds the `Span` that was skipped.
+    """
+
+    body: Any
+    kind_locals: Optional[Dict[str, Any]] = None
+
+    def __class_getitem__(cls, body: Any) -> "SkipKind":
+        return cls(body=body)
+
+    def into_call(
+        self,
+        cls_locals: Dict[str, Any],
+        par_counter: Optional[List[int]] = None,
+        reprocessors_dict: Optional[Dict[str, List[Assignment]]] = None,
+    ) -> Call:
+        if par_counter is None:
+            par_counter = [0]
+
+        if isinstance(self.body, (int, str, VarKind)):
+            function_name = "__duckparse_skip_bytes__"
+            cls_locals[function_name] = skip_bytes
+            size = (
+                self.body
+                if isinstance(self.body, str)
+                else repr(self.body)
+            )
+            return Call(function_name=function_name, params=size)
+
+        body = self.body
+        if hasattr(body, DATAKIND_GUARD_FIELD) and not isinstance(
+            body, Kind
+        ):
+            body = body()
+        if not hasattr(body, "into_skip_call") or not (
+            skip := body.into_skip_call(
+                cls_locals=cls_locals, par_counter=par_counter
+            )
+        ):
+            raise ValueError(f"{resolve(body)} can not be skipped")
+
+        function_name = "__duckparse_skip_with__"
+        cls_locals[function_name] = skip_with
+        return Call(
+            function_name=function_name, params=f"lambda: {skip!r}"
+        )
+
+    def into_skip_call(
+        self,
+        cls_locals: Dict[str, Any],
+        par_counter: Optional[List[int]] = None,
+    ) -> Call:
+        return self.into_call(cls_locals, par_counter=par_counter)
+
+    def static_size(self) -> Optional[int]:
+        if isinstance(self.body, int):
+            return self.body
+        if isinstance(self.body, (str, VarKind)):
+            return None
+        return static_size(self.body)
+
+
+class IterEOS(RepeatEOS):
+    """
+    Like `RepeatEOS`, but the field is a generator which parses the
+    next element only when it is pulled, so it has to be the last field
+    of a stream.
+    """
+
+    consumes_rest = True
+
+    def into_call(
+        self,
+        cls_locals: Dict[str, Any],
+        par_counter: Optional[List[int]] = None,
+        reprocessors_dict: Optional[Dict[str, List[Assignment]]] = None,
+    ) -> Call:
+        call = super().into_call(
+            cls_locals,
+            par_counter=par_counter,
+            reprocessors_dict=reprocessors_dict,
+        )
+        function_name = "__duckparse_generic_iterate__"
+        cls_locals[function_name] = generic_iterate
+        return replace(call, function_name=function_name)
+
+
+@dataclass
+class SwitchKind(Kind):
+    """
+    `Switch[tag, {value: kind, ...}]` reads the kind of the case which
+    `tag` matches, `tag` is a `Var` or an expression. An optional third
+    parameter is the kind for every other tag, without one an unknown
+    tag raises a KeyError. The cases are looked up in a dict of
+    sections and generated functions, instead of an if-chain.
+    """
+
+    tag: Any
+    cases: Dict[Any, Any]
+    default: Any = None
+    kind_locals: Optional[Dict[str, Any]] = None
+
+    def __class_getitem__(cls, params: Tuple[Any, ...]) -> "SwitchKind":
+        assert isinstance(params, tuple)
+        assert len(params) in (2, 3)
+        return cls(*params)
+
+    def into_call(
+        self,
+        cls_locals: Dict[str, Any],
+        par_counter: Optional[List[int]] = None,
+        reprocessors_dict: Optional[Dict[str, List[Assignment]]] = None,
+    ) -> Call:
+        # `duckparse` imports this module
+        from .duckparse import _create_fn
+
+        if par_counter is None:
+            par_counter = [0]
+
+        cases = []
+        kinds = list(self.cases.items())
+        if self.default is not None:
+            kinds.append((None, self.default))
+        for value, kind in kinds:
+            if hasattr(kind, DATAKIND_GUARD_FIELD) and not isinstance(
+                kind, Kind
+            ):
+                kind = kind()
+            call = kind.into_call(
+                cls_locals,
+                par_counter=par_counter,
+                reprocessors_dict=reprocessors_dict,
+            )
+            cases.append((value, kind, call))
+
+        # without a `Var` in any case, the cases only need the reader and
+        # a section is its own case
+        uses_self = any(
+            re.search(r"\bself\b", repr(call)) for _, _, call in cases
         )
+        args = ("self", READER_NAME) if uses_self else (READER_NAME,)
+
+        functions = []
+        for _, kind, call in cases:
+            if not uses_self and hasattr(kind, STREAM_TYPE_FIELD):
+                functions.append(kind)
+                continue
+            function_name = f"__duckparse_case_{par_counter[0]}__"
+            par_counter[0] += 1
+            cls_locals[function_name] = _create_fn(
+                function_name,
+                args,
+                (f"return {call!r}",),
+                locals=cls_locals,
+            )
+            functions.append(cls_locals[function_name])
+
+        table_name = f"__duckparse_switch_{par_counter[0]}__"
+        cls_locals[table_name] = dict(
+            zip(
+                (value for value, _, _ in cases[: len(self.cases)]),
+                functions,
+            )
+        )
+        par_counter[0] += 1
+
+        tag = self.tag if isinstance(self.tag, str) else repr(self.tag)
+        if self.default is None:
+            function_name = f"{table_name}[{tag}]"
+        else:
+            default_name = f"__duckparse_default_{par_counter[0]}__"
+            cls_locals[default_name] = functions[-1]
+            par_counter[0] += 1
+            function_name = f"{table_name}.get({tag}, {default_name})"
+
+        return Call(
+            function_name=function_name,
+            params=", ".join(args),
+            reader_as_param=False,
+        )
+
+    def static_size(self) -> Optional[int]:
+        kinds = [*self.cases.values()]
+        if self.default is not None:
+            kinds.append(self.default)
+        sizes = {static_size(kind) for kind in kinds}
+        if len(sizes) == 1:
+            return sizes.pop()
+        return None
@@ -0,0 +1,250 @@
+"""
+Parse records of a file in worker processes.
+
+When a format indexes its records, like the central directory of a zip
+does with `ofs_local_header`, the records can be parsed in any order:
+
+    files = parse_at(PkSection, "archive.zip", offsets, workers=32)
+
+Every worker maps the file once and parses whole chunks of offsets, so
+only the offsets and the parsed records cross process boundaries.
+Parsed records are pickled without their reader and with `Byte` slices
+copied out of the map. Records parsed in this process are copied the
+same way, so they do not depend on where they were parsed.
+
+Back to back records which start with a marker, like the `PkSection`s
+a `RepeatEOS` walks through, can be parsed from byte ranges instead:
+
+    sections = parse_chunked(PkSection, "capture.zip", b"PK", workers=32)
+"""
+
+import os
+from copy import deepcopy
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from itertools import chain
+from os import PathLike
+
+from .reader import BufferReader, _find
+
+from typing import (
+    Any,
+    Callable,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+__all__ = ["parse_at", "parse_chunked"]
+
+# the file every worker process maps, see `_open`
+_reader: Optional[BufferReader] = None
+
+
+def _open(path: str) -> None:
+    global _reader
+    _reader = BufferReader.from_path(path)
+
+
+def _worker_reader() -> BufferReader:
+    assert _reader is not None, "`_open` maps the file in every worker"
+    return _reader
+
+
+def _detached(result: Any) -> Any:
+    # what pickling a result in a worker does, `_getstate` of sections,
+    # without sending it anywhere, so the map can be closed
+    return deepcopy(result)
+
+
+def _parse_chunk(
+    cls: type,
+    transform: Optional[Callable[[Any], Any]],
+    offsets: List[int],
+) -> List[Any]:
+    return _parse_offsets(_worker_reader(), cls, transform, offsets)
+
+
+def _parse_offsets(
+    reader: BufferReader,
+    cls: type,
+    transform: Optional[Callable[[Any], Any]],
+    offsets: List[int],
+) -> List[Any]:
+    results = []
+    for offset in offsets:
+        reader.seek(offset)
+        result = cls(reader)
+        results.append(result if transform is None else transform(result))
+    return results
+
+
+def parse_at(
+    cls: type,
+    path: Union[str, PathLike],
+    offsets: Iterable[int],
+    workers: Optional[int] = None,
+    chunksize: Optional[int] = None,
+    transform: Optional[Callable[[Any], Any]] = None,
+) -> List[Any]:
+    """
+    Parse `cls` at each of `offsets` in `path`, results are in the order
+    of `offsets`. `transform` runs in the workers on every result, to
+    send back only what is needed, as a tuple for example. `cls` and
+    `transform` have to be picklable, so defined at a module level.
+    """
+    path = os.fspath(path)
+    offsets = list(offsets)
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(offsets) < 2:
+        reader = BufferReader.from_path(path)
+        try:
+            return [
+                _detached(result)
+                for result in _parse_offsets(
+                    reader, cls, transform, offsets
+                )
+            ]
+        finally:
+            reader.close()
+
+    # a few chunks per worker, so a slow chunk does not hold up the end
+    chunksize = chunksize or -(-len(offsets) // (workers * 4))
+    chunks = [
+        offsets[start : start + chunksize]
+        for start in range(0, len(offsets), chunksize)
+    ]
+    with ProcessPoolExecutor(
+        max_workers=min(workers, len(chunks)),
+        initializer=_open,
+        initargs=(path,),
+    ) as pool:
+        parsed = pool.map(partial(_parse_chunk, cls, transform), chunks)
+        return list(chain.from_iterable(parsed))
+
+
+def _scan_chunk(
+    cls: type,
+    marker: bytes,
+    transform: Optional[Callable[[Any], Any]],
+    bounds: Tuple[int, int],
+) -> List[Tuple[int, int, Any]]:
+    return _scan(_worker_reader(), cls, marker, transform, bounds)
+
+
+def _scan(
+    reader: BufferReader,
+    cls: type,
+    marker: bytes,
+    transform: Optional[Callable[[Any], Any]],
+    bounds: Tuple[int, int],
+) -> List[Tuple[int, int, Any]]:
+    # every record starting in `bounds` as (start, end, record), the
+    # first marker might be in the middle of a record of the previous
+    # chunk, `_merge` sorts that out
+    start, end = bounds
+    results = []
+    position = _find(reader.buffer, marker, start, start, 1)
+    while position != -1 and position < end:
+        reader.seek(position)
+        try:
+            result = cls(reader)
+            found = reader.offset > position
+        except Exception:
+            found = False
+        if not found:
+            # not a record after all, look for the next marker
+            position = _find(
+                reader.buffer, marker, position + 1, position + 1, 1
+            )
+            continue
+        if transform is not None:
+            result = transform(result)
+        results.append((position, reader.offset, result))
+        position = reader.offset
+    return results
+
+
+def _merge(
+    reader: BufferReader,
+    cls: type,
+    size: int,
+    chunks: Iterable[Sequence[Tuple[int, int, Any]]],
+    transform: Optional[Callable[[Any], Any]],
+) -> List[Any]:
+    # keep the records on the chain a sequential walk from 0 follows,
+    # and walk the gaps where a chunk synced on a false marker
+    results = []
+    expected = 0
+
+    def walk() -> None:
+        nonlocal expected
+        reader.seek(expected)
+        result = cls(reader)
+        if transform is not None:
+            result = transform(result)
+        results.append(_detached(result))
+        expected = reader.offset
+
+    for chunk in chunks:
+        for start, end, result in chunk:
+            while expected < start:
+                walk()
+            if start == expected:
+                results.append(result)
+                expected = end
+    while expected < size:
+        walk()
+    return results
+
+
+def parse_chunked(
+    cls: type,
+    path: Union[str, PathLike],
+    marker: bytes,
+    workers: Optional[int] = None,
+    chunk_size: Optional[int] = None,
+    transform: Optional[Callable[[Any], Any]] = None,
+) -> List[Any]:
+    """
+    What `RepeatEOS[cls]` reads from `path`, for records which start
+    with `marker`. Each worker parses the records starting in its
+    ranges of `chunk_size` bytes, the result is the same as a single
+    sequential walk however often `marker` shows up inside records.
+    """
+    path = os.fspath(path)
+    size = os.path.getsize(path)
+    workers = workers or os.cpu_count() or 1
+    chunk_size = chunk_size or max(-(-size // (workers * 4)), 1)
+    bounds = [
+        (start, min(start + chunk_size, size))
+        for start in range(0, size, chunk_size)
+    ]
+    # the gaps are walked in this process, with one worker so is the rest
+    reader = BufferReader.from_path(path)
+    try:
+        if workers == 1 or len(bounds) < 2:
+            scan = partial(_scan, reader, cls, marker, transform)
+            scanned = (
+                [
+                    (start, end, _detached(result))
+                    for start, end, result in chunk
+                ]
+                for chunk in map(scan, bounds)
+            )
+            return _merge(reader, cls, size, scanned, transform)
+
+        with ProcessPoolExecutor(
+            max_workers=min(workers, len(bounds)),
+            initializer=_open,
+            initargs=(path,),
+        ) as pool:
+            chunks = pool.map(
+                partial(_scan_chunk, cls, marker, transform), bounds
+            )
+            return _merge(reader, cls, size, chunks, transform)
+    finally:
+        reader.close()
@@ -0,0 +1,276 @@
+"""
+Where a parse spends its time, by section and field:
+
+    result = profile(Zip, open("archive.zip", "rb"))
+    result.print_report()
+
+While `profile` runs, the parser and every section it reaches use
+constructors which time each statement of the generated code. A field
+is `Header.version`, a fused run of fixed-size fields is a single one,
+like `Header.width,height`, and a section itself, `Header`, covers
+all its fields. Each gets its calls, the time spent in it, the time
+spent in it and what it called, and the bytes it consumed.
+
+The result loads into `pstats`, as a `cProfile.Profile` would:
+
+    pstats.Stats(result).sort_stats("cumulative").print_stats(20)
+
+and `dump_collapsed` writes the stacks `flamegraph.pl` and speedscope
+read. A profiled parse is several times slower, and what timing its
+fields costs ends up in the tottime of their section.
+
+The instrumented constructors replace the classes' own until `profile`
+returns, so profile one parse at a time and do not parse the same
+classes from other threads meanwhile.
+"""
+
+import marshal
+import sys
+import time
+from dataclasses import dataclass, field
+
+from .consts import (
+    GENERATED_LOCALS_FIELD,
+    PROFILED_FIELD,
+    STREAM_TYPE_FIELD,
+)
+
+from typing import (
+    IO,
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    Type,
+)
+
+__all__ = ["profile", "Profile", "FieldStats"]
+
+# as in `pstats`, (module, statement number, section.field)
+Key = Tuple[str, int, str]
+
+SORT_KEYS = ("calls", "tottime", "cumtime", "size")
+
+
+@dataclass
+class FieldStats:
+    calls: int = 0
+    # calls which are not inside a call of the same field, like the
+    # primitive calls of `pstats`, recursive formats count once
+    primitive_calls: int = 0
+    # without the time of the fields and sections it called
+    tottime: float = 0.0
+    cumtime: float = 0.0
+    size: int = 0
+    # caller -> [calls, primitive calls, tottime, cumtime], the order
+    # of `pstats`
+    callers: Dict[Key, List[Any]] = field(default_factory=dict)
+
+
+class Profile:
+    """The timings of a parse, its `result` is what was parsed."""
+
+    def __init__(self) -> None:
+        self.result: Any = None
+        self.fields: Dict[Key, FieldStats] = {}
+        # the tottime of every section.field path, for flame graphs
+        self.stacks: Dict[Tuple[str, ...], float] = {}
+        self.stats: Dict[Key, Tuple[Any, ...]] = {}
+        # [key, start, offset, time spent in what it called]
+        self._frames: List[List[Any]] = []
+
+    def _enter(self, reader: Any, key: Key) -> None:
+        self._frames.append(
+            [key, time.perf_counter(), reader.offset, 0.0]
+        )
+
+    def _leave(self, reader: Any) -> None:
+        now = time.perf_counter()
+        key, start, offset, inner = self._frames.pop()
+        elapsed = now - start
+        stats = self.fields.get(key)
+        if stats is None:
+            stats = self.fields[key] = FieldStats()
+        primitive = all(frame[0] != key for frame in self._frames)
+
+        stats.calls += 1
+        stats.tottime += elapsed - inner
+        stats.size += reader.offset - offset
+        if primitive:
+            stats.primitive_calls += 1
+            stats.cumtime += elapsed
+
+        if self._frames:
+            parent = self._frames[-1]
+            parent[3] += elapsed
+            caller = stats.callers.setdefault(parent[0], [0, 0, 0.0, 0.0])
+            caller[0] += 1
+            caller[1] += primitive
+            caller[2] += elapsed - inner
+            caller[3] += elapsed if primitive else 0.0
+
+        path = (*(frame[0][2] for frame in self._frames), key[2])
+        self.stacks[path] = self.stacks.get(path, 0.0) + elapsed - inner
+
+    def create_stats(self) -> None:
+        """Fills `stats` the way `cProfile.Profile` does for `pstats`."""
+        self.stats = {
+            key: (
+                stats.primitive_calls,
+                stats.calls,
+                stats.tottime,
+                stats.cumtime,
+                {
+                    caller: tuple(timings)
+                    for caller, timings in stats.callers.items()
+                },
+            )
+            for key, stats in self.fields.items()
+        }
+
+    def dump_stats(self, path: str) -> None:
+        """A file `pstats.Stats` and tools like snakeviz can load."""
+        self.create_stats()
+        with open(path, "wb") as file:
+            marshal.dump(self.stats, file)
+
+    def collapsed(self) -> str:
+        """
+        One line per stack, `Zip;Zip.sections;PkSection 1520`, with the
+        microseconds spent in its last frame.
+        """
+        return "".join(
+            f"{';'.join(path)} {round(seconds * 1e6)}\n"
+            for path, seconds in self.stacks.items()
+            if round(seconds * 1e6)
+        )
+
+    def dump_collapsed(self, path: str) -> None:
+        with open(path, "w") as file:
+            file.write(self.collapsed())
+
+    def print_report(
+        self,
+        sort: str = "cumtime",
+        limit: Optional[int] = None,
+        file: Optional[IO[str]] = None,
+    ) -> None:
+        """The fields by `sort`, one of `SORT_KEYS`, slowest first."""
+        if sort not in SORT_KEYS:
+            raise ValueError(f"sort has to be one of {SORT_KEYS}")
+        file = file or sys.stdout
+        rows = sorted(
+            self.fields.items(),
+            key=lambda item: getattr(item[1], sort),
+            reverse=True,
+        )[:limit]
+        print(
+            f"{'calls':>10} {'tottime':>10} {'cumtime':>10} "
+            f"{'bytes':>12}  field",
+            file=file,
+        )
+        for (_, _, name), stats in rows:
+            calls = str(stats.calls)
+            if stats.primitive_calls != stats.calls:
+                calls = f"{stats.calls}/{stats.primitive_calls}"
+            print(
+                f"{calls:>10} {stats.tottime:10.6f} "
+                f"{stats.cumtime:10.6f} {stats.size:12}  {name}",
+                file=file,
+            )
+
+
+# the profile the instrumented constructors record into
+_current: Optional[Profile] = None
+# constructor -> its instrumented version, they are built once
+_instrumented: Dict[Callable, Callable] = {}
+
+
+def _enter(reader: Any, key: Key) -> None:
+    assert _current is not None
+    _current._enter(reader, key)
+
+
+def _leave(reader: Any) -> None:
+    assert _current is not None
+    _current._leave(reader)
+
+
+def _constructor(cls: type) -> Tuple[str, Optional[Callable]]:
+    # `__new__` for `section(as_tuple=True)`, `__init__` otherwise
+    new = cls.__dict__.get("__new__")
+    if isinstance(new, staticmethod):
+        return "__new__", new.__func__
+    return "__init__", cls.__dict__.get("__init__")
+
+
+def _reachable(cls: type) -> List[type]:
+    # the parsers in the locals of the generated code, nested sections,
+    # switch tables and case functions included
+    found: List[type] = []
+    seen = set()
+    pending: List[Any] = [cls]
+    while pending:
+        value = pending.pop()
+        if id(value) in seen:
+            continue
+        seen.add(id(value))
+        if isinstance(value, type):
+            if not hasattr(value, STREAM_TYPE_FIELD):
+                continue
+            _, constructor = _constructor(value)
+            if hasattr(constructor, PROFILED_FIELD):
+                found.append(value)
+                pending.append(constructor)
+        elif isinstance(value, dict):
+            pending.extend(value.values())
+        elif isinstance(value, (list, tuple)):
+            pending.extend(value)
+        elif hasattr(value, GENERATED_LOCALS_FIELD):
+            pending.append(getattr(value, GENERATED_LOCALS_FIELD))
+    return found
+
+
+def _instrument(cls: type) -> Tuple[str, Callable]:
+    name, constructor = _constructor(cls)
+    # only classes `_reachable` found, which have a constructor
+    assert constructor is not None
+    instrumented = _instrumented.get(constructor)
+    if instrumented is None:
+        instrumented = getattr(constructor, PROFILED_FIELD)(
+            profiled=(cls.__module__, cls.__qualname__)
+        )
+        _instrumented[constructor] = instrumented
+    if name == "__new__":
+        return name, staticmethod(instrumented)
+    return name, instrumented
+
+
+def profile(cls: Type[Any], source: Any) -> Profile:
+    """
+    Parse `cls` from `source`, as `cls(source)` would, and time every
+    section and field it reads. Fields of custom kinds are timed as a
+    whole, with the sections their processor parses inside them.
+    """
+    global _current
+    if _current is not None:
+        raise RuntimeError("a parse is already profiled")
+
+    result = Profile()
+    originals = {
+        klass: (name, klass.__dict__[name])
+        for klass in _reachable(cls)
+        for name in (_constructor(klass)[0],)
+    }
+    _current = result
+    try:
+        for klass in originals:
+            setattr(klass, *_instrument(klass))
+        result.result = cls(source)
+    finally:
+        for klass, (name, original) in originals.items():
+            setattr(klass, name, original)
+        _current = None
+    return result
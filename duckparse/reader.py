@@ -1,65 +1,300 @@
+import re
 import sys
-from os import SEEK_END, SEEK_SET
+from contextlib import suppress
+from functools import lru_cache
+from mmap import mmap, ACCESS_READ
+from os import SEEK_CUR, SEEK_END, SEEK_SET, PathLike
+from struct import Struct
 
 from .c_types import BigEndian, LittleEndian, _Ctypes
+from .exceptions import IncompleteRead
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 from typing import (
+    Any,
     BinaryIO,
+    Dict,
     Optional,
+    Pattern,
     Tuple,
+    Union,
 )
 
+Buffer = Union[bytes, bytearray, memoryview, mmap]
+
+
+@lru_cache(maxsize=None)
+def _terminator_pattern(terminator: bytes) -> Pattern[bytes]:
+    # unlike `find`, a pattern also searches memoryviews
+    return re.compile(re.escape(terminator))
+
+
+def _find(
+    haystack: Buffer, terminator: bytes, pos: int, start: int, step: int
+) -> int:
+    # the first `terminator` at or after `pos` which is `step` aligned
+    # to `start`, so "\x00\x00" can not match across two UTF-16 units
+    search = _terminator_pattern(terminator).search
+    while (match := search(haystack, pos)) is not None:
+        found = match.start()
+        if (found - start) % step == 0:
+            return found
+        pos = found + 1
+    return -1
+
+
+# how much `Reader` asks its stream for at once
+DEFAULT_BUFFER_SIZE = 64 * 1024
+
 
 @dataclass
 class Reader:
+    """
+    Fields are sliced or unpacked out of `buffer`, which holds the bytes
+    of `io` from the absolute position `base` on. `io` is only read in
+    chunks of `buffer_size`, when `fill` is asked for more than what is
+    buffered. The generated `__init__`s work on `buffer`, `base` and
+    `offset` directly.
+    """
+
     io: BinaryIO
 
-    size: int = 0
+    size: Optional[int] = 0
     endianness: str = sys.byteorder
     primitive: _Ctypes = LittleEndian
+    buffer_size: int = DEFAULT_BUFFER_SIZE
+    # our own position, so we never have to ask `io`
+    offset: int = field(init=False, default=0)
+    buffer: Buffer = field(init=False, default=b"", repr=False)
+    base: int = field(init=False, default=0)
+    # the bit state below is only valid while `offset` is `__bits_at`,
+    # so byte reads never have to reset it
+    __bits_at: int = field(init=False, default=-1, repr=False)
     # we have to save the last byte for bit operations
-    __last_byte: int = 0
+    __last_byte: int = field(init=False, default=0, repr=False)
     # its our bit counter
-    __bit_needle: int = 8
+    __needle: int = field(init=False, default=8, repr=False)
     # and this is our inverse bit counter
-    __remaining_bits: int = 0
-
-    if __debug__:
-        __current_byte: int = -1
+    __remaining: int = field(init=False, default=0, repr=False)
 
     def __post_init__(self):
-        self.__set_size()
+        # streams which only have `read`, `seek` and `tell` are seekable
+        seekable = getattr(self.io, "seekable", None)
+        if seekable is None or seekable():
+            self.offset = self.base = self.io.tell()
+            self.__set_size()
+        else:
+            # pipes and sockets, the end is only known once we reach it
+            self.size = None
         if self.endianness == "big":
             self.primitive = BigEndian
 
+    @property
+    def __current_byte(self) -> int:
+        return self.offset - 1
+
+    @property
+    def __bit_needle(self) -> int:
+        return self.__needle if self.__bits_at == self.offset else 8
+
+    @property
+    def bits_pending(self) -> bool:
+        """Some bits of a byte which was already read are left."""
+        return self.__bits_at == self.offset and self.__remaining > 0
+
+    @property
+    def remaining(self) -> Optional[int]:
+        if self.size is None:
+            return None
+        return self.size - self.offset
+
+    def at_eof(self) -> bool:
+        if self.size is None:
+            at = self.offset - self.base
+            if at == len(self.buffer):
+                at = self.fill(1)
+            return at == len(self.buffer)
+        return self.offset >= self.size
+
     def __set_size(self):
         cur = self.io.tell()
         self.io.seek(0, SEEK_END)
         self.size = self.io.tell()
         self.io.seek(cur, SEEK_SET)
 
+    def fill(self, size: int) -> int:
+        """
+        Buffer at least `size` bytes from `offset` on, unless the stream
+        ends first. Returns the index of `offset` in `buffer`.
+        """
+        # `read1` returns whatever one call to the raw stream gives, so a
+        # socket does not block for a whole chunk
+        read = getattr(self.io, "read1", self.io.read)
+        chunks = [self.buffer[self.offset - self.base :]]
+        available = len(chunks[0])
+        while available < size:
+            chunk = read(max(self.buffer_size, size - available))
+            if not chunk:
+                break
+            chunks.append(chunk)
+            available += len(chunk)
+        self.buffer = b"".join(chunks)
+        self.base = self.offset
+        return 0
+
+    def _read(self, size: int) -> Buffer:
+        at = self.offset - self.base
+        if at + size > len(self.buffer):
+            at = self.fill(size)
+        content = self.buffer[at : at + size]
+        self.offset += len(content)
+        return content
+
+    def seek(self, offset: int, whence: int = SEEK_SET) -> int:
+        if whence == SEEK_CUR:
+            offset, whence = self.offset + offset, SEEK_SET
+        # an empty buffer, like the one `sync` leaves, says nothing about
+        # where `io` is now
+        if (
+            whence == SEEK_SET
+            and (self.buffer or self.size is None)
+            and 0 <= offset - self.base <= len(self.buffer)
+        ):
+            # still inside the read-ahead buffer
+            self._realign(offset)
+            return offset
+        if (
+            whence == SEEK_SET
+            and self.size is None
+            and offset > self.offset
+        ):
+            # pipes can not seek, so skipped bytes are read and dropped
+            self._discard(offset)
+            return offset
+
+        position = self.io.seek(offset, whence)
+        self.buffer, self.base = b"", position
+        self._realign(position)
+        return position
+
+    def _discard(self, offset: int) -> None:
+        read = getattr(self.io, "read1", self.io.read)
+        end = self.base + len(self.buffer)
+        while end < offset:
+            chunk = read(self.buffer_size)
+            if not chunk:
+                break
+            # the last chunk is kept, what follows `offset` is in it
+            self.buffer, self.base = chunk, end
+            end += len(chunk)
+        self._realign(offset)
+
+    def sync(self) -> int:
+        """
+        Move `io` back to `offset`, behind what was read ahead, and drop
+        the buffer. Streams parsed from a file end with it, so the file
+        is right after what they parsed, and hooks start with it, so
+        they find `io` where the reader is. Pipes can not go back, what
+        was read ahead stays read.
+        """
+        if self.size is not None:
+            self.io.seek(self.offset)
+            self.buffer, self.base = b"", self.offset
+        return self.offset
+
+    def resync(self, position: int) -> None:
+        """
+        Follow a `__duckparse_first__` hook which moved `io` itself,
+        `position` is where `sync` left it before the hook.
+        """
+        if self.size is None:
+            return
+        moved = self.io.tell()
+        if moved != position:
+            self.buffer, self.base = b"", moved
+            self._realign(moved)
+
+    def hook_error(self, error: AttributeError) -> None:
+        # a hook which seeks `io` where there is nothing to seek
+        if not hasattr(self.io, "seek"):
+            raise TypeError(
+                f"{type(self).__name__} over {type(self.io).__name__} "
+                "has no `io` to seek, hooks have to use `reader.seek`"
+            ) from error
+        raise error
+
+    def _realign(self, position: int) -> None:
+        self.offset = position
+        self.__bits_at = -1
+
+    def tell(self) -> int:
+        return self.offset
+
+    def skip(self, size: int) -> int:
+        return self.seek(size, SEEK_CUR)
+
     def read_bytes(
         self,
         size: int,
         input_term: Optional[bytearray] = None,
         allign: bool = True,
-    ) -> bytearray:
+    ) -> Union[bytearray, memoryview]:
+        # `allign` is still accepted, but the bits left of a byte are
+        # dropped by any byte read, see `__bits_at`
         if size:
-            content = bytearray(self.io.read(size))
-            self.__last_byte = content[-1]
-            if allign:
-                self.__bit_needle = 8
-                self.__remaining_bits = 0
-            if __debug__:
-                self.__current_byte += size
-        else:
-            content = bytearray()
-        return content
+            return bytearray(self._read(size))
+        return bytearray()
+
+    def read_until(self, terminator: bytes, step: int = 1) -> Buffer:
+        """
+        Read up to `terminator`, which is consumed but not returned. It
+        only matches at multiples of `step` from the current position.
+        """
+        at = self.offset - self.base
+        searched = 0
+        while (
+            end := _find(self.buffer, terminator, at + searched, at, step)
+        ) == -1:
+            available = len(self.buffer) - at
+            # a terminator could still start in the last few bytes
+            searched = max(0, available - len(terminator) + 1)
+            searched += -searched % step
+            at = self.fill(available + len(terminator))
+            if len(self.buffer) - at == available:
+                raise EOFError(f"no {terminator!r} before the end")
+
+        self.offset += end + len(terminator) - at
+        return self.buffer[at:end]
+
+    def read_struct(self, structs: Dict[str, Struct]) -> Tuple[Any, ...]:
+        # `structs` comes from `c_types.compile_struct`, so a whole run of
+        # fixed-size fields costs a single unpack from the buffer
+        fmt = structs[self.primitive.byteorder]
+        at = self.offset - self.base
+        if at + fmt.size > len(self.buffer):
+            at = self.fill(fmt.size)
+        values = fmt.unpack_from(self.buffer, at)
+        self.offset += fmt.size
+        return values
+
+    def read_value(self, structs: Dict[str, Struct]) -> Any:
+        # `read_struct` of a single value, for primitives outside a run
+        fmt = structs[self.primitive.byteorder]
+        at = self.offset - self.base
+        if at + fmt.size > len(self.buffer):
+            at = self.fill(fmt.size)
+        (value,) = fmt.unpack_from(self.buffer, at)
+        self.offset += fmt.size
+        return value
 
     def read_bits_int_le(self, size) -> int:
-        if (non_exist_bits := size - self.__remaining_bits) >= 0:
+        if self.__bits_at != self.offset:
+            # bytes were read since the last bits, start a new byte
+            self.__needle = 8
+            self.__remaining = 0
+
+        if (non_exist_bits := size - self.__remaining) >= 0:
             # 1 bit  => 1 byte,  1 bit
             # 8 bits => 1 byte,  0 bit
             # 9 bits => 2 bytes, 1 bit
@@ -67,27 +302,205 @@ class Reader:
             # align the bit needle and clear the counter
             allign, bits_left = self.__clearread_bits()
             # read as byte_len and convert it to int
-            bit_chunk = int.from_bytes(
-                self.read_bytes(byte_len + 1), self.endianness,
-            )
+            content = self._read(byte_len + 1)
+            if len(content) <= byte_len:
+                raise EOFError(f"{size} bits past the end")
+            self.__last_byte = content[-1]
+            # bits are numbered from the first byte on, whatever the
+            # byte order of the numbers
+            bit_chunk = int.from_bytes(content, "little")
             # combine bit_chunk and allign
             byte_chunk = (bit_chunk << bits_left) | allign
         else:
             bit_len = size
             # read first n bits
-            byte_chunk = self.__last_byte >> self.__bit_needle
+            byte_chunk = self.__last_byte >> self.__needle
 
-        self.__bit_needle = (self.__bit_needle + bit_len) % 8
+        self.__needle = (self.__needle + bit_len) % 8
         # make a mask for first "size" bits
         # for size = 5 -> mask = 0b11111
         mask = (1 << size) - 1
-        self.__remaining_bits = 8 - self.__bit_needle
+        self.__remaining = 8 - self.__needle
+        self.__bits_at = self.offset
         return byte_chunk & mask
 
+    def read_bits_int_be(self, size: int) -> int:
+        # most significant bits first, so only whole bytes are read and
+        # `__remaining` bits are left at the bottom of `__last_byte`
+        if self.__bits_at != self.offset:
+            self.__remaining = 0
+
+        remaining = self.__remaining
+        value = self.__last_byte & ((1 << remaining) - 1)
+        if size > remaining:
+            byte_len = (size - remaining + 7) // 8
+            content = self._read(byte_len)
+            if len(content) < byte_len:
+                raise EOFError(f"{size} bits past the end")
+            self.__last_byte = content[-1]
+            value = (value << 8 * byte_len) | int.from_bytes(
+                content, "big"
+            )
+            remaining += 8 * byte_len
+
+        self.__remaining = remaining - size
+        # keeps `read_bits_int_le` from misreading the state
+        self.__needle = 8 - self.__remaining
+        self.__bits_at = self.offset
+        return value >> self.__remaining
+
     def __clearread_bits(self) -> Tuple[int, int]:
-        trim = self.__bit_needle
+        trim = self.__needle
         # read rest of the bits from the last byte
         allign = self.__last_byte >> trim
         # reset the bit counter
-        self.__bit_needle = 0
+        self.__needle = 0
         return allign, 8 - trim
+
+
+@dataclass
+class BufferReader(Reader):
+    """
+    A reader over data which is already in memory (or mapped into it),
+    `buffer` is all of it and `Byte` fields are zero-copy memoryview
+    slices of it.
+    """
+
+    io: Buffer = field(repr=False)  # type: ignore
+    offset: int = 0
+    buffer: memoryview = field(init=False, repr=False)
+
+    def __post_init__(self):
+        self.buffer = memoryview(self.io).cast("B")
+        self.size = len(self.buffer)
+        if self.endianness == "big":
+            self.primitive = BigEndian
+
+    @classmethod
+    def from_path(
+        cls, path: Union[str, PathLike], **kwargs: Any
+    ) -> "BufferReader":
+        with open(path, "rb") as file:
+            try:
+                data: Buffer = mmap(file.fileno(), 0, access=ACCESS_READ)
+            except ValueError:
+                # empty files can not be mapped
+                data = file.read()
+        return cls(data, **kwargs)
+
+    def close(self) -> None:
+        """
+        Unmap the file of a `from_path` reader. While parsed `Byte`
+        slices of it are still around, they keep it mapped instead.
+        """
+        with suppress(BufferError):
+            self.buffer.release()
+            if isinstance(self.io, mmap):
+                self.io.close()
+
+    def fill(self, size: int) -> int:
+        # there is nothing more to read, short reads stay short
+        return self.offset
+
+    def read_bytes(
+        self,
+        size: int,
+        input_term: Optional[bytearray] = None,
+        allign: bool = True,
+    ) -> memoryview:
+        # `buffer` is all of the data, there is nothing to fill
+        content = self.buffer[self.offset : self.offset + size]
+        self.offset += len(content)
+        return content
+
+    def seek(self, offset: int, whence: int = SEEK_SET) -> int:
+        if whence == SEEK_CUR:
+            offset += self.offset
+        elif whence == SEEK_END:
+            offset += len(self.buffer)
+        if offset < 0:
+            raise ValueError(f"negative seek position {offset}")
+        self._realign(offset)
+        return offset
+
+    def sync(self) -> int:
+        # the mapping of `from_path` has a position of its own
+        if isinstance(self.io, mmap):
+            self.io.seek(self.offset)
+        return self.offset
+
+    def resync(self, position: int) -> None:
+        if isinstance(self.io, mmap) and self.io.tell() != position:
+            self._realign(self.io.tell())
+
+
+@dataclass
+class FeedReader(Reader):
+    """
+    A reader over data which is pushed into it with `feed`, for data
+    which arrives in chunks. Reading past what was fed so far raises
+    `IncompleteRead`, after `feed(b"")` short reads stay short as for
+    any other reader. `buffer` starts at the last `trim`.
+    """
+
+    io: Any = field(default=None, repr=False)
+    # a bytearray grows in place
+    buffer: bytearray = field(
+        init=False, default_factory=bytearray, repr=False
+    )
+    # no more data is coming
+    eof: bool = field(init=False, default=False)
+
+    def __post_init__(self):
+        # the size is unknown until the end
+        self.size = None
+        if self.endianness == "big":
+            self.primitive = BigEndian
+
+    def fill(self, size: int) -> int:
+        at = self.offset - self.base
+        if (missing := at + size - len(self.buffer)) > 0 and not self.eof:
+            raise IncompleteRead(missing)
+        return at
+
+    def seek(self, offset: int, whence: int = SEEK_SET) -> int:
+        end = self.base + len(self.buffer)
+        if whence == SEEK_CUR:
+            offset += self.offset
+        elif whence == SEEK_END:
+            if not self.eof:
+                # the end is not known yet, read until it is
+                raise IncompleteRead(self.buffer_size)
+            offset += end
+        if offset < self.base:
+            raise ValueError(f"{offset} was already trimmed")
+        if offset > end and not self.eof:
+            raise IncompleteRead(offset - end)
+        self._realign(offset)
+        return offset
+
+    def sync(self) -> int:
+        # whatever `io` is, the data only gets in with `feed`
+        return self.offset
+
+    def resync(self, position: int) -> None:
+        pass
+
+    def feed(self, data: Buffer) -> None:
+        """Add data, empty data is the end."""
+        if not data:
+            self.eof = True
+        self.buffer += data
+
+    def trim(self) -> None:
+        """Drop what is before `offset`, it can not be read again."""
+        del self.buffer[: self.offset - self.base]
+        self.base = self.offset
+
+
+def into_reader(source: Union[Reader, Buffer, BinaryIO]) -> Reader:
+    if isinstance(source, Reader):
+        return source
+    if isinstance(source, (bytes, bytearray, memoryview, mmap)):
+        return BufferReader(source)
+    return Reader(source)
@@ -1,8 +1,39 @@
+import sys
+from array import array
+from collections import abc
+from struct import Struct, calcsize
 from contextlib import suppress
-from typing import Callable, Iterable, List, TypeVar
+from dataclasses import dataclass
+from typing import (
+    Any,
+    Callable,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+    Union,
+)
+
+from .consts import LAZY_OFFSETS_FIELD
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None  # type: ignore
 
 T = TypeVar("T")
 
+# struct formats whose `array` typecode has the same (standard) size
+_ARRAY_CODES = {
+    fmt: fmt
+    for fmt in "bBhHiIqQfd"
+    if array(fmt).itemsize == calcsize(fmt)
+}
+_NATIVE_BYTEORDER = "<" if sys.byteorder == "little" else ">"
+
 
 def whilor(condution: Callable[[], bool]) -> Iterable[bool]:
     while condution():
@@ -13,7 +44,217 @@ def generic_repeat(body: Callable[[], T], condution: Iterable) -> List[T]:
     return [body() for _ in condution]
 
 
+def generic_iterate(
+    body: Callable[[], T], condution: Iterable
+) -> Iterator[T]:
+    return (body() for _ in condution)
+
+
+@dataclass(frozen=True)
+class Span:
+    """Where a skipped field is in the stream."""
+
+    offset: int
+    size: int
+
+
+def skip_bytes(reader: Any, size: int) -> Span:
+    offset = reader.tell()
+    reader.skip(size)
+    return Span(offset, size)
+
+
+def skip_with(reader: Any, skipper: Callable[[], Any]) -> Span:
+    offset = reader.tell()
+    skipper()
+    return Span(offset, reader.tell() - offset)
+
+
+def until_eof(reader: Any) -> Iterator[bool]:
+    if reader.size is None:
+        # a stream without a known end, only a read can tell
+        while not reader.at_eof():
+            yield True
+        return
+    # `reader.at_eof()` inlined, it runs once per element
+    while reader.offset < reader.size:
+        yield True
+
+
+def count(condution: Iterable) -> int:
+    with suppress(TypeError):
+        return len(condution)  # type: ignore
+    return sum(1 for _ in condution)
+
+
+def repeat_packed(
+    reader: Any,
+    fmt: str,
+    condution: Iterable,
+    byteorder: Optional[str] = None,
+) -> Union[Sequence, "numpy.ndarray"]:
+    """
+    `RepeatN` over a fixed-size primitive: reads every element with a
+    single read and decodes them at once into a numpy array, or into an
+    `array.array` when numpy is not installed. `byteorder` is the one of
+    a primitive like `U32be`, otherwise the reader's.
+    """
+    length = count(condution)
+    byteorder = byteorder or reader.primitive.byteorder
+    data = reader.read_bytes(calcsize(fmt) * length)
+
+    if numpy is not None:
+        return numpy.frombuffer(
+            data, dtype=numpy.dtype(f"{byteorder}{fmt}"), count=length
+        )
+
+    if len(data) != calcsize(fmt) * length:
+        raise ValueError(
+            f"expected {length} elements, found {len(data)} bytes"
+        )
+    if fmt not in _ARRAY_CODES:
+        return [
+            value
+            for (value,) in Struct(byteorder + fmt).iter_unpack(data)
+        ]
+
+    values = array(_ARRAY_CODES[fmt])
+    values.frombytes(data)
+    if byteorder != _NATIVE_BYTEORDER:
+        values.byteswap()
+    return values
+
+
+def repeat_records(
+    reader: Any,
+    layout: Tuple[Tuple[str, str], ...],
+    body: Callable[[], T],
+    condution: Iterable,
+) -> Union[List[T], "numpy.recarray"]:
+    """
+    `RepeatN` over a section made only of plain primitives: decodes all
+    the records with a single read into a numpy record array, one column
+    per field, the formats of fields with a byte order of their own
+    start with it. Without numpy it falls back to a list of sections.
+    """
+    if numpy is None:
+        return generic_repeat(body, condution)
+
+    length = count(condution)
+    byteorder = reader.primitive.byteorder
+    dtype = numpy.dtype(
+        [
+            (name, fmt if fmt[0] in "<>" else f"{byteorder}{fmt}")
+            for name, fmt in layout
+        ]
+    )
+    data = reader.read_bytes(dtype.itemsize * length)
+    return numpy.frombuffer(data, dtype=dtype, count=length).view(
+        numpy.recarray
+    )
+
+
+class IndexedRecords(abc.Sequence):
+    """
+    Records of a static size which are only parsed when they are
+    indexed, element `i` lives at `base + i * stride`. They are parsed
+    with the `primitive` the reader had when the field was read, the
+    byte order of its section.
+    """
+
+    def __init__(
+        self,
+        reader: Any,
+        body: Callable[[], Any],
+        base: int,
+        stride: int,
+        length: int,
+        primitive: Any,
+    ):
+        self.reader = reader
+        self.body = body
+        self.base = base
+        self.stride = stride
+        self.length = length
+        self.primitive = primitive
+
+    def __len__(self) -> int:
+        return self.length
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            start, _, step = index.indices(self.length)
+            return IndexedRecords(
+                self.reader,
+                self.body,
+                self.base + start * self.stride,
+                self.stride * step,
+                len(range(*index.indices(self.length))),
+                self.primitive,
+            )
+
+        if index < 0:
+            index += self.length
+        if not 0 <= index < self.length:
+            raise IndexError("record index out of range")
+
+        position = self.reader.tell()
+        primitive = self.reader.primitive
+        self.reader.seek(self.base + index * self.stride)
+        self.reader.primitive = self.primitive
+        try:
+            return self.body()
+        finally:
+            self.reader.primitive = primitive
+            self.reader.seek(position)
+
+    def __repr__(self) -> str:
+        return (
+            f"IndexedRecords(length={self.length}, "
+            f"record_size={self.stride})"
+        )
+
+
+def repeat_indexed(
+    reader: Any, body: Callable[[], T], size: int, condution: Iterable
+) -> IndexedRecords:
+    length = count(condution)
+    base = reader.tell()
+    reader.skip(length * size)
+    return IndexedRecords(
+        reader, body, base, size, length, reader.primitive
+    )
+
+
 def resolve(elem) -> str:
     with suppress(AttributeError):
         return elem.__name__
     return elem.__class__.__name__
+
+
+class LazyField:
+    """
+    Stands in for a field of a lazy section: the generated `__init__`
+    only records where the field starts and skips it, the first access
+    seeks back, decodes and caches the value on the instance.
+    """
+
+    def __init__(self, name: str, loader: Callable[[Any], Any]):
+        self.name = name
+        self.loader = loader
+
+    def __get__(self, instance: Any, owner: type) -> Any:
+        if instance is None:
+            return self
+
+        reader = instance.reader
+        position = reader.tell()
+        reader.seek(getattr(instance, LAZY_OFFSETS_FIELD)[self.name])
+        try:
+            value = self.loader(instance)
+        finally:
+            reader.seek(position)
+
+        # we are a non-data descriptor, so this shadows us from now on
+        instance.__dict__[self.name] = value
+        return value
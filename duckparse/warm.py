@@ -0,0 +1,66 @@
+"""
+Fill the generated-code cache at build time, by importing the modules
+which define the parsers:
+
+    python -m duckparse.warm formats --cache-dir build/duckparse
+"""
+
+import argparse
+import glob
+import importlib
+import os
+import pkgutil
+from contextlib import suppress
+
+from .cache import CACHE_DIR_ENV, get_cache_dir, set_cache_dir, flush
+
+from typing import List, Optional, Sequence
+
+
+def warm(modules: Sequence[str]) -> List[str]:
+    """Import `modules` and their submodules."""
+    imported = []
+    for name in modules:
+        module = importlib.import_module(name)
+        imported.append(name)
+        for info in pkgutil.walk_packages(
+            getattr(module, "__path__", []), prefix=f"{name}."
+        ):
+            importlib.import_module(info.name)
+            imported.append(info.name)
+    return imported
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    parser = argparse.ArgumentParser(prog="python -m duckparse.warm")
+    parser.add_argument("modules", nargs="*")
+    parser.add_argument(
+        "--cache-dir",
+        default=get_cache_dir(),
+        help=f"defaults to ${CACHE_DIR_ENV}",
+    )
+    parser.add_argument(
+        "--clear",
+        action="store_true",
+        help="remove the cached code before importing, other files in "
+        "the cache directory are left alone",
+    )
+    args = parser.parse_args(argv)
+    if args.cache_dir is None:
+        parser.error(f"pass --cache-dir or set {CACHE_DIR_ENV}")
+
+    if args.clear:
+        # every format and Python version, but only the cache files
+        for path in glob.glob(
+            os.path.join(glob.escape(args.cache_dir), "code-*.marshal")
+        ):
+            with suppress(OSError):
+                os.remove(path)
+    set_cache_dir(args.cache_dir)
+    for name in warm(args.modules):
+        print(name)
+    flush()
+
+
+if __name__ == "__main__":
+    main()
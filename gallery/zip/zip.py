@@ -10,12 +10,10 @@ from duckparse.btypes import (
     String,
     RepeatN,
     RepeatEOS,
+    Switch,
 )
 
-from duckparse.reader import Reader
-from duckparse import stream, section, datakind, enumkind
-
-from typing import Tuple, Union
+from duckparse import stream, section, enumkind
 
 
 @enumkind
@@ -98,29 +96,19 @@ class EndOfCentralDir:
     comment: String[Var("len_comment"), "utf-8"]
 
 
-@datakind
-class SectionBody:
-    def __processor__(
-        self, reader: Reader, params: Tuple[int]
-    ) -> Union[
-        CentralDirEntry, LocalFile, EndOfCentralDir, DataDescriptor
-    ]:
-        (section_type,) = params
-        if section_type == 0x0201:
-            return CentralDirEntry(reader)
-        elif section_type == 0x0403:
-            return LocalFile(reader)
-        elif section_type == 0x0605:
-            return EndOfCentralDir(reader)
-        elif section_type == 0x0807:
-            return DataDescriptor(reader)
-
-
 @section
 class PkSection:
     magic: Contents[b"PK"]
     section_type: U16
-    body: SectionBody[Var("section_type")]
+    body: Switch[
+        Var("section_type"),
+        {
+            0x0201: CentralDirEntry,
+            0x0403: LocalFile,
+            0x0605: EndOfCentralDir,
+            0x0807: DataDescriptor,
+        },
+    ]
 
 
 @stream
@@ -6,5 +6,6 @@ setup(
     name="duckparse",
     author="1v3m",
     packages=["duckparse"],
+    extras_require={"numpy": ["numpy"]},
     zip_safe=False,
 )
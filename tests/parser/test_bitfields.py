@@ -0,0 +1,64 @@
+from io import BytesIO
+
+import pytest
+
+from duckparse import section, stream
+from duckparse.consts import GENERATED_SOURCE_FIELD
+from duckparse.reader import Reader, BufferReader
+from duckparse.btypes import U8, Bits
+
+WIDTHS = (4, 4, 6, 1, 1, 3, 13)
+DATA = b"\x45\x9c\x7b\xa1\x33\xee"
+
+
+@section
+class Header:
+    version: Bits[4]
+    ihl: Bits[4]
+    dscp: Bits[6]
+    ecn: Bits[1]
+    flag: Bits[1]
+    flags: Bits[3]
+    offset: Bits[13]
+    ttl: U8
+
+
+@section
+class Partial:
+    low: Bits[3]
+
+
+@stream
+class Packet:
+    partial: Partial
+    header: Header
+
+
+def expected(data: bytes, widths=WIDTHS):
+    reader = Reader(BytesIO(data))
+    return [reader.read_bits_int_le(width) for width in widths]
+
+
+def test_bit_group():
+    header = Header(BufferReader(DATA))
+    fields = ("version", "ihl", "dscp", "ecn", "flag", "flags", "offset")
+
+    assert [getattr(header, name) for name in fields] == expected(DATA)
+    assert header.ttl == 0x33
+    source = getattr(Header.__init__, GENERATED_SOURCE_FIELD)
+    assert "int.from_bytes" in source
+
+
+def test_bit_group_after_pending_bits():
+    # the group goes on with the bits `Partial` left over
+    packet = Packet(DATA + b"\x00")
+    values = expected(DATA, (3, *WIDTHS))
+
+    assert packet.partial.low == values[0]
+    assert packet.header.version == values[1]
+    assert packet.header.offset == values[-1]
+
+
+def test_bit_group_short():
+    with pytest.raises(EOFError):
+        Header(BufferReader(DATA[:2]))
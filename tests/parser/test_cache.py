@@ -0,0 +1,93 @@
+import sys
+from io import BytesIO
+
+import pytest
+
+from duckparse import cache, section, stream
+from duckparse.btypes import U8, U16
+from duckparse.warm import main as warm
+
+
+@pytest.fixture
+def cache_dir(tmp_path):
+    cache.set_cache_dir(tmp_path / "cache")
+    yield tmp_path / "cache"
+    cache.set_cache_dir(None)
+
+
+def make_parser():
+    @section
+    class Point:
+        x: U8
+        y: U8
+
+    @stream
+    class Shape:
+        count: U16
+        origin: Point
+
+    return Shape
+
+
+def parse(parser):
+    shape = parser(BytesIO(b"\x02\x00\x07\x09"))
+    return shape.count, shape.origin.x, shape.origin.y
+
+
+def test_cache_reuses_compiled_code(cache_dir, monkeypatch):
+    assert parse(make_parser()) == (2, 7, 9)
+    cache.flush()
+    assert len(list(cache_dir.iterdir())) == 1
+
+    # a new process: the file is loaded, nothing is compiled
+    cache.set_cache_dir(cache_dir)
+    monkeypatch.setattr(cache, "compile", None, raising=False)
+    assert parse(make_parser()) == (2, 7, 9)
+
+
+def test_cache_ignores_broken_files(cache_dir):
+    cache_dir.mkdir()
+    with open(cache._cache_path(str(cache_dir)), "wb") as file:
+        file.write(b"\x00garbage")
+    cache.set_cache_dir(cache_dir)
+
+    assert parse(make_parser()) == (2, 7, 9)
+    cache.flush()
+    assert cache._load(str(cache_dir))
+
+
+def test_cache_warm(tmp_path, monkeypatch, capsys):
+    (tmp_path / "formats").mkdir()
+    (tmp_path / "formats" / "__init__.py").write_text("")
+    (tmp_path / "formats" / "point.py").write_text(
+        "from duckparse import section\n"
+        "from duckparse.btypes import U8\n"
+        "@section\n"
+        "class Point:\n"
+        "    x: U8\n"
+    )
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.delitem(sys.modules, "formats", raising=False)
+    monkeypatch.delitem(sys.modules, "formats.point", raising=False)
+
+    try:
+        warm(["formats", "--cache-dir", str(tmp_path / "cache")])
+    finally:
+        cache.set_cache_dir(None)
+
+    assert capsys.readouterr().out.split() == ["formats", "formats.point"]
+    assert cache._load(str(tmp_path / "cache"))
+
+
+def test_cache_warm_clear(tmp_path):
+    cache_dir = tmp_path / "cache"
+    cache_dir.mkdir()
+    (cache_dir / "code-0-00.marshal").write_bytes(b"stale")
+    (cache_dir / "notes.txt").write_text("not ours")
+
+    try:
+        warm(["--cache-dir", str(cache_dir), "--clear"])
+    finally:
+        cache.set_cache_dir(None)
+
+    assert [path.name for path in cache_dir.iterdir()] == ["notes.txt"]
@@ -0,0 +1,132 @@
+import importlib
+import sys
+import textwrap
+from io import BytesIO
+
+import pytest
+
+from duckparse import section, datakind
+from duckparse.compile import export, main
+from duckparse.reader import BufferReader
+
+FORMATS = '''
+from os import SEEK_SET
+
+from duckparse import stream, section, datakind, enumkind
+from duckparse.btypes import U8, U16, String, Var, RepeatN, Contents
+
+
+@enumkind
+class Kind:
+    POINT = 1
+    NAME = 2
+
+
+@section
+class Point:
+    x: U8
+    y: U8
+
+
+@section(lazy=True)
+class Name:
+    size: U8
+    text: String[Var("size"), "utf-8"]
+
+
+@section(endian="big")
+class Label:
+    size: U16
+    text: String[Var("size"), "utf-8"]
+
+
+@datakind
+class Body:
+    def __processor__(self, reader, params):
+        (kind,) = params
+        if kind is Kind.base_cls.__masked_enum__.POINT:
+            return Point(reader)
+        return Name(reader)
+
+
+@stream
+class Shapes:
+    """Shapes, after a padding byte."""
+
+    def __duckparse_first__(self, reader):
+        reader.seek(1, SEEK_SET)
+
+    magic: Contents[b"SH"]
+    kind: Kind[U8]
+    body: Body[Var("kind")]
+    values: RepeatN[U16, "range(2)"]
+'''
+
+
+@pytest.fixture
+def formats(tmp_path, monkeypatch):
+    (tmp_path / "compile_formats.py").write_text(textwrap.dedent(FORMATS))
+    monkeypatch.syspath_prepend(str(tmp_path))
+    yield importlib.import_module("compile_formats"), tmp_path
+    for name in ("compile_formats", "compile_formats_out"):
+        sys.modules.pop(name, None)
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        b"\xffSH\x01\x07\x09\x01\x00\x02\x00",
+        b"\xffSH\x02\x03abc\x01\x00\x02\x00",
+    ],
+)
+def test_compile_matches_decorated(formats, data):
+    module, path = formats
+    main(
+        [
+            "compile_formats:Shapes",
+            "-o",
+            str(path / "compile_formats_out.py"),
+        ]
+    )
+    exported = importlib.import_module("compile_formats_out")
+
+    original = module.Shapes(BytesIO(data))
+    compiled = exported.Shapes(BytesIO(data))
+    assert repr(compiled) == repr(original)
+    assert compiled.__doc__ == module.Shapes.__doc__
+
+
+def test_compile_output_has_no_codegen(formats):
+    module, _ = formats
+    source = export(module.Shapes)
+
+    assert "@section" not in source and "@stream" not in source
+    assert "'<': Struct('<BB').unpack_from" in source
+    assert "import compile_formats" not in source
+
+
+def test_compile_section_endian(formats):
+    module, path = formats
+    source = export(module.Label)
+    (path / "compile_formats_out.py").write_text(source)
+    exported = importlib.import_module("compile_formats_out")
+
+    data = b"\x00\x03abc"
+    original = module.Label(BufferReader(data))
+    assert repr(exported.Label(BufferReader(data))) == repr(original)
+    assert original.size == 3
+    assert "from duckparse.c_types import BigEndian" in source
+
+
+def test_compile_unreachable_kind():
+    @datakind
+    class Local:
+        def __processor__(self, reader):
+            return reader.read_bytes(1)
+
+    @section
+    class Outer:
+        local: Local
+
+    with pytest.raises(TypeError):
+        export(Outer)
@@ -0,0 +1,180 @@
+from io import BytesIO
+from struct import pack
+
+import pytest
+
+from duckparse import section, stream
+from duckparse.consts import GENERATED_SOURCE_FIELD
+from duckparse.reader import Reader, BufferReader
+from duckparse.btypes import (
+    U8,
+    U16,
+    U32,
+    U16be,
+    U32be,
+    U32le,
+    F64be,
+    Bits,
+    Bitsbe,
+    Byte,
+    RepeatN,
+    IndexedN,
+    Var,
+)
+
+
+@section
+class Mixed:
+    length: U16be
+    kind: U32le
+    value: F64be
+    native: U16
+
+
+@section(endian="big")
+class Network:
+    length: U16
+    kind: U32
+    little: U32le
+    payload: Byte[Var("length")]
+    crc: U32
+
+
+@section(endian="big")
+class Pair:
+    first: U16
+    second: U16
+
+
+@section(endian="big")
+class Counts:
+    count: U8
+    items: RepeatN[U32, "range(self.count)"]
+    pairs: RepeatN[Pair, "range(self.count)"]
+
+
+@section(endian="big")
+class Table:
+    count: U8
+    items: RepeatN[U32, "range(self.count)"]
+    index: IndexedN[U32, "range(self.count)"]
+
+
+@section
+class Fixed:
+    items: RepeatN[U32be, "range(2)"]
+
+
+@section
+class Tcp:
+    offset: Bitsbe[4]
+    reserved: Bitsbe[3]
+    flags: Bitsbe[9]
+    window: U16be
+
+
+@stream
+class Messages:
+    first: Network
+    second: Network
+
+
+def source(cls):
+    return getattr(cls.__init__, GENERATED_SOURCE_FIELD)
+
+
+def test_fixed_byteorder():
+    data = pack(">H", 7) + pack("<I", 8) + pack(">d", 1.5) + pack("<H", 9)
+    mixed = Mixed(BufferReader(data))
+
+    assert (mixed.length, mixed.kind, mixed.value) == (7, 8, 1.5)
+    assert mixed.native == 9
+    # one run per byte order, with its struct compiled in
+    assert source(Mixed).count("primitive.byteorder") == 1
+
+
+def test_fixed_byteorder_ignores_the_reader():
+    data = pack(">H", 7) + pack("<I", 8) + pack(">d", 1.5) + pack(">H", 9)
+    mixed = Mixed(BufferReader(data, endianness="big"))
+
+    assert (mixed.length, mixed.kind, mixed.value) == (7, 8, 1.5)
+    assert mixed.native == 9
+
+
+def test_section_endian():
+    data = pack(">HI", 3, 1) + pack("<I", 2) + b"abc"
+    data += pack(">I", 0xDEADBEEF)
+    network = Network(BufferReader(data))
+
+    assert (network.length, network.kind, network.little) == (3, 1, 2)
+    assert bytes(network.payload) == b"abc"
+    assert network.crc == 0xDEADBEEF
+    assert "primitive.byteorder" not in source(Network)
+
+
+def test_section_endian_is_restored():
+    data = pack(">HI", 0, 1) + pack("<I", 2) + pack(">I", 3)
+    reader = Reader(BytesIO(data + data))
+    messages = Messages(reader)
+
+    assert messages.second.crc == 3
+    assert reader.primitive.byteorder == "<"
+
+
+def test_section_endian_repeat():
+    data = pack(">B3I", 3, 1, 2, 0x01020304) + pack(">6H", *range(6))
+    counts = Counts(BufferReader(data))
+
+    assert list(counts.items) == [1, 2, 0x01020304]
+    assert list(counts.pairs.second) == [1, 3, 5]
+
+
+def test_section_endian_indexed():
+    data = pack(">B4I", 2, 1, 2, 1, 2)
+    reader = BufferReader(data)
+    table = Table(reader)
+
+    assert list(table.items) == [1, 2]
+    assert list(table.index) == [1, 2]
+    assert list(table.index[::-1]) == [2, 1]
+    assert reader.primitive.byteorder == "<"
+
+
+def test_fixed_byteorder_repeat():
+    fixed = Fixed(BufferReader(pack(">2I", 1, 0x01020304)))
+
+    assert list(fixed.items) == [1, 0x01020304]
+
+
+def test_section_endian_invalid():
+    with pytest.raises(ValueError):
+
+        @section(endian="network")
+        class Invalid:
+            value: U32
+
+
+def test_big_endian_bits():
+    data = b"\x50\x12\xff\xff"
+    tcp = Tcp(BufferReader(data))
+    reader = Reader(BytesIO(data))
+    widths = (4, 3, 9)
+
+    assert [tcp.offset, tcp.reserved, tcp.flags] == [
+        reader.read_bits_int_be(width) for width in widths
+    ]
+    assert (tcp.offset, tcp.flags) == (5, 0x012)
+    assert tcp.window == 0xFFFF
+    assert "'big'" in source(Tcp)
+
+
+def test_bit_orders_are_grouped_apart():
+    @section
+    class Both:
+        low: Bits[8]
+        high: Bitsbe[4]
+        rest: Bitsbe[4]
+
+    both = Both(BufferReader(b"\x01\xa5"))
+
+    assert (both.low, both.high, both.rest) == (1, 0xA, 0x5)
@@ -0,0 +1,68 @@
+from io import BytesIO
+
+import pytest
+
+from duckparse import section, stream, enumkind
+from duckparse.reader import Reader
+from duckparse.exceptions import ValidationError
+from duckparse.btypes import U8, U16, I32, F32, Bits, Contents
+
+
+@enumkind
+class Mode:
+    FIRST = 1
+    SECOND = 2
+
+
+@section
+class FusedSection:
+    magic: Contents[b"DP"]
+    kind: Mode[U16]
+    count: U8
+    offset: I32
+    ratio: F32
+
+
+@stream
+class FusedStream:
+    head: U8
+    flag: Bits[1]
+    body: FusedSection
+    tail: U16
+
+
+DATA = b"DP\x02\x00\x05\xfe\xff\xff\xff\x00\x00\x80\x3f"
+
+
+def test_fused_section():
+    result = FusedSection(Reader(BytesIO(DATA)))
+    assert result.magic == b"DP"
+    assert result.kind is Mode.base_cls.__masked_enum__.SECOND
+    assert result.count == 5
+    assert result.offset == -2
+    assert result.ratio == 1.0
+
+
+def test_fused_section_big_endian():
+    result = FusedSection(
+        Reader(
+            BytesIO(b"DP\x00\x01\x05\xff\xff\xff\xfe\x3f\x80\x00\x00"),
+            endianness="big",
+        )
+    )
+    assert result.kind is Mode.base_cls.__masked_enum__.FIRST
+    assert result.offset == -2
+    assert result.ratio == 1.0
+
+
+def test_fused_validation():
+    with pytest.raises(ValidationError):
+        FusedSection(Reader(BytesIO(b"PK" + DATA[2:])))
+
+
+def test_fused_after_bits():
+    result = FusedStream(BytesIO(b"\x07\xff" + DATA + b"\x34\x12"))
+    assert result.head == 7
+    assert result.flag == 1
+    assert result.body.count == 5
+    assert result.tail == 0x1234
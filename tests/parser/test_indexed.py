@@ -0,0 +1,70 @@
+import pytest
+
+from duckparse import stream, section
+from duckparse.reader import BufferReader
+from duckparse.utils import IndexedRecords
+from duckparse.btypes import U8, U16, Byte, Contents, IndexedN, String
+
+
+@section
+class Slot:
+    magic: Contents[b"S"]
+    number: U16
+    name: Byte[2]
+
+
+@stream
+class Directory:
+    count: U8
+    slots: IndexedN[Slot, "range(self.count)"]
+    tail: U8
+
+
+def make(count):
+    return (
+        bytes([count])
+        + b"".join(
+            b"S" + index.to_bytes(2, "little") + b"%02d" % index
+            for index in range(count)
+        )
+        + b"\xff"
+    )
+
+
+class CountingReader(BufferReader):
+    reads = 0
+
+    def read_bytes(self, *args, **kwargs):
+        self.reads += 1
+        return super().read_bytes(*args, **kwargs)
+
+
+def test_indexed_records():
+    reader = CountingReader(make(100))
+    result = Directory(reader)
+    assert result.tail == 0xFF
+    assert isinstance(result.slots, IndexedRecords)
+    assert len(result.slots) == 100
+
+    reads = reader.reads
+    assert result.slots[42].number == 42
+    assert bytes(result.slots[-1].name) == b"99"
+    assert reader.reads == reads + 2
+
+
+def test_indexed_slices():
+    result = Directory(make(10))
+    assert [slot.number for slot in result.slots[2:8:3]] == [2, 5]
+    assert [slot.number for slot in result.slots[::-4]] == [9, 5, 1]
+    assert len(result.slots[20:]) == 0
+
+    with pytest.raises(IndexError):
+        result.slots[10]
+
+
+def test_indexed_needs_static_size():
+    with pytest.raises(ValueError):
+
+        @section
+        class Dynamic:
+            names: IndexedN[String[-1, "ascii"], "range(3)"]
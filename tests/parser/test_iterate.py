@@ -0,0 +1,59 @@
+import types
+
+import pytest
+
+from duckparse import stream, section
+from duckparse.reader import BufferReader
+from duckparse.btypes import U8, U16, Contents, IterEOS
+
+
+@section
+class Record:
+    magic: Contents[b"R"]
+    value: U16
+
+
+@stream
+class Log:
+    version: U8
+    records: IterEOS[Record]
+
+
+DATA = b"\x01" + b"".join(b"R" + bytes([i, 0]) for i in range(5))
+
+
+def test_iterate_on_demand():
+    reader = BufferReader(DATA)
+    log = Log(reader)
+
+    assert log.version == 1
+    assert isinstance(log.records, types.GeneratorType)
+    assert reader.tell() == 1
+
+    assert next(log.records).value == 0
+    assert reader.tell() == 4
+
+    assert [record.value for record in log.records] == [1, 2, 3, 4]
+    assert reader.tell() == len(DATA)
+
+
+def test_iterate_stops_early():
+    log = Log(DATA + b"broken")
+    for record in log.records:
+        if record.value == 2:
+            break
+
+
+def test_iterate_has_to_be_last():
+    with pytest.raises(ValueError):
+
+        @stream
+        class NotLast:
+            records: IterEOS[Record]
+            tail: U8
+
+    with pytest.raises(ValueError):
+
+        @section
+        class InSection:
+            records: IterEOS[Record]
@@ -0,0 +1,97 @@
+import pytest
+
+from duckparse import section, stream, layout, enumkind
+from duckparse.reader import Reader
+from duckparse.analysis import FieldLayout
+from duckparse.btypes import (
+    U8,
+    U16,
+    U32,
+    I32,
+    Byte,
+    Contents,
+    Skip,
+    String,
+    RepeatEOS,
+    Var,
+)
+
+
+@enumkind
+class Compression:
+    NONE = 0
+    DEFLATED = 8
+
+
+@section
+class Entry:
+    magic: Contents[b"PK"]
+    flags: U16
+    compression_method: Compression[U16]
+    crc32: U32
+    ofs_local_header: I32
+    reserved: Byte[4]
+    padding: Skip[2]
+    len_name: U8
+    name: String[Var("len_name"), "utf-8"]
+    tail: U8
+
+
+@section
+class Pair:
+    first: Entry
+    second: U8
+
+
+@stream
+class Entries:
+    header: Byte[8]
+    entries: RepeatEOS[Entry]
+
+
+@section
+class Footer:
+    value: U32
+    magic: Contents[b"END"]
+
+    def __duckparse_first__(self, reader: Reader):
+        reader.seek(-7, 2)
+
+
+def test_static_prefix():
+    result = layout(Entry)
+    assert result.fields[:4] == (
+        FieldLayout(name="magic", size=2, offset=0),
+        FieldLayout(name="flags", size=2, offset=2),
+        FieldLayout(name="compression_method", size=2, offset=4),
+        FieldLayout(name="crc32", size=4, offset=6),
+    )
+    assert result["reserved"] == FieldLayout("reserved", 4, 14)
+    assert result["padding"] == FieldLayout("padding", 2, 18)
+    assert result["len_name"].offset == 20
+    assert result["name"] == FieldLayout("name", None, 21)
+    assert result["tail"] == FieldLayout("tail", 1, None)
+    assert result.first_dynamic == "name"
+    assert result.size is None
+    assert not result["name"].is_static
+
+
+def test_nested_and_repeat():
+    assert layout(Pair).first_dynamic == "first"
+    assert layout(Entries)["entries"].size is None
+    assert layout(Entries)["entries"].offset == 8
+
+
+def test_hooks_have_no_static_offsets():
+    result = layout(Footer)
+    assert result.fields == (
+        FieldLayout("value", 4, None),
+        FieldLayout("magic", 3, None),
+    )
+    assert result.size is None
+    assert result.first_dynamic is None
+
+
+def test_not_a_section():
+    with pytest.raises(TypeError):
+        layout(int)
@@ -0,0 +1,65 @@
+from io import BytesIO
+
+from duckparse import section
+from duckparse.reader import Reader, BufferReader
+from duckparse.btypes import U8, U16, Byte, String, Var
+
+
+@section
+class Header:
+    len_name: U8
+    len_body: U16
+
+
+@section(lazy=True)
+class Entry:
+    header: Header
+    name: String[Var("header.len_name"), "utf-8"]
+    body: Byte[Var("header.len_body")]
+    trailer: Header
+    tail: String[-1, "ascii"]
+    end: U8
+
+
+DATA = b"\x03\x05\x00abcHELLO\x01\x02\x00xyz\x00\xff"
+
+
+class CountingReader(Reader):
+    reads = 0
+
+    def read_bytes(self, *args, **kwargs):
+        self.reads += 1
+        return super().read_bytes(*args, **kwargs)
+
+
+def test_lazy_fields_are_skipped():
+    reader = CountingReader(BytesIO(DATA))
+    entry = Entry(reader)
+
+    assert entry.end == 0xFF
+    assert "body" not in entry.__dict__
+    assert "trailer" not in entry.__dict__
+    reads = reader.reads
+
+    assert bytes(entry.body) == b"HELLO"
+    assert reader.reads == reads + 1
+    # the value is cached
+    assert bytes(entry.body) == b"HELLO"
+    assert reader.reads == reads + 1
+
+
+def test_lazy_fields_keep_the_reader_position():
+    reader = BufferReader(DATA + b"\x07")
+    entry = Entry(reader)
+
+    assert entry.name == "abc"
+    assert entry.tail == "xyz"
+    assert entry.trailer.len_body == 2
+    assert reader.read_bytes(1) == b"\x07"
+
+
+def test_lazy_repr():
+    entry = Entry(BufferReader(DATA))
+    assert repr(entry).startswith(
+        "Entry(header=Header(len_name=3, len_body=5), name='abc'"
+    )
@@ -0,0 +1,113 @@
+import pickle
+from operator import attrgetter
+
+from duckparse import parallel, section, stream
+from duckparse.parallel import parse_at, parse_chunked
+from duckparse.reader import BufferReader
+from duckparse.btypes import U8, Byte, Contents, RepeatEOS, Var
+
+
+@section
+class Record:
+    size: U8
+    name: Byte[Var("size")]
+
+
+@section(lazy=True, slots=True)
+class LazyRecord:
+    size: U8
+    name: Byte[Var("size")]
+
+
+NAMES = [b"a", b"bc", b"", b"def"] * 10
+
+
+def write(tmp_path):
+    path = tmp_path / "records.bin"
+    offsets, data = [], b""
+    for name in NAMES:
+        offsets.append(len(data))
+        data += bytes((len(name),)) + name + b"\xff"
+    path.write_bytes(data)
+    return path, offsets
+
+
+def test_pickle_without_reader():
+    for cls in (Record, LazyRecord):
+        record = pickle.loads(pickle.dumps(cls(BufferReader(b"\x02ab"))))
+        assert not hasattr(record, "reader")
+        assert record.name == b"ab"
+
+
+def test_parse_at(tmp_path):
+    path, offsets = write(tmp_path)
+    records = parse_at(
+        Record, path, offsets[::-1], workers=2, chunksize=3
+    )
+
+    assert [record.name for record in records] == NAMES[::-1]
+    assert all(isinstance(record.name, bytes) for record in records)
+
+
+def test_parse_at_in_process(tmp_path, monkeypatch):
+    path, offsets = write(tmp_path)
+    readers = []
+    opened = BufferReader.from_path.__func__
+
+    def from_path(cls, path):
+        readers.append(opened(cls, path))
+        return readers[-1]
+
+    monkeypatch.setattr(BufferReader, "from_path", classmethod(from_path))
+    records = parse_at(Record, path, offsets, workers=1)
+
+    # the same as from the workers, without the reader and its map
+    assert [record.name for record in records] == NAMES
+    assert all(isinstance(record.name, bytes) for record in records)
+    assert not any(hasattr(record, "reader") for record in records)
+    # so nothing is left which keeps the file mapped
+    assert readers[0].io.closed
+
+
+def test_parse_at_transform(tmp_path):
+    path, offsets = write(tmp_path)
+    transform = attrgetter("size")
+
+    assert parse_at(Record, path, offsets, 2, transform=transform) == [
+        len(name) for name in NAMES
+    ]
+    assert parse_at(Record, path, offsets, 1, transform=transform) == [
+        len(name) for name in NAMES
+    ]
+    # the in-process parse does not keep a mapping around
+    assert parallel._reader is None
+
+
+@section
+class Packet:
+    magic: Contents[b"PK"]
+    size: U8
+    body: Byte[Var("size")]
+
+
+@stream
+class Capture:
+    packets: RepeatEOS[Packet]
+
+
+def test_parse_chunked(tmp_path):
+    # bodies full of false markers, some of them valid looking packets
+    bodies = [b"", b"PK", b"PK\x01PK", b"xPK\x00", b"PK\x05", b"abc"] * 8
+    data = b"".join(b"PK" + bytes((len(body),)) + body for body in bodies)
+    path = tmp_path / "capture.bin"
+    path.write_bytes(data)
+    expected = [packet.body for packet in Capture(data).packets]
+
+    for workers, chunk_size in ((1, None), (2, 1), (2, 3), (3, 7)):
+        packets = parse_chunked(
+            Packet, path, b"PK", workers, chunk_size=chunk_size
+        )
+        assert [packet.body for packet in packets] == expected
+        # whichever process parsed them
+        assert all(isinstance(packet.body, bytes) for packet in packets)
+    assert parallel._reader is None
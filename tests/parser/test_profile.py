@@ -0,0 +1,68 @@
+import pstats
+import struct
+from io import BytesIO, StringIO
+
+import pytest
+
+from duckparse import profile, section, stream
+from duckparse.btypes import U8, U16, Byte, RepeatN, Var
+
+DATA = b"\x02" + b"\x03\x00abc" + b"\x01\x00z" + b"\x07\x08"
+
+
+@section
+class Name:
+    size: U16
+    text: Byte[Var("size")]
+
+
+@section(as_tuple=True)
+class Point:
+    x: U8
+    y: U8
+
+
+@stream
+class Names:
+    count: U8
+    names: RepeatN[Name, "range(self.count)"]
+    point: Point
+
+
+def test_profile_counts_fields():
+    result = profile(Names, BytesIO(DATA))
+    fields = {key[2]: stats for key, stats in result.fields.items()}
+
+    assert fields["Names"].size == len(DATA)
+    assert fields["Name"].calls == 2
+    assert fields["Name.size"].size == 4
+    assert fields["Name.text"].size == 4
+    assert fields["Point"].calls == 1
+    assert fields["Point.x,y"].size == 2
+    assert fields["Names.names"].cumtime >= fields["Name"].cumtime
+    assert repr(result.result) == repr(Names(BytesIO(DATA)))
+
+
+def test_profile_restores_constructors():
+    init, new = Name.__init__, Point.__new__
+    profile(Names, BytesIO(DATA))
+    with pytest.raises(struct.error):
+        profile(Names, BytesIO(DATA[:4]))
+
+    assert Name.__init__ is init and Point.__new__ is new
+
+
+def test_profile_exports():
+    result = profile(Names, BytesIO(DATA))
+    stats = pstats.Stats(result)
+
+    assert stats.total_calls == sum(
+        field.calls for field in result.fields.values()
+    )
+    assert "Names;Names.names;Name;Name.text " in result.collapsed()
+
+    report = StringIO()
+    result.print_report(sort="size", limit=1, file=report)
+    assert report.getvalue().splitlines()[1].endswith("Names")
+    with pytest.raises(ValueError):
+        result.print_report(sort="name")
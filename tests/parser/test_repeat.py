@@ -0,0 +1,119 @@
+from array import array
+
+import pytest
+
+from duckparse import stream, section, utils
+from duckparse.reader import BufferReader
+from duckparse.btypes import U8, I16, U32, F32, RepeatN
+
+
+@stream
+class Table:
+    count: U8
+    values: RepeatN[I16, "range(self.count)"]
+    floats: RepeatN[F32, "range(2)"]
+    tail: U32
+
+
+DATA = b"\x03\x01\x00\xff\xff\x00\x80\x00\x00\x80\x3f\x00\x00\x00\xc0\x78\x56\x34\x12"
+
+
+def check(result):
+    assert list(result.values) == [1, -1, -0x8000]
+    assert list(result.floats) == [1.0, -2.0]
+    assert result.tail == 0x12345678
+
+
+def test_repeat_packed_numpy():
+    numpy = pytest.importorskip("numpy")
+    result = Table(DATA)
+    assert isinstance(result.values, numpy.ndarray)
+    assert result.values.dtype == numpy.dtype("<i2")
+    check(result)
+
+
+def test_repeat_packed_array(monkeypatch):
+    monkeypatch.setattr(utils, "numpy", None)
+    result = Table(DATA)
+    assert isinstance(result.values, array)
+    check(result)
+
+
+def test_repeat_packed_big_endian(monkeypatch):
+    monkeypatch.setattr(utils, "numpy", None)
+    result = Table(
+        BufferReader(
+            b"\x01\x00\x01\x3f\x80\x00\x00\xc0\x00\x00\x00\x12\x34\x56\x78",
+            endianness="big",
+        )
+    )
+    assert list(result.values) == [1]
+    assert list(result.floats) == [1.0, -2.0]
+    assert result.tail == 0x12345678
+
+
+def test_repeat_packed_short_read(monkeypatch):
+    monkeypatch.setattr(utils, "numpy", None)
+    with pytest.raises(ValueError):
+        Table(b"\x03\x01\x00")
+
+
+@section
+class Descriptor:
+    crc32: U32
+    len_compressed: U32
+    len_uncompressed: U32
+
+
+@stream
+class Descriptors:
+    count: U8
+    records: RepeatN[Descriptor, "range(self.count)"]
+    tail: U8
+
+
+RECORDS = b"\x02" + bytes(range(24)) + b"\xff"
+
+
+def test_repeat_records_numpy():
+    numpy = pytest.importorskip("numpy")
+    result = Descriptors(RECORDS)
+    assert isinstance(result.records, numpy.recarray)
+    assert list(result.records.crc32) == [0x03020100, 0x0F0E0D0C]
+    assert result.records[1].len_uncompressed == 0x17161514
+    assert result.tail == 0xFF
+
+
+def test_repeat_records_fallback(monkeypatch):
+    monkeypatch.setattr(utils, "numpy", None)
+    result = Descriptors(RECORDS)
+    assert isinstance(result.records[0], Descriptor)
+    assert [record.crc32 for record in result.records] == [
+        0x03020100,
+        0x0F0E0D0C,
+    ]
+    assert result.records[1].len_uncompressed == 0x17161514
+    assert result.tail == 0xFF
+
+
+@section
+class Span:
+    start: U32
+    end: U32
+
+    @property
+    def length(self):
+        return self.end - self.start
+
+
+@stream
+class Spans:
+    count: U8
+    spans: RepeatN[Span, "range(self.count)"]
+
+
+def test_repeat_records_keeps_members():
+    # a record array would not have `length`
+    result = Spans(b"\x02" + bytes(range(16)))
+    assert all(isinstance(span, Span) for span in result.spans)
+    assert result.spans[1].length == 0x04040404
@@ -0,0 +1,52 @@
+from io import BytesIO
+
+import pytest
+
+from duckparse import stream, section
+from duckparse.utils import Span
+from duckparse.btypes import U8, U16, Bits, Byte, Array, String, Skip, Var
+
+
+@section
+class Fixed:
+    a: U16
+    b: U16
+
+
+@stream
+class Skipping:
+    size: U8
+    padding: Skip[2]
+    body: Skip[Byte[Var("size")]]
+    name: Skip[String[-1, "ascii"]]
+    table: Skip[Array[Var("size")]]
+    fixed: Skip[Fixed]
+    number: Skip[U16]
+    tail: U8
+
+
+class NoReadIO(BytesIO):
+    def read(self, size=-1):
+        assert size < 3, "skipped data should not be read"
+        return super().read(size)
+
+
+def test_skip():
+    result = Skipping(
+        NoReadIO(b"\x03\x00\x00abcab\x00xyz\x01\x02\x03\x04\x05\x06\xff")
+    )
+    assert result.padding == Span(offset=1, size=2)
+    assert result.body == Span(offset=3, size=3)
+    assert result.name == Span(offset=6, size=3)
+    assert result.table == Span(offset=9, size=3)
+    assert result.fixed == Span(offset=12, size=4)
+    assert result.number == Span(offset=16, size=2)
+    assert result.tail == 0xFF
+
+
+def test_unskippable():
+    with pytest.raises(ValueError):
+
+        @section
+        class Unskippable:
+            value: Skip[Bits[3]]
@@ -0,0 +1,67 @@
+import pickle
+
+import pytest
+
+from duckparse import section
+from duckparse.compile import export
+from duckparse.reader import BufferReader
+from duckparse.btypes import U8, U16, Byte, RepeatN, Var
+
+
+@section(slots=True)
+class Point:
+    x: U8
+    y: U16
+
+
+@section(slots=True)
+class Record:
+    count: U8
+    points: RepeatN[Point, "range(self.count)"]
+    name: Byte[2]
+
+
+@section(lazy=True, slots=True)
+class LazyRecord:
+    size: U8
+    body: Byte[Var("size")]
+    end: U8
+
+
+def test_slots():
+    record = Record(BufferReader(b"\x02\x01\x02\x00\x03\x04\x00ab"))
+
+    assert Record.__slots__ == ("count", "points", "name")
+    assert not hasattr(record, "__dict__")
+    assert not hasattr(record, "reader")
+    assert [(p.x, p.y) for p in record.points] == [(1, 2), (3, 4)]
+    assert bytes(record.name) == b"ab"
+    with pytest.raises(AttributeError):
+        record.other = 1
+
+
+def test_slots_pickle():
+    point = pickle.loads(
+        pickle.dumps(Point(BufferReader(b"\x01\x02\x00")))
+    )
+    assert (point.x, point.y) == (1, 2)
+    assert repr(point) == "Point(x=1, y=2)"
+
+
+def test_slots_lazy():
+    reader = BufferReader(b"\x03abc\xff")
+    record = LazyRecord(reader)
+
+    assert "body" not in LazyRecord.__slots__
+    assert record.end == 0xFF
+    assert bytes(record.body) == b"abc"
+    assert record.__dict__.keys() == {"body"}
+
+
+def test_slots_export():
+    namespace: dict = {}
+    exec(export(Point), namespace)
+    point = namespace["Point"](BufferReader(b"\x01\x02\x00"))
+
+    assert namespace["Point"].__slots__ == ("x", "y")
+    assert (point.x, point.y) == (1, 2)
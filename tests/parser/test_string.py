@@ -0,0 +1,50 @@
+from io import BytesIO
+
+import pytest
+
+from duckparse import stream
+from duckparse.btypes import U8, String, RepeatN
+from duckparse.reader import Reader, BufferReader
+
+
+@stream
+class Symbols:
+    count: U8
+    names: RepeatN[String[-1, "ascii"], "range(self.count)"]
+    wide: String[-1, "utf-16-le"]
+    wider: String[-1, "utf-32-le"]
+
+
+DATA = (
+    b"\x03main\x00\x00printf\x00"
+    # "aĀ", the zero bytes at 1..2 are not a code unit
+    + "aĀ".encode("utf-16-le")
+    + b"\x00\x00"
+    + "Ā".encode("utf-32-le")
+    + b"\x00" * 4
+)
+
+
+@pytest.mark.parametrize(
+    "reader",
+    [
+        lambda: Reader(BytesIO(DATA), buffer_size=2),
+        lambda: Reader(BytesIO(DATA)),
+        lambda: BufferReader(memoryview(DATA)),
+    ],
+)
+def test_string_zero_terminated(reader):
+    reader = reader()
+    symbols = Symbols(reader)
+
+    assert symbols.names == ["main", "", "printf"]
+    assert symbols.wide == "aĀ"
+    assert symbols.wider == "Ā"
+    assert reader.at_eof()
+
+
+def test_string_unterminated():
+    with pytest.raises(EOFError):
+        Reader(BytesIO(b"abc")).read_until(b"\x00")
+    with pytest.raises(EOFError):
+        BufferReader(b"abc").read_until(b"\x00")
@@ -0,0 +1,99 @@
+import pytest
+
+from duckparse import datakind, section
+from duckparse.analysis import static_size
+from duckparse.compile import export
+from duckparse.reader import BufferReader, Reader
+from duckparse.btypes import U8, U16, Byte, RepeatN, Switch, Var
+
+
+@section
+class Point:
+    x: U8
+    y: U8
+
+
+@section
+class Name:
+    size: U8
+    name: Byte[Var("size")]
+
+
+@section
+class Record:
+    tag: U8
+    size: U8
+    body: Switch[
+        Var("tag"),
+        {1: Point, 2: Name, 3: U16, 4: Byte[Var("size")]},
+        Byte[1],
+    ]
+
+
+@section
+class Strict:
+    tag: U8
+    body: Switch["self.tag & 0x0F", {1: U8, 2: U16}]
+
+
+@section
+class Records:
+    count: U8
+    records: RepeatN[Record, "range(self.count)"]
+
+
+@datakind
+class Lookup:
+    def __processor__(self, reader: Reader, params) -> str:
+        (table,) = params
+        return table[reader.read_bytes(1)[0]]
+
+
+@section
+class Looked:
+    value: Lookup[["zero", "one"]]
+
+
+def test_switch():
+    records = Records(
+        BufferReader(
+            b"\x05"
+            b"\x01\x00\x07\x08"
+            b"\x02\x00\x02hi"
+            b"\x03\x00\x34\x12"
+            b"\x04\x03abc"
+            b"\x09\x00z"
+        )
+    )
+    point, name, number, data, other = (
+        record.body for record in records.records
+    )
+
+    assert (point.x, point.y) == (7, 8)
+    assert bytes(name.name) == b"hi"
+    assert number == 0x1234
+    assert bytes(data) == b"abc"
+    assert bytes(other) == b"z"
+
+
+def test_switch_expression():
+    assert Strict(BufferReader(b"\x12\x34\x12")).body == 0x1234
+    with pytest.raises(KeyError):
+        Strict(BufferReader(b"\x03\x00"))
+
+
+def test_switch_static_size():
+    assert static_size(Switch[Var("tag"), {1: U16, 2: Point}]) == 2
+    assert static_size(Switch[Var("tag"), {1: U16, 2: U8}]) is None
+
+
+def test_switch_export():
+    namespace: dict = {}
+    exec(export(Record), namespace)
+    record = namespace["Record"](BufferReader(b"\x02\x00\x02hi"))
+
+    assert bytes(record.body.name) == b"hi"
+
+
+def test_object_params():
+    assert Looked(BufferReader(b"\x01")).value == "one"
@@ -0,0 +1,90 @@
+import pickle
+
+import pytest
+
+from duckparse import section
+from duckparse.compile import export
+from duckparse.reader import BufferReader
+from duckparse.btypes import U8, U16, U32, Byte, Contents
+
+DATA = b"\x01\x02\x00\x03\x00\x00\x00"
+
+
+@section(as_tuple=True)
+class Descriptor:
+    flags: U8
+    method: U16
+    crc32: U32
+
+
+@section(as_tuple=True)
+class Magic:
+    magic: Contents[b"PK"]
+    version: U8
+
+
+@section(as_tuple=True)
+class Empty:
+    pass
+
+
+def test_tuple():
+    reader = BufferReader(DATA + b"\xff")
+    descriptor = Descriptor(reader)
+
+    assert isinstance(descriptor, tuple)
+    assert descriptor == (1, 2, 3)
+    assert (descriptor.flags, descriptor.method, descriptor.crc32) == (
+        1,
+        2,
+        3,
+    )
+    assert Descriptor._fields == ("flags", "method", "crc32")
+    assert repr(descriptor) == "Descriptor(flags=1, method=2, crc32=3)"
+    assert reader.tell() == 7
+    assert not hasattr(descriptor, "__dict__")
+    with pytest.raises(AttributeError):
+        descriptor.flags = 2
+
+
+def test_tuple_converters():
+    assert Magic(BufferReader(b"PK\x07")) == (b"PK", 7)
+    assert Empty(BufferReader(b"")) == ()
+
+
+def test_tuple_pickle():
+    descriptor = pickle.loads(
+        pickle.dumps(Descriptor(BufferReader(DATA)))
+    )
+    assert type(descriptor) is Descriptor
+    assert descriptor.crc32 == 3
+
+
+def test_tuple_export():
+    namespace: dict = {}
+    exec(export(Descriptor), namespace)
+    descriptor = namespace["Descriptor"](BufferReader(DATA))
+
+    assert isinstance(descriptor, tuple)
+    assert descriptor.method == 2
+
+
+def test_tuple_needs_fixed_size():
+    with pytest.raises(ValueError):
+
+        @section(as_tuple=True)
+        class Named:
+            size: U8
+            name: Byte[3]
+
+
+@section
+class Entry:
+    descriptor: Descriptor
+    end: U8
+
+
+def test_tuple_field():
+    entry = Entry(BufferReader(DATA + b"\xff"))
+    assert entry.descriptor == (1, 2, 3)
+    assert entry.end == 0xFF
@@ -0,0 +1,100 @@
+import asyncio
+from struct import error as StructError
+
+import pytest
+
+from duckparse import stream, section
+from duckparse.aio import AsyncReader
+from duckparse.btypes import U8, U16, Byte, String, RepeatEOS, Var
+
+
+@section
+class Message:
+    kind: U8
+    size: U16
+    body: Byte[Var("size")]
+    name: String[-1, "ascii"]
+
+
+@stream
+class Capture:
+    messages: RepeatEOS[Message]
+
+
+MESSAGES = [
+    b"\x01\x03\x00abcfirst\x00",
+    b"\x02\x00\x00\x00",
+    b"\x03\x01\x00zlast\x00",
+]
+DATA = b"".join(MESSAGES)
+
+
+def run(coroutine_function, data, step):
+    # the data trickles in `step` bytes at a time
+    async def main():
+        connection = asyncio.StreamReader()
+
+        async def send():
+            for start in range(0, len(data), step):
+                connection.feed_data(data[start : start + step])
+                await asyncio.sleep(0)
+            connection.feed_eof()
+
+        sender = asyncio.create_task(send())
+        result = await coroutine_function(connection)
+        await sender
+        return result
+
+    return asyncio.run(main())
+
+
+@pytest.mark.parametrize("step", [1, 2, 5, len(DATA)])
+def test_parse_async_stream(step):
+    capture = run(Capture.parse_async, DATA, step)
+
+    assert [bytes(message.body) for message in capture.messages] == [
+        b"abc",
+        b"",
+        b"z",
+    ]
+    assert [message.name for message in capture.messages] == [
+        "first",
+        "",
+        "last",
+    ]
+
+
+def test_parse_async_stream_retries():
+    # a `RepeatEOS` can only finish at the end, so it is not parsed
+    # again for every one of the many chunks before it
+    parses = []
+
+    def capture(reader):
+        parses.append(reader.offset)
+        return Capture(reader)
+
+    async def parse(connection):
+        return await AsyncReader(connection).parse(capture)
+
+    data = DATA * 100
+    assert len(run(parse, data, 7).messages) == 300
+    assert len(parses) <= 2
+
+
+@pytest.mark.parametrize("step", [1, 3, len(DATA)])
+def test_parse_async_messages(step):
+    async def parse(connection):
+        reader = AsyncReader(connection)
+        first = await Message.parse_async(reader)
+        rest = [message async for message in reader.iterate(Message)]
+        return [first, *rest]
+
+    messages = run(parse, DATA, step)
+    assert [message.kind for message in messages] == [1, 2, 3]
+
+
+def test_parse_async_truncated():
+    with pytest.raises(EOFError):
+        run(Message.parse_async, MESSAGES[0][:-3], 2)
+    with pytest.raises(StructError):
+        run(Message.parse_async, b"\x01\x03", 1)
@@ -1,4 +1,7 @@
 from io import BytesIO
+
+import pytest
+
 from duckparse.reader import Reader
 
 
@@ -68,3 +71,24 @@ def test_read_bits_le_startw8single():
         assert data.read_bits_int_le(bit_count) == result
         assert bit_needle == data._Reader__bit_needle
         assert byte_needle == data._Reader__current_byte
+
+
+def test_read_bits_le_past_the_end():
+    data = Reader(BytesIO(b"\xff"))
+    assert data.read_bits_int_le(4) == 0xF
+    with pytest.raises(EOFError):
+        data.read_bits_int_le(8)
+
+
+def test_read_bits_be():
+    data = Reader(BytesIO(b"\xa5\x0f\xff\x80"))
+
+    results = ((4, 0xA, 1), (4, 0x5, 1), (12, 0x0FF, 3), (1, 1, 3))
+
+    for bit_count, result, offset in results:
+        assert data.read_bits_int_be(bit_count) == result
+        assert data.offset == offset
+
+    assert data.read_bits_int_be(10) == 0x3C0
+    with pytest.raises(EOFError):
+        data.read_bits_int_be(2)
@@ -0,0 +1,113 @@
+import importlib.util
+from os import SEEK_CUR, SEEK_END
+from pathlib import Path
+
+import pytest
+
+from duckparse import stream
+from duckparse.btypes import U8, U16, Byte, Bits, Var
+from duckparse.reader import BufferReader
+from duckparse.c_types import compile_struct
+
+
+def test_buffer_read_bytes_is_a_view():
+    data = bytearray(b"\xf7\x30\x8a\xea")
+    reader = BufferReader(data)
+
+    content = reader.read_bytes(2)
+    assert isinstance(content, memoryview)
+    assert content == b"\xf7\x30"
+
+    data[1] = 0x31
+    assert content == b"\xf7\x31"
+    assert reader.tell() == 2
+
+
+def test_buffer_read_hybrid():
+    data = BufferReader(b"\xf7\x30\x8a\xea")
+
+    assert b"\xf7" == data.read_bytes(1)
+    assert 0b110000 == data.read_bits_int_le(6)
+    assert 0b00 == data.read_bits_int_le(2)
+    assert 0b10 == data.read_bits_int_le(2)
+    assert 2 == data._Reader__bit_needle
+    assert b"\xea" == data.read_bytes(1)
+    assert 8 == data._Reader__bit_needle
+    assert 3 == data._Reader__current_byte
+
+
+def test_buffer_read_struct_and_seek():
+    data = BufferReader(memoryview(b"\x01\x02\x03\x04\x05\x06"))
+
+    assert data.read_struct(compile_struct("BH")) == (1, 0x0302)
+    assert data.seek(-2, SEEK_END) == 4
+    assert data.read_struct(compile_struct("H")) == (0x0605,)
+    assert data.seek(-5, SEEK_CUR) == 1
+    assert data.read_bytes(1) == b"\x02"
+
+
+@stream
+class Sample:
+    size: U8
+    flag: Bits[4]
+    body: Byte[Var("size")]
+    tail: U16
+
+
+def test_stream_from_bytes():
+    result = Sample(b"\x03\x0a\x61\x62\x63\x34\x12")
+    assert result.flag == 0xA
+    assert bytes(result.body) == b"abc"
+    assert result.tail == 0x1234
+
+
+def test_stream_from_path(tmp_path):
+    path = tmp_path / "sample.bin"
+    path.write_bytes(b"\x01\x00\x61\x34\x12")
+
+    result = Sample(BufferReader.from_path(path))
+    assert bytes(result.body) == b"a"
+    assert result.tail == 0x1234
+
+
+def test_close_from_path(tmp_path):
+    path = tmp_path / "sample.bin"
+    path.write_bytes(b"\x01\x00\x61\x34\x12")
+
+    reader = BufferReader.from_path(path)
+    body = Sample(reader).body
+    # the slice keeps the file mapped
+    reader.close()
+    assert bytes(body) == b"a"
+
+    reader = BufferReader.from_path(path)
+    assert Sample(reader).tail == 0x1234
+    reader.close()
+    assert reader.io.closed
+
+
+def load_gallery(name):
+    path = Path(__file__).parents[2] / "gallery" / name / f"{name}.py"
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module, path.parent
+
+
+def test_hook_seeks_mapping():
+    # the footer hook seeks `reader.io`, the mapping of `from_path`
+    tga, directory = load_gallery("tga")
+    reader = BufferReader.from_path(directory / "earth.tga")
+    image = tga.TGA(reader)
+    reader.close()
+
+    assert (image.width, image.height) == (512, 512)
+    assert image.footer.version_magic == b"TRUEVISION-XFILE.\x00"
+
+
+def test_hook_seeks_bytes():
+    tga, directory = load_gallery("tga")
+    data = (directory / "earth.tga").read_bytes()
+
+    with pytest.raises(TypeError, match="reader.seek"):
+        tga.TGA(data)
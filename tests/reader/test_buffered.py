@@ -0,0 +1,203 @@
+from io import RawIOBase, BytesIO, UnsupportedOperation
+from os import SEEK_CUR, SEEK_END
+
+from duckparse import stream
+from duckparse.btypes import U8, U16, String, RepeatEOS, Skip, Var
+from duckparse.reader import Reader
+
+
+class TrickleIO(RawIOBase):
+    """A raw stream which returns at most `step` bytes per read."""
+
+    def __init__(self, data, step=3, seekable=True):
+        self.data = BytesIO(data)
+        self.step = step
+        self._seekable = seekable
+        self.reads = 0
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return self._seekable
+
+    def readinto(self, buffer):
+        self.reads += 1
+        chunk = self.data.read(min(len(buffer), self.step))
+        buffer[: len(chunk)] = chunk
+        return len(chunk)
+
+    def seek(self, offset, whence=0):
+        if not self._seekable:
+            raise UnsupportedOperation("not seekable")
+        return self.data.seek(offset, whence)
+
+    def tell(self):
+        return self.data.tell()
+
+
+def test_buffered_reads_in_chunks():
+    io = TrickleIO(bytes(range(100)), step=100)
+    reader = Reader(io)
+
+    assert [reader.read_bytes(1)[0] for _ in range(100)] == list(
+        range(100)
+    )
+    assert io.reads == 1
+    assert reader.at_eof()
+
+
+def test_buffered_short_reads():
+    reader = Reader(TrickleIO(b"\x01\x02\x03\x04\x05\x06\x07", step=2))
+
+    assert reader.read_bytes(5) == b"\x01\x02\x03\x04\x05"
+    assert reader.read_bytes(2) == b"\x06\x07"
+
+
+def test_buffered_seek():
+    io = TrickleIO(bytes(range(16)), step=16)
+    reader = Reader(io, buffer_size=8)
+
+    assert reader.read_bytes(4) == b"\x00\x01\x02\x03"
+    # inside the buffer
+    assert reader.seek(1) == 1
+    assert reader.read_bytes(2) == b"\x01\x02"
+    assert io.reads == 1
+    # past it
+    assert reader.seek(-2, SEEK_END) == 14
+    assert reader.read_bytes(2) == b"\x0e\x0f"
+    assert reader.tell() == 16
+
+
+@stream
+class Names:
+    count: U16
+    names: RepeatEOS[String[-1, "ascii"]]
+
+
+def test_buffered_unknown_size():
+    data = b"\x02\x00ab\x00cd\x00"
+    reader = Reader(TrickleIO(data, step=1, seekable=False))
+
+    assert reader.size is None
+    names = Names(reader)
+    assert names.count == 2
+    assert names.names == ["ab", "cd"]
+    assert reader.tell() == len(data)
+
+
+@stream
+class Trailer:
+    def __duckparse_first__(self, reader):
+        reader.seek(-1, SEEK_END)
+
+    last: U8
+
+
+def test_buffered_hook_seek():
+    reader = Reader(TrickleIO(b"\x01\x02\x03", step=3))
+    reader.read_bytes(1)
+
+    assert Trailer(reader).last == 3
+
+
+@stream
+class OldTrailer:
+    # the hook seeks `io` itself, as hooks did before the reader buffered
+    def __duckparse_first__(self, reader):
+        reader.io.seek(-1, SEEK_END)
+
+    last: U8
+
+
+def test_buffered_hook_seeks_io():
+    reader = Reader(TrickleIO(bytes(range(200)), step=200))
+    reader.read_bytes(1)
+
+    assert OldTrailer(reader).last == 199
+    assert reader.tell() == 200
+
+
+@stream
+class Jump:
+    def __duckparse_first__(self, reader):
+        reader.io.seek(4)
+
+    x: U8
+
+
+@stream
+class Hop:
+    def __duckparse_first__(self, reader):
+        reader.io.seek(2, SEEK_CUR)
+
+    x: U8
+
+
+def test_buffered_hook_seeks_io_to_buffer_end():
+    reader = Reader(BytesIO(bytes(range(8))), buffer_size=4)
+    reader.read_bytes(1)
+
+    assert Jump(reader).x == 4
+
+
+def test_buffered_hook_finds_io_at_reader():
+    reader = Reader(BytesIO(bytes(range(8))), buffer_size=4)
+    reader.read_bytes(1)
+
+    assert Hop(reader).x == 3
+
+
+@stream
+class Header:
+    a: U8
+    b: U16
+
+
+def test_buffered_leaves_file_after_stream():
+    file = BytesIO(b"\x01\x02\x00REST-OF-FILE")
+    header = Header(file)
+
+    assert (header.a, header.b) == (1, 2)
+    assert file.tell() == 3
+    assert file.read() == b"REST-OF-FILE"
+
+
+class Custom:
+    """Only what a stream needed before the reader buffered."""
+
+    def __init__(self, data):
+        self.data = BytesIO(data)
+
+    def read(self, size=-1):
+        return self.data.read(size)
+
+    def seek(self, offset, whence=0):
+        return self.data.seek(offset, whence)
+
+    def tell(self):
+        return self.data.tell()
+
+
+def test_buffered_custom_stream():
+    reader = Reader(Custom(b"\x02\x00ab\x00cd\x00"))
+
+    assert reader.size == 8
+    assert Names(reader).names == ["ab", "cd"]
+
+
+@stream
+class Skipped:
+    size: U8
+    padding: Skip[Var("size")]
+    last: U8
+
+
+def test_buffered_skip_unseekable():
+    data = b"\xff" + bytes(255) + b"\x07"
+    reader = Reader(
+        TrickleIO(data, step=5, seekable=False), buffer_size=16
+    )
+
+    assert Skipped(reader).last == 7
+    assert reader.tell() == len(data)
@@ -7,3 +7,22 @@ def test_read_byte():
 
     assert b"\xf7" == data.read_bytes(1)
     assert b"\x30\x8a" == data.read_bytes(2)
+
+
+def test_read_byte_position():
+    io = BytesIO(b"\xf7\x30\x8a")
+    io.seek(1)
+    data = Reader(io)
+
+    assert data.tell() == 1
+    assert data.remaining == 2
+    data.read_bytes(2)
+    assert data.tell() == 3
+    assert data.at_eof()
+
+
+def test_read_byte_allign():
+    data = Reader(BytesIO(b"\xf7\x30\x8a"))
+
+    assert b"\xf7\x30" == data.read_bytes(2, allign=False)
+    assert b"\x8a" == data.read_bytes(1, allign=True)
@@ -0,0 +1,81 @@
+from struct import error as StructError
+
+import pytest
+
+from duckparse import section
+from duckparse.incremental import IncrementalParser
+from duckparse.btypes import U8, U16, Byte, String, Var
+
+
+@section
+class Record:
+    # parse attempts, counted by the hook
+    attempts = 0
+
+    def __duckparse_first__(self, reader):
+        Record.attempts += 1
+
+    kind: U8
+    size: U16
+    body: Byte[Var("size")]
+    name: String[-1, "ascii"]
+
+
+RECORDS = [
+    b"\x01\x03\x00abcfirst\x00",
+    b"\x02\x00\x00\x00",
+    b"\x03\x01\x00zlast\x00",
+]
+DATA = b"".join(RECORDS)
+
+
+@pytest.mark.parametrize("step", [1, 2, 5, len(DATA)])
+def test_incremental(step):
+    parser = IncrementalParser(Record)
+    records = []
+    for start in range(0, len(DATA), step):
+        records.extend(parser.feed(DATA[start : start + step]))
+    records.extend(parser.close())
+
+    assert [record.kind for record in records] == [1, 2, 3]
+    assert [bytes(record.body) for record in records] == [
+        b"abc",
+        b"",
+        b"z",
+    ]
+    assert [record.name for record in records] == ["first", "", "last"]
+    assert parser.offset == len(DATA)
+
+
+def test_incremental_keeps_only_the_cut_record():
+    Record.attempts = 0
+    parser = IncrementalParser(Record)
+
+    records = parser.feed(DATA[:-3])
+    assert [record.kind for record in records] == [1, 2]
+    assert len(parser.reader.buffer) == len(RECORDS[2]) - 3
+    assert parser.offset == len(RECORDS[0]) + len(RECORDS[1])
+
+    records = parser.feed(DATA[-3:])
+    assert [record.kind for record in records] == [3]
+    # the completed records are not parsed again
+    assert Record.attempts == 4
+
+
+def test_incremental_waits_for_what_is_missing():
+    Record.attempts = 0
+    parser = IncrementalParser(Record)
+
+    assert parser.feed(b"\x01\xff\x00") == []
+    for _ in range(0xFE):
+        assert parser.feed(b"x") == []
+    assert Record.attempts == 1
+    (record,) = parser.feed(b"x\x00")
+    assert len(record.body) == 0xFF
+
+
+def test_incremental_truncated():
+    parser = IncrementalParser(Record)
+    parser.feed(b"\x01\x03")
+    with pytest.raises(StructError):
+        parser.close()